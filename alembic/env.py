@@ -19,7 +19,12 @@ MYSQL_HOST = os.getenv("MYSQL_HOST")
 MYSQL_PORT = os.getenv("MYSQL_PORT")
 MYSQL_DATABASE = os.getenv("MYSQL_DATABASE")
 
-DATABASE_URL = f"mysql+asyncmy://{MYSQL_USER}:{MYSQL_PASSWORD}@{MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DATABASE}"
+# DATABASE_URL이 지정되어 있으면 우선 사용 (앱 설정과 동일)
+# (마이그레이션은 MySQL 기준이며, SQLite 로컬 DB는 모델 metadata로 스키마 생성)
+DATABASE_URL = (
+    os.getenv("DATABASE_URL")
+    or f"mysql+asyncmy://{MYSQL_USER}:{MYSQL_PASSWORD}@{MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DATABASE}"
+)
 
 config = context.config
 config.set_section_option("alembic", "sqlalchemy.url", DATABASE_URL)
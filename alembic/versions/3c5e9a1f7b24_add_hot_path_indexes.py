@@ -0,0 +1,148 @@
+"""Add composite indexes and unique keys for hot lookup paths
+
+Revision ID: 3c5e9a1f7b24
+Revises: 8f86d7cc0389
+Create Date: 2026-10-17 09:12:40.118302
+
+"""
+
+import logging
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import context, op
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+# revision identifiers, used by Alembic.
+revision: str = "3c5e9a1f7b24"
+down_revision: Union[str, None] = "8f86d7cc0389"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (인덱스 이름, 테이블, 컬럼, unique)
+# unique 키는 native upsert(ON DUPLICATE KEY UPDATE)의 충돌 기준으로 쓰는 것만 둠
+INDEXES = [
+    (
+        "uq_user_answers_answer_sheet_problem",
+        "user_answers",
+        ["answer_sheet_id", "problem_id"],
+        True,
+    ),
+    (
+        "uq_grading_results_answer_sheet_problem",
+        "grading_results",
+        ["answer_sheet_id", "problem_id"],
+        True,
+    ),
+    ("uq_study_logs_user_date", "study_logs", ["user_id", "quiz_date"], True),
+    (
+        "ix_problems_in_quizzes_quiz_number",
+        "problems_in_quizzes",
+        ["quiz_id", "problem_number"],
+        False,
+    ),
+    ("ix_problems_chapter_difficulty", "problems", ["chapter_id", "difficulty"], False),
+    ("ix_answer_sheets_user_status", "answer_sheets", ["user_id", "status"], False),
+    ("ix_quizzes_user_created_at", "quizzes", ["user_id", "created_at"], False),
+]
+
+# 중복 키 보고에 보여 줄 최대 개수
+REPORT_SAMPLE_SIZE = 20
+
+
+def _check_unique(table: str, columns: list[str]) -> None:
+    """
+    unique 키를 만들기 전에 중복 키가 있으면 목록을 보고하고 중단
+    (답안/채점 결과는 어느 행이 맞는지 마이그레이션이 판단할 수 없으므로 지우지 않음)
+    """
+    cols = ", ".join(columns)
+    duplicates = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                f"SELECT {cols}, COUNT(*) AS row_count FROM {table} "
+                f"GROUP BY {cols} HAVING COUNT(*) > 1 "
+                f"ORDER BY {cols} LIMIT {REPORT_SAMPLE_SIZE + 1}"
+            )
+        )
+        .all()
+    )
+    if not duplicates:
+        return
+
+    sample = "\n".join(
+        f"  {dict(zip(columns, row[:-1]))}: {row[-1]} rows"
+        for row in duplicates[:REPORT_SAMPLE_SIZE]
+    )
+    more = " (and more)" if len(duplicates) > REPORT_SAMPLE_SIZE else ""
+    raise RuntimeError(
+        f"{table} has duplicate ({cols}) rows{more}; "
+        f"resolve them before creating a unique key on ({cols}):\n{sample}"
+    )
+
+
+def _merge_study_logs() -> None:
+    """같은 날짜의 학습 기록이 여러 행이면 퀴즈 수를 최신 행으로 합산한 뒤 나머지 삭제"""
+    bind = op.get_bind()
+    bind.execute(
+        sa.text(
+            "UPDATE study_logs newer "
+            "JOIN (SELECT user_id, quiz_date, MAX(id) AS keep_id, "
+            "SUM(quiz_count) AS total FROM study_logs "
+            "GROUP BY user_id, quiz_date HAVING COUNT(*) > 1) dup "
+            "ON newer.id = dup.keep_id "
+            "SET newer.quiz_count = dup.total"
+        )
+    )
+    merged = bind.execute(
+        sa.text(
+            "DELETE older FROM study_logs older "
+            "JOIN study_logs newer ON older.user_id = newer.user_id "
+            "AND older.quiz_date = newer.quiz_date AND older.id < newer.id"
+        )
+    )
+    if merged.rowcount:
+        logger.info(
+            "study_logs: merged %d duplicate rows into the latest row per date",
+            merged.rowcount,
+        )
+
+
+def upgrade() -> None:
+    # 오프라인(--sql) 모드에서는 데이터를 볼 수 없으므로 검사/병합 생략
+    if not context.is_offline_mode():
+        _merge_study_logs()
+        for _, table, columns, unique in INDEXES:
+            if unique and table != "study_logs":
+                _check_unique(table, columns)
+
+    for name, table, columns, unique in INDEXES:
+        op.create_index(name, table, columns, unique=unique)
+
+
+def _needs_fk_index(table: str, column: str, dropping: str) -> bool:
+    """
+    dropping 인덱스를 지우면 column 외래키를 받칠 인덱스가 없어지는지
+    (MySQL은 복합 인덱스가 생기면 자동 생성했던 외래키 인덱스를 지울 수 있음)
+    """
+    inspector = sa.inspect(op.get_bind())
+    if not any(
+        fk["constrained_columns"][:1] == [column]
+        for fk in inspector.get_foreign_keys(table)
+    ):
+        return False
+    return not any(
+        index["name"] != dropping and index["column_names"][:1] == [column]
+        for index in inspector.get_indexes(table)
+    )
+
+
+def downgrade() -> None:
+    for name, table, columns, _ in reversed(INDEXES):
+        # 업그레이드 전에 있던 외래키 인덱스(MySQL 자동 생성, 컬럼명)가
+        # 복합 인덱스로 대체돼 사라졌을 때만 되살린 뒤 삭제
+        if not context.is_offline_mode() and _needs_fk_index(table, columns[0], name):
+            op.create_index(columns[0], table, [columns[0]])
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,30 @@
+"""Add grade_version to answer_sheets
+
+Revision ID: 4b8e2d7f1a65
+Revises: 9a4f1c6e2b57
+Create Date: 2026-10-17 21:05:31.118462
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4b8e2d7f1a65"
+down_revision: Union[str, None] = "9a4f1c6e2b57"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "answer_sheets",
+        sa.Column("grade_version", sa.Integer(), server_default="0", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("answer_sheets", "grade_version")
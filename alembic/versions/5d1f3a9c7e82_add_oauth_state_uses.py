@@ -0,0 +1,36 @@
+"""Add oauth_state_uses table
+
+Revision ID: 5d1f3a9c7e82
+Revises: 4b8e2d7f1a65
+Create Date: 2026-10-18 02:41:09.530126
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d1f3a9c7e82"
+down_revision: Union[str, None] = "4b8e2d7f1a65"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "oauth_state_uses",
+        sa.Column("state", sa.String(length=64), nullable=False),
+        sa.Column("expires_at", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("state"),
+    )
+    op.create_index(
+        "ix_oauth_state_uses_expires_at", "oauth_state_uses", ["expires_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_oauth_state_uses_expires_at", table_name="oauth_state_uses")
+    op.drop_table("oauth_state_uses")
@@ -0,0 +1,66 @@
+"""Add user_chapter_stats rollup table
+
+Revision ID: 7d2b4e8a9c13
+Revises: 3c5e9a1f7b24
+Create Date: 2026-10-17 15:40:02.531876
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7d2b4e8a9c13"
+down_revision: Union[str, None] = "3c5e9a1f7b24"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_chapter_stats",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("chapter_id", sa.Integer(), nullable=False),
+        sa.Column("solved_count", sa.Integer(), nullable=False),
+        sa.Column("correct_count", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("updated_at", sa.TIMESTAMP(), nullable=True),
+        sa.Column("deleted_at", sa.TIMESTAMP(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.ForeignKeyConstraint(["chapter_id"], ["chapters.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "uq_user_chapter_stats_user_chapter",
+        "user_chapter_stats",
+        ["user_id", "chapter_id"],
+        unique=True,
+    )
+
+    # 기존 채점 결과로 롤업 채우기 (python -m app.chapter_stats backfill 과 같은 집계)
+    op.execute(
+        "INSERT INTO user_chapter_stats "
+        "(user_id, chapter_id, solved_count, correct_count) "
+        "SELECT answer_sheets.user_id, problems.chapter_id, "
+        "COUNT(grading_results.id), "
+        "SUM(CASE WHEN grading_results.result = 'correct' THEN 1 ELSE 0 END) "
+        "FROM grading_results "
+        "JOIN answer_sheets ON answer_sheets.id = grading_results.answer_sheet_id "
+        "JOIN problems ON problems.id = grading_results.problem_id "
+        "WHERE answer_sheets.status = 'graded' "
+        "GROUP BY answer_sheets.user_id, problems.chapter_id"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_user_chapter_stats_user_chapter", table_name="user_chapter_stats")
+    op.drop_table("user_chapter_stats")
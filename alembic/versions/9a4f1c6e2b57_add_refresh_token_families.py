@@ -0,0 +1,52 @@
+"""Add refresh_token_families table
+
+Revision ID: 9a4f1c6e2b57
+Revises: 7d2b4e8a9c13
+Create Date: 2026-10-17 18:12:44.204117
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9a4f1c6e2b57"
+down_revision: Union[str, None] = "7d2b4e8a9c13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "refresh_token_families",
+        sa.Column("family_id", sa.String(length=64), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("current_jti", sa.String(length=64), nullable=False),
+        sa.Column("expires_at", sa.BigInteger(), nullable=False),
+        sa.Column("revoked", sa.Boolean(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("updated_at", sa.TIMESTAMP(), nullable=True),
+        sa.Column("deleted_at", sa.TIMESTAMP(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("family_id"),
+    )
+    op.create_index(
+        "ix_refresh_token_families_expires_at",
+        "refresh_token_families",
+        ["expires_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_refresh_token_families_expires_at", table_name="refresh_token_families"
+    )
+    op.drop_table("refresh_token_families")
@@ -1,8 +1,11 @@
 import logging
 
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.database import get_db
+from app.models.user import User
 from app.services.jwt_service import decode_token
 
 security = HTTPBearer()
@@ -18,7 +21,7 @@ async def get_current_user(
     token = credentials.credentials
     try:
         payload = decode_token(token)
-        logger.info(f"Decoded JWT Payload: {payload}")  # ✅ 디코딩된 JWT 정보 로그 추가
+        logger.debug("Decoded JWT Payload: %s", payload)  # ✅ 디코딩된 JWT 정보 로그
         user_id = payload.get("user_id")
 
         if not isinstance(user_id, int):  # ✅ user_id가 정수인지 확인
@@ -26,5 +29,15 @@ async def get_current_user(
 
         return {"user_id": user_id}  # ✅ 항상 딕셔너리를 반환하도록 수정
     except ValueError as e:
-        logger.error(f"JWT Decode Error: {e}")  # ✅ 에러 로그 추가
+        logger.error("JWT Decode Error: %s", e)  # ✅ 에러 로그 추가
         raise HTTPException(status_code=401, detail=str(e))
+
+
+async def get_current_user_entity(
+    request: Request, db: AsyncSession = Depends(get_db)
+) -> User:
+    """
+    User 엔티티 전체가 필요한 라우트용 의존성
+    (auth_middleware가 넣어 둔 Principal을 라우트 세션으로 로드)
+    """
+    return await request.state.user.load(db)
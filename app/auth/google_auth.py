@@ -1,42 +1,85 @@
-import aiohttp
+import jwt
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.auth.jwks import JWKSCache
+from app.auth.principal_cache import invalidate_principal
+from app.auth.token_store import refresh_token_store
 from app.core.config import settings
+from app.core.http_client import get_http_client
 from app.models.user import User
-from app.services.jwt_service import create_access_token, create_refresh_token
+from app.services.jwt_service import create_access_token
 
+GOOGLE_TOKEN_URL = "https://oauth2.googleapis.com/token"
+GOOGLE_USER_INFO_URL = "https://www.googleapis.com/oauth2/v2/userinfo"
+GOOGLE_JWKS_URL = "https://www.googleapis.com/oauth2/v3/certs"
+GOOGLE_ISSUERS = ["https://accounts.google.com", "accounts.google.com"]
 
-async def google_login(code: str, db: AsyncSession):
+# ✅ Google 서명 키 캐시 (Cache-Control을 따르며 백그라운드 갱신)
+google_jwks = JWKSCache(GOOGLE_JWKS_URL)
+
+
+async def verify_google_id_token(id_token: str) -> dict:
     """
-    Google OAuth 인증 후 사용자 정보 반환
+    OIDC id_token을 캐시된 JWKS로 로컬 검증하고 사용자 정보 반환
+    (userinfo API 호출 없이 email/name/sub 추출)
     """
-    try:
-        # 1️⃣ Access Token 요청
-        token_url = "https://oauth2.googleapis.com/token"
-        token_data = {
-            "client_id": settings.GOOGLE_CLIENT_ID,
-            "client_secret": settings.GOOGLE_CLIENT_SECRET,
-            "code": code,
-            "redirect_uri": settings.GOOGLE_REDIRECT_URI,
-            "grant_type": "authorization_code",
-        }
+    header = jwt.get_unverified_header(id_token)
+    signing_key = await google_jwks.get_key(header.get("kid"))
+    claims = jwt.decode(
+        id_token,
+        signing_key.key,
+        algorithms=["RS256"],
+        audience=settings.GOOGLE_CLIENT_ID,
+        issuer=GOOGLE_ISSUERS,
+    )
+    return {
+        "id": claims["sub"],
+        "email": claims.get("email"),
+        "name": claims.get("name"),
+    }
+
+
+async def fetch_google_user(code: str) -> dict:
+    """
+    인가 코드를 토큰으로 교환하고 Google 사용자 정보 반환
+    (공용 HTTP 클라이언트의 keep-alive 커넥션 재사용)
+    """
+    client = get_http_client()
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(token_url, data=token_data) as resp:
-                token_json = await resp.json()
+    # 1️⃣ Access Token 요청
+    token_data = {
+        "client_id": settings.GOOGLE_CLIENT_ID,
+        "client_secret": settings.GOOGLE_CLIENT_SECRET,
+        "code": code,
+        "redirect_uri": settings.GOOGLE_REDIRECT_URI,
+        "grant_type": "authorization_code",
+    }
+    response = await client.post(GOOGLE_TOKEN_URL, data=token_data)
+    token_json = response.json()
 
-            if "access_token" not in token_json:
-                raise Exception("Failed to retrieve access token")
+    if "access_token" not in token_json:
+        raise Exception("Failed to retrieve access token")
 
-            access_token = token_json["access_token"]
+    # 2️⃣ id_token이 있으면 로컬 검증으로 사용자 정보 추출 (추가 왕복 없음)
+    if token_json.get("id_token"):
+        return await verify_google_id_token(token_json["id_token"])
 
-            # 2️⃣ 사용자 정보 요청
-            user_info_url = "https://www.googleapis.com/oauth2/v2/userinfo"
-            async with session.get(
-                user_info_url, headers={"Authorization": f"Bearer {access_token}"}
-            ) as resp:
-                user_data = await resp.json()
+    access_token = token_json["access_token"]
+
+    # id_token이 없는 경우에만 사용자 정보 API 요청
+    response = await client.get(
+        GOOGLE_USER_INFO_URL, headers={"Authorization": f"Bearer {access_token}"}
+    )
+    return response.json()
+
+
+async def google_login(code: str, db: AsyncSession):
+    """
+    Google OAuth 인증 후 사용자 정보 반환
+    """
+    try:
+        user_data = await fetch_google_user(code)
 
         # 3️⃣ 사용자 정보 확인 및 저장
         email = user_data.get("email")
@@ -59,9 +102,11 @@ async def google_login(code: str, db: AsyncSession):
                 await db.commit()  # ✅ 변경 사항 커밋
                 await db.refresh(user)  # ✅ 새로 생성된 유저 정보 새로고침
 
+        invalidate_principal(user.id)
+
         # 4️⃣ JWT 토큰 생성
         access_token = create_access_token({"user_id": user.id})
-        refresh_token = create_refresh_token({"user_id": user.id})
+        refresh_token = await refresh_token_store.issue(user.id, db=db)
 
         return {
             "user": user,
@@ -0,0 +1,93 @@
+import asyncio
+import logging
+import re
+import time
+
+import jwt
+
+from app.core.http_client import get_http_client
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_AGE_SECONDS = 3600
+MIN_UNKNOWN_KID_REFRESH_SECONDS = 30
+REFRESH_AHEAD_RATIO = 0.8  # max-age의 80%가 지나면 백그라운드 갱신
+
+_MAX_AGE = re.compile(r"max-age=(\d+)")
+
+
+def cache_max_age(cache_control: str | None) -> int:
+    """Cache-Control 헤더에서 캐시 유지 시간(초) 추출"""
+    if not cache_control:
+        return DEFAULT_MAX_AGE_SECONDS
+    if "no-store" in cache_control or "no-cache" in cache_control:
+        return 0
+    match = _MAX_AGE.search(cache_control)
+    return int(match.group(1)) if match else DEFAULT_MAX_AGE_SECONDS
+
+
+class JWKSCache:
+    """
+    JWKS(공개키 목록) 캐시
+
+    - 응답의 Cache-Control max-age 동안 키를 재사용
+    - max-age의 일정 비율이 지나면 기존 키로 응답하면서 백그라운드에서 갱신
+    - 만료 후에는 갱신을 기다리되, 갱신이 실패하면 기존 키를 계속 사용
+    - 모르는 kid가 오면 (키 로테이션) 최소 간격을 두고 즉시 갱신
+    """
+
+    def __init__(self, url: str, timer=time.monotonic):
+        self.url = url
+        self._timer = timer
+        self._keys: dict[str, jwt.PyJWK] = {}
+        self._fetched_at = 0.0
+        self._refresh_at = 0.0
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task | None = None
+
+    async def get_key(self, kid: str) -> jwt.PyJWK:
+        now = self._timer()
+
+        if not self._keys or now >= self._expires_at:
+            await self._refresh(stale_ok=bool(self._keys))
+        elif now >= self._refresh_at:
+            self._schedule_refresh()
+
+        key = self._keys.get(kid)
+        if key is None and self._timer() - self._fetched_at >= (
+            MIN_UNKNOWN_KID_REFRESH_SECONDS
+        ):
+            await self._refresh(stale_ok=True)
+            key = self._keys.get(kid)
+
+        if key is None:
+            raise jwt.InvalidTokenError(f"Unknown signing key: {kid}")
+        return key
+
+    def _schedule_refresh(self) -> None:
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh(stale_ok=True))
+
+    async def _refresh(self, stale_ok: bool) -> None:
+        fetched_at = self._fetched_at
+        async with self._lock:
+            # 기다리는 동안 다른 요청이 이미 갱신했으면 생략
+            if self._fetched_at != fetched_at:
+                return
+            try:
+                response = await get_http_client().get(self.url)
+                response.raise_for_status()
+                key_set = jwt.PyJWKSet.from_dict(response.json())
+            except Exception as e:
+                if not stale_ok:
+                    raise
+                logger.warning("JWKS refresh failed, keeping cached keys: %s", e)
+                return
+
+            max_age = cache_max_age(response.headers.get("Cache-Control"))
+            now = self._timer()
+            self._keys = {key.key_id: key for key in key_set.keys}
+            self._fetched_at = now
+            self._refresh_at = now + max_age * REFRESH_AHEAD_RATIO
+            self._expires_at = now + max_age
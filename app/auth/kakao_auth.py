@@ -3,9 +3,10 @@ from datetime import timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from app.auth.token_store import refresh_token_store
 from app.core.config import settings
 from app.models.user import User
-from app.services.jwt_service import create_access_token, create_refresh_token
+from app.services.jwt_service import create_access_token
 from app.services.kakao_auth import get_kakao_access_token, get_kakao_profile
 
 
@@ -56,10 +57,6 @@ async def kakao_login(code: str, db: AsyncSession) -> dict:
     access_token = create_access_token(
         data={"user_id": user.id}, expires_delta=timedelta(minutes=30)
     )
-    refresh_token = create_refresh_token(data={"user_id": user.id})
-
-    # DB에 Refresh Token 저장 (기존 토큰을 덮어씀)
-    user.refresh_token = refresh_token
-    await db.commit()
+    refresh_token = await refresh_token_store.issue(user.id, db=db)
 
     return {"user": user, "access_token": access_token, "refresh_token": refresh_token}
@@ -0,0 +1,188 @@
+import hashlib
+import hmac
+import secrets
+import time
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+
+from sqlalchemy import delete, insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models.oauth_state_use import OAuthStateUse
+
+# state를 서명해 브라우저에 심는 쿠키 (OAuth 경로에만 전송)
+OAUTH_STATE_COOKIE = "oauth_state"
+OAUTH_STATE_COOKIE_PATH = "/oauth/google"
+
+
+class OAuthStateStore(ABC):
+    """콜백에서 사용된 state 기록 (OAUTH_STATE_BACKEND 설정으로 선택)"""
+
+    @abstractmethod
+    async def consume(
+        self, state: str, expires_at: int, db: AsyncSession | None = None
+    ) -> bool:
+        """state를 사용 처리 (처음 사용이면 True, 이미 사용된 state면 False)"""
+
+
+class InMemoryOAuthStateStore(OAuthStateStore):
+    """
+    프로세스 내 로컬 저장소 (단일 워커/테스트용)
+    다른 워커로 간 재사용은 막지 못하므로 다중 워커 배포에는 database 사용
+    """
+
+    def __init__(self, max_states: int = 100000):
+        self._used = TTLCache(maxsize=max_states, ttl=settings.OAUTH_STATE_TTL_SECONDS)
+
+    async def consume(
+        self, state: str, expires_at: int, db: AsyncSession | None = None
+    ) -> bool:
+        # await 없이 확인과 기록을 끝내므로 같은 이벤트 루프 안에서는 원자적
+        if self._used.get(state) is not None:
+            return False
+        self._used.set(state, True, ttl=expires_at - time.time())
+        return True
+
+
+class DatabaseOAuthStateStore(OAuthStateStore):
+    """
+    oauth_state_uses 테이블 저장소 (모든 워커가 공유)
+
+    - state를 기본 키로 INSERT해서 두 번째 사용은 중복 키 오류로 판정
+    - 만료된 state는 prune_every번 사용마다 한 번씩 정리
+    - db를 넘기면 그 세션(요청 세션)으로 기록하고 커밋한다 (실패 시 롤백)
+    """
+
+    def __init__(self, session_factory=None, prune_every: int = 1000):
+        self._session_factory = session_factory
+        self._prune_every = prune_every
+        self._uses_since_prune = 0
+
+    @asynccontextmanager
+    async def _session(self, db: AsyncSession | None = None):
+        if db is not None:
+            yield db
+            return
+
+        # 테스트 하니스가 async_session의 bind를 바꾸므로 호출 시점에 참조
+        from app.core.database import async_session
+
+        async with (self._session_factory or async_session)() as session:
+            yield session
+
+    async def consume(
+        self, state: str, expires_at: int, db: AsyncSession | None = None
+    ) -> bool:
+        async with self._session(db) as session:
+            try:
+                await session.execute(
+                    insert(OAuthStateUse).values(state=state, expires_at=expires_at)
+                )
+                await session.commit()
+            except IntegrityError:
+                await session.rollback()
+                return False
+
+            self._uses_since_prune += 1
+            if self._uses_since_prune >= self._prune_every:
+                await self.prune(db=session)
+        return True
+
+    async def prune(
+        self, now: float | None = None, db: AsyncSession | None = None
+    ) -> int:
+        """만료된 state 삭제 후 삭제한 행 수 반환"""
+        now = time.time() if now is None else now
+        async with self._session(db) as session:
+            result = await session.execute(
+                delete(OAuthStateUse).where(OAuthStateUse.expires_at <= now)
+            )
+            await session.commit()
+        self._uses_since_prune = 0
+        return result.rowcount
+
+
+def create_state_store(kind: str) -> OAuthStateStore:
+    """OAUTH_STATE_BACKEND 설정값에 맞는 저장소"""
+    if kind == "memory":
+        return InMemoryOAuthStateStore()
+    return DatabaseOAuthStateStore()
+
+
+class OAuthStateSigner:
+    """
+    OAuth state 발급/검증
+
+    로그인 시작 시 state와 그 state·만료 시각에 대한 HMAC 서명을 쿠키로 심고,
+    콜백에서 쿠키 서명과 만료를 확인한 뒤 쿼리의 state와 비교한다.
+    (다른 브라우저에서 발급된 state로 로그인시키는 CSRF 방지)
+    서명 검증에는 서버 상태가 필요 없어 어느 워커가 콜백을 받아도 검증된다.
+    콜백은 consume()으로 state를 저장소에 사용 처리하므로, 같은 state/쿠키 쌍을
+    만료 전에 다시 보내도 거부된다. 한 번 쓴 쿠키는 콜백 응답에서도 삭제한다.
+    """
+
+    def __init__(
+        self, secret_key: str, ttl: float, store: OAuthStateStore | None = None
+    ):
+        self._key = secret_key.encode()
+        self.ttl = ttl
+        self.store = store or InMemoryOAuthStateStore()
+
+    def _sign(self, state: str, expires_at: int) -> str:
+        message = f"{state}.{expires_at}".encode()
+        return hmac.new(self._key, message, hashlib.sha256).hexdigest()
+
+    def issue(self, now: float | None = None) -> tuple[str, str]:
+        """(state, 쿠키 값) 발급"""
+        now = time.time() if now is None else now
+        state = secrets.token_urlsafe(32)
+        expires_at = int(now + self.ttl)
+        return state, f"{state}.{expires_at}.{self._sign(state, expires_at)}"
+
+    def _verified_expiry(
+        self, state: str, cookie: str | None, now: float | None = None
+    ) -> int | None:
+        """검증에 성공하면 쿠키의 만료 시각, 실패하면 None"""
+        if not cookie:
+            return None
+        try:
+            signed_state, expires_at, signature = cookie.rsplit(".", 2)
+            expires_at = int(expires_at)
+        except ValueError:
+            return None
+
+        now = time.time() if now is None else now
+        if (
+            hmac.compare_digest(signature, self._sign(signed_state, expires_at))
+            and expires_at > now
+            and hmac.compare_digest(signed_state, state)
+        ):
+            return expires_at
+        return None
+
+    def verify(self, state: str, cookie: str | None, now: float | None = None) -> bool:
+        """쿠키가 이 서버가 서명한 것이고, 만료 전이며, state와 일치하는지 확인"""
+        return self._verified_expiry(state, cookie, now) is not None
+
+    async def consume(
+        self,
+        state: str,
+        cookie: str | None,
+        db: AsyncSession | None = None,
+        now: float | None = None,
+    ) -> bool:
+        """verify()에 더해 state를 사용 처리 (이미 쓴 state면 False)"""
+        expires_at = self._verified_expiry(state, cookie, now)
+        if expires_at is None:
+            return False
+        return await self.store.consume(state, expires_at, db)
+
+
+oauth_state_signer = OAuthStateSigner(
+    settings.SECRET_KEY,
+    ttl=settings.OAUTH_STATE_TTL_SECONDS,
+    store=create_state_store(settings.OAUTH_STATE_BACKEND),
+)
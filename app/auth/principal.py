@@ -0,0 +1,103 @@
+from typing import Any
+
+from fastapi import HTTPException, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.auth.principal_cache import cache_principal, get_cached_principal
+from app.core.database import async_session, request_session
+from app.models.user import User
+
+
+class PrincipalNotLoadedError(AttributeError):
+    """User 엔티티가 아직 로드되지 않은 상태에서 속성에 접근한 경우"""
+
+
+class Principal:
+    """
+    JWT 클레임만으로 만든 지연 로딩 사용자 객체 (request.state.user)
+
+    - id, claims는 토큰에서 바로 제공되므로 DB 조회가 없음
+    - 그 외 속성은 User 엔티티가 필요하며, `await principal.load()` 시점에
+      요청 범위 세션(request.state.db / db_session)을 재사용해 한 번만 조회
+    - principal 캐시에 이미 있는 사용자라면 load 없이도 바로 속성 접근 가능
+    """
+
+    __slots__ = ("id", "claims", "_request", "_user")
+
+    def __init__(self, user_id: int, claims: dict, request: Request | None = None):
+        self.id = user_id
+        self.claims = claims
+        self._request = request
+        self._user: User | None = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._user is not None
+
+    async def load(self, db: AsyncSession | None = None) -> User:
+        """User 엔티티 로드 (요청당 최대 1회 조회)"""
+        if self._user is not None:
+            return self._user
+
+        user = get_cached_principal(self.id)
+        if user is None:
+            if db is None and self._request is not None:
+                db = getattr(self._request.state, "db", None)
+
+            if db is not None:
+                # 라우트 세션에 붙은 객체는 요청 간에 공유하지 않으므로 캐시하지 않음
+                user = await self._select_user(db)
+            else:
+                user = await self._select_user_for_cache()
+                if user:
+                    cache_principal(user)
+
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+
+        self._user = user
+        return user
+
+    async def _select_user_for_cache(self) -> User | None:
+        """캐시에 넣을 (어느 세션에도 붙어 있지 않은) User 조회"""
+        if self._request is None:
+            # 요청 밖(스크립트 등)에서 만든 principal
+            async with async_session() as session:
+                return await self._select_user(session)
+
+        # 요청 범위 세션을 재사용해 커넥션 체크아웃은 요청당 한 번으로 유지
+        # (DBSessionMiddleware가 없는 앱이면 이번 조회에만 쓰고 바로 반환)
+        holder, owned = request_session(self._request)
+        try:
+            session = await holder.get()
+            user = await self._select_user(session)
+            if user:
+                session.expunge(user)
+            return user
+        finally:
+            if owned:
+                await holder.close()
+                del self._request.state.db_session
+
+    async def _select_user(self, db: AsyncSession) -> User | None:
+        result = await db.execute(select(User).filter(User.id == self.id))
+        return result.scalars().first()
+
+    def __getattr__(self, name: str) -> Any:
+        # __slots__에 없는 속성(id, claims 외)만 여기로 들어옴
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        user = self._user or get_cached_principal(self.id)
+        if user is None:
+            raise PrincipalNotLoadedError(
+                f"'{name}' requires the User entity; "
+                "call `await request.state.user.load()` first"
+            )
+
+        self._user = user
+        return getattr(user, name)
+
+    def __repr__(self) -> str:
+        return f"Principal(id={self.id}, loaded={self.is_loaded})"
@@ -0,0 +1,37 @@
+import logging
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+# ✅ user_id -> User (세션에서 분리된 객체) 캐시
+principal_cache = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+def get_cached_principal(user_id: int) -> User | None:
+    """캐시된 인증 사용자 조회"""
+    return principal_cache.get(user_id)
+
+
+def cache_principal(user: User) -> None:
+    """인증 사용자 캐시 저장 (세션이 닫힌 뒤에도 읽을 수 있도록 로드된 객체만 저장)"""
+    principal_cache.set(user.id, user)
+
+
+def invalidate_principal(user_id: int) -> None:
+    """
+    사용자 정보가 변경되었을 때 호출하는 무효화 훅
+    (로그인/회원가입 등 users 행을 갱신하는 곳에서 호출)
+    """
+    principal_cache.invalidate(user_id)
+    logger.debug("Principal cache invalidated for user %s", user_id)
+
+
+def principal_cache_stats() -> dict:
+    """principal 캐시 hit/miss 통계"""
+    return principal_cache.stats()
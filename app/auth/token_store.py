@@ -0,0 +1,387 @@
+import hashlib
+import secrets
+import time
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import timedelta
+
+from sqlalchemy import delete, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.upsert import bulk_upsert
+from app.models.refresh_token_family import RefreshTokenFamily
+from app.services.jwt_service import (
+    create_access_token,
+    create_refresh_token,
+    decode_token,
+)
+
+REFRESH_TOKEN_EXPIRE = timedelta(days=7)
+
+
+class RefreshTokenReuseError(ValueError):
+    """이미 교체(rotate)된 refresh token이 다시 사용된 경우"""
+
+
+@dataclass
+class TokenFamily:
+    """하나의 로그인에서 파생된 refresh token 계보"""
+
+    family_id: str
+    user_id: int
+    current_jti: str
+    expires_at: float  # epoch seconds
+    revoked: bool = False
+
+
+class BloomFilter:
+    """삭제를 지원하지 않는 고정 크기 bloom filter (false negative 없음)"""
+
+    def __init__(self, size_bits: int = 1 << 20, hash_count: int = 7):
+        self.size_bits = size_bits
+        self.hash_count = hash_count
+        self._bits = bytearray(size_bits // 8 + 1)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size_bits
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item)
+        )
+
+
+class RevocationIndex:
+    """
+    폐기된 jti 인덱스
+
+    bloom filter로 대부분의 "폐기되지 않음"을 즉시 판정하고,
+    bloom이 양성일 때만 정확한 집합(jti -> 만료 시각)을 확인한다.
+    만료된 항목은 주기적으로 정리하며 그때 bloom도 다시 만든다.
+    """
+
+    def __init__(self, size_bits: int = 1 << 20, prune_every: int = 10000):
+        self._size_bits = size_bits
+        self._prune_every = prune_every
+        self._bloom = BloomFilter(size_bits)
+        self._exact: dict[str, float] = {}
+        self._adds_since_prune = 0
+
+    def add(self, jti: str, expires_at: float) -> None:
+        self._bloom.add(jti)
+        self._exact[jti] = expires_at
+        self._adds_since_prune += 1
+        if self._adds_since_prune >= self._prune_every:
+            self.prune()
+
+    def __contains__(self, jti: str) -> bool:
+        return jti in self._bloom and jti in self._exact
+
+    def prune(self, now: float | None = None) -> None:
+        now = time.time() if now is None else now
+        self._exact = {jti: exp for jti, exp in self._exact.items() if exp > now}
+        self._bloom = BloomFilter(self._size_bits)
+        for jti in self._exact:
+            self._bloom.add(jti)
+        self._adds_since_prune = 0
+
+
+class RefreshTokenBackend(ABC):
+    """
+    refresh token family 저장소 백엔드 (REFRESH_TOKEN_BACKEND 설정으로 선택)
+
+    db를 넘기면 DB 백엔드는 그 세션(요청 범위 세션)을 써서 커넥션을 더 잡지 않는다.
+    """
+
+    @abstractmethod
+    async def get_family(
+        self, family_id: str, db: AsyncSession | None = None
+    ) -> TokenFamily | None: ...
+
+    @abstractmethod
+    async def save_family(
+        self, family: TokenFamily, db: AsyncSession | None = None
+    ) -> None: ...
+
+    @abstractmethod
+    async def swap_jti(
+        self,
+        family_id: str,
+        old_jti: str,
+        new_jti: str,
+        expires_at: float,
+        db: AsyncSession | None = None,
+    ) -> bool:
+        """
+        family의 현재 jti가 old_jti이고 폐기되지 않았을 때만 new_jti로 교체 (CAS)
+        동시에 같은 토큰으로 교체를 시도하면 하나만 성공한다.
+        """
+
+    @abstractmethod
+    async def revoke_jti(self, jti: str, expires_at: float) -> None: ...
+
+    @abstractmethod
+    async def is_revoked(self, jti: str) -> bool: ...
+
+
+class InMemoryRefreshTokenBackend(RefreshTokenBackend):
+    """
+    프로세스 내 로컬 백엔드 (단일 워커/테스트용)
+    워커마다 따로 저장되고 재시작하면 사라지므로 다중 워커 배포에는 database 사용
+    """
+
+    def __init__(self, max_families: int = 100000):
+        self._families = TTLCache(
+            maxsize=max_families, ttl=REFRESH_TOKEN_EXPIRE.total_seconds()
+        )
+        self._revoked = RevocationIndex()
+
+    async def get_family(
+        self, family_id: str, db: AsyncSession | None = None
+    ) -> TokenFamily | None:
+        return self._families.get(family_id)
+
+    async def save_family(
+        self, family: TokenFamily, db: AsyncSession | None = None
+    ) -> None:
+        self._families.set(
+            family.family_id, family, ttl=family.expires_at - time.time()
+        )
+
+    async def swap_jti(
+        self,
+        family_id: str,
+        old_jti: str,
+        new_jti: str,
+        expires_at: float,
+        db: AsyncSession | None = None,
+    ) -> bool:
+        # await 없이 비교와 교체를 끝내므로 같은 이벤트 루프 안에서는 원자적
+        family = self._families.get(family_id)
+        if family is None or family.revoked or family.current_jti != old_jti:
+            return False
+        family.current_jti = new_jti
+        family.expires_at = expires_at
+        self._families.set(family_id, family, ttl=expires_at - time.time())
+        return True
+
+    async def revoke_jti(self, jti: str, expires_at: float) -> None:
+        self._revoked.add(jti, expires_at)
+
+    async def is_revoked(self, jti: str) -> bool:
+        return jti in self._revoked
+
+
+class DatabaseRefreshTokenBackend(RefreshTokenBackend):
+    """
+    refresh_token_families 테이블 백엔드 (모든 워커가 공유, 재시작 후에도 유지)
+
+    - 교체는 UPDATE ... WHERE current_jti = :old 한 문장으로 워커 간 경합을 판정
+    - family의 현재 jti만 유효하므로 교체된 jti는 따로 기록하지 않음
+      (revoke_jti / is_revoked는 no-op, 재사용은 current_jti 불일치로 탐지)
+    - 만료된 family는 prune_every번 발급마다 한 번씩 정리
+    """
+
+    def __init__(self, session_factory=None, prune_every: int = 1000):
+        self._session_factory = session_factory
+        self._prune_every = prune_every
+        self._saves_since_prune = 0
+
+    @asynccontextmanager
+    async def _session(self, db: AsyncSession | None = None):
+        """넘겨받은 세션이 있으면 그대로 쓰고, 없을 때만 짧은 세션을 연다"""
+        if db is not None:
+            yield db
+            return
+
+        # 테스트 하니스가 async_session의 bind를 바꾸므로 호출 시점에 참조
+        from app.core.database import async_session
+
+        async with (self._session_factory or async_session)() as session:
+            yield session
+
+    async def get_family(
+        self, family_id: str, db: AsyncSession | None = None
+    ) -> TokenFamily | None:
+        async with self._session(db) as session:
+            row = await session.get(
+                RefreshTokenFamily, family_id, populate_existing=True
+            )
+        if row is None or row.expires_at <= time.time():
+            return None
+        return TokenFamily(
+            family_id=row.family_id,
+            user_id=row.user_id,
+            current_jti=row.current_jti,
+            expires_at=row.expires_at,
+            revoked=row.revoked,
+        )
+
+    async def save_family(
+        self, family: TokenFamily, db: AsyncSession | None = None
+    ) -> None:
+        async with self._session(db) as session:
+            await bulk_upsert(
+                session,
+                RefreshTokenFamily,
+                [
+                    {
+                        "family_id": family.family_id,
+                        "user_id": family.user_id,
+                        "current_jti": family.current_jti,
+                        "expires_at": int(family.expires_at),
+                        "revoked": family.revoked,
+                    }
+                ],
+                conflict_columns=("family_id",),
+                update_columns=("current_jti", "expires_at", "revoked"),
+            )
+            await session.commit()
+
+        self._saves_since_prune += 1
+        if self._saves_since_prune >= self._prune_every:
+            await self.prune(db=db)
+
+    async def swap_jti(
+        self,
+        family_id: str,
+        old_jti: str,
+        new_jti: str,
+        expires_at: float,
+        db: AsyncSession | None = None,
+    ) -> bool:
+        async with self._session(db) as session:
+            result = await session.execute(
+                update(RefreshTokenFamily)
+                .where(
+                    RefreshTokenFamily.family_id == family_id,
+                    RefreshTokenFamily.current_jti == old_jti,
+                    RefreshTokenFamily.revoked.is_(False),
+                )
+                .values(current_jti=new_jti, expires_at=int(expires_at))
+                .execution_options(synchronize_session=False)
+            )
+            await session.commit()
+        return result.rowcount == 1
+
+    async def revoke_jti(self, jti: str, expires_at: float) -> None:
+        pass
+
+    async def is_revoked(self, jti: str) -> bool:
+        return False
+
+    async def prune(
+        self, now: float | None = None, db: AsyncSession | None = None
+    ) -> int:
+        """만료된 family 삭제 후 삭제한 행 수 반환"""
+        now = time.time() if now is None else now
+        async with self._session(db) as session:
+            result = await session.execute(
+                delete(RefreshTokenFamily).where(RefreshTokenFamily.expires_at <= now)
+            )
+            await session.commit()
+        self._saves_since_prune = 0
+        return result.rowcount
+
+
+def create_backend(kind: str) -> RefreshTokenBackend:
+    """REFRESH_TOKEN_BACKEND 설정값에 맞는 백엔드"""
+    if kind == "memory":
+        return InMemoryRefreshTokenBackend()
+    return DatabaseRefreshTokenBackend()
+
+
+class RefreshTokenStore:
+    """
+    refresh token 발급/교체(rotation) 및 재사용 탐지
+
+    - 발급 시 family(fid)와 토큰 식별자(jti)를 claim에 담음
+    - 교체 시 family의 현재 jti를 CAS로 갱신하고 이전 jti는 폐기 인덱스에 추가
+    - 폐기되었거나 현재 jti가 아닌 토큰이 오면 재사용으로 보고 family 전체 폐기
+      (다른 워커가 같은 토큰으로 먼저 교체한 경우도 CAS 실패로 같은 처리)
+    - users 테이블은 전혀 조회/갱신하지 않음
+    """
+
+    def __init__(self, backend: RefreshTokenBackend):
+        self.backend = backend
+
+    async def issue(
+        self,
+        user_id: int,
+        family_id: str | None = None,
+        db: AsyncSession | None = None,
+    ) -> str:
+        """
+        새 family로 refresh token 발급 (family_id를 주면 그 id로 새로 생성)
+        요청 안에서는 그 요청의 세션을 db로 넘긴다 (DB 백엔드가 여기서 커밋함)
+        """
+        jti = secrets.token_urlsafe(16)
+        family = TokenFamily(
+            family_id=family_id or secrets.token_urlsafe(16),
+            user_id=user_id,
+            current_jti=jti,
+            expires_at=time.time() + REFRESH_TOKEN_EXPIRE.total_seconds(),
+        )
+        await self.backend.save_family(family, db)
+        return self._encode(family)
+
+    @staticmethod
+    def _encode(family: TokenFamily) -> str:
+        return create_refresh_token(
+            {
+                "user_id": family.user_id,
+                "fid": family.family_id,
+                "jti": family.current_jti,
+            },
+            expires_delta=REFRESH_TOKEN_EXPIRE,
+        )
+
+    async def rotate(self, refresh_token: str, db: AsyncSession | None = None) -> dict:
+        """refresh token을 새 access/refresh token 쌍으로 교체"""
+        payload = decode_token(refresh_token)
+        family_id, jti = payload.get("fid"), payload.get("jti")
+        if not family_id or not jti:
+            raise ValueError("Invalid refresh token")
+
+        family = await self.backend.get_family(family_id, db)
+        if family is None or family.revoked:
+            raise ValueError("Refresh token revoked")
+
+        new_jti = secrets.token_urlsafe(16)
+        expires_at = time.time() + REFRESH_TOKEN_EXPIRE.total_seconds()
+        if (
+            await self.backend.is_revoked(jti)
+            or family.current_jti != jti
+            or not await self.backend.swap_jti(family_id, jti, new_jti, expires_at, db)
+        ):
+            await self.revoke_family(family, db)
+            raise RefreshTokenReuseError("Refresh token reuse detected")
+
+        await self.backend.revoke_jti(jti, payload["exp"])
+        family.current_jti, family.expires_at = new_jti, expires_at
+        return {
+            "access_token": create_access_token({"user_id": family.user_id}),
+            "refresh_token": self._encode(family),
+        }
+
+    async def revoke_family(
+        self, family: TokenFamily, db: AsyncSession | None = None
+    ) -> None:
+        """family 전체 폐기 (현재 토큰까지 사용 불가)"""
+        family.revoked = True
+        await self.backend.save_family(family, db)
+        await self.backend.revoke_jti(family.current_jti, family.expires_at)
+
+
+refresh_token_store = RefreshTokenStore(create_backend(settings.REFRESH_TOKEN_BACKEND))
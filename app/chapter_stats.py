@@ -0,0 +1,48 @@
+import argparse
+import asyncio
+
+from app.core.database import async_session, engine
+from app.services.chapter_stat_service import (
+    backfill_chapter_stats,
+    check_chapter_stats,
+)
+
+
+async def main(command: str, user_ids: list[int] | None) -> int:
+    async with async_session() as db:
+        if command == "backfill":
+            rows = await backfill_chapter_stats(db, user_ids)
+            print(f"✅ user_chapter_stats: {rows} rows rebuilt")
+            status = 0
+        else:
+            mismatches = await check_chapter_stats(db, user_ids)
+            for m in mismatches:
+                print(
+                    f"⚠️ user {m['user_id']} chapter {m['chapter_id']}: "
+                    f"expected {m['expected']}, rollup {m['actual']}"
+                )
+            if not mismatches:
+                print("✅ user_chapter_stats matches the live aggregate")
+            status = 1 if mismatches else 0
+    await engine.dispose()
+    return status
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="사용자별 단원 통계 롤업(user_chapter_stats) 백필 / 정합성 확인"
+    )
+    parser.add_argument(
+        "command",
+        choices=["backfill", "check"],
+        help="backfill: 원본 집계로 다시 채움, check: 어긋난 행 출력 (있으면 종료 코드 1)",
+    )
+    parser.add_argument(
+        "--user-id",
+        type=int,
+        action="append",
+        dest="user_ids",
+        help="대상 사용자 (여러 번 지정 가능, 생략하면 전체)",
+    )
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(main(args.command, args.user_ids)))
@@ -0,0 +1,93 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class TTLCache:
+    """
+    TTL 만료와 LRU 축출을 함께 지원하는 프로세스 내 캐시
+
+    - maxsize를 넘으면 가장 오래 사용되지 않은 항목부터 제거
+    - 항목마다 만료 시각을 가지며, 만료된 항목은 조회 시점에 제거
+    - hit/miss 카운터 제공
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """캐시 조회 (만료된 항목은 miss로 처리하고 제거)"""
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+
+        expires_at, value = entry
+        if expires_at <= self._timer():
+            del self._data[key]
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """캐시 저장 (ttl을 지정하지 않으면 기본 ttl 사용)"""
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            self._data.pop(key, None)
+            return
+
+        self._data[key] = (self._timer() + ttl, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """항목을 꺼내면서 제거 (만료된 항목은 default 반환)"""
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= self._timer():
+            return default
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        """특정 항목 무효화"""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """전체 항목 무효화"""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict:
+        """hit/miss 통계"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+        }
@@ -1,6 +1,8 @@
 import os
+from typing import Literal
 
 from dotenv import load_dotenv
+from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # ✅ .env 파일 자동 로드
@@ -15,18 +17,26 @@ class Settings(BaseSettings):
     # 환경 설정 (default: development)
     ENV: str = os.getenv("ENV", "development")
 
-    # ✅ MySQL 환경 변수
-    MYSQL_ROOT_PASSWORD: str
-    MYSQL_DATABASE: str
-    MYSQL_USER: str
-    MYSQL_PASSWORD: str
+    # ✅ 데이터베이스 선택
+    # DATABASE_URL을 직접 지정하면 그대로 사용하고, 없으면 DB_BACKEND에 따라 생성
+    # - mysql : MYSQL_* 환경 변수로 mysql+asyncmy URL 생성 (기본)
+    # - sqlite: SQLITE_PATH 파일을 aiosqlite로 사용 (MySQL 없이 로컬 테스트/벤치마크)
+    DATABASE_URL: str = ""
+    DB_BACKEND: Literal["mysql", "sqlite"] = "mysql"
+    SQLITE_PATH: str = "ticha.db"
+
+    # ✅ MySQL 환경 변수 (DB_BACKEND=mysql이고 DATABASE_URL이 없을 때만 필요)
+    MYSQL_ROOT_PASSWORD: str | None = None
+    MYSQL_DATABASE: str | None = None
+    MYSQL_USER: str | None = None
+    MYSQL_PASSWORD: str | None = None
 
     # ✅ MySQL 포트 & 호스트 설정 (환경에 따라 자동 변경)
     MYSQL_PORT: int = (
         3309 if ENV == "development" else 3306
     )  # 로컬(Docker)은 3309, 배포(RDS)는 3306
 
-    MYSQL_HOST: str = (
+    MYSQL_HOST: str | None = (
         "host.docker.internal" if ENV == "development" else os.getenv("MYSQL_HOST")
     )  # 로컬은 Docker 내부 접근, 배포는 RDS 주소 사용
 
@@ -44,10 +54,87 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ALGORITHM: str
 
-    # DATABASE_URL 생성 메서드
-    @property
-    def DATABASE_URL(self) -> str:
-        return f"mysql+asyncmy://{self.MYSQL_USER}:{self.MYSQL_PASSWORD}@{self.MYSQL_HOST}:{self.MYSQL_PORT}/{self.MYSQL_DATABASE}"
+    # 로깅 설정
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "text"  # "text" 또는 "json"
+    # SQL 로그 레벨 (미지정 시 development는 INFO, 그 외는 WARNING)
+    SQL_LOG_LEVEL: str | None = None
+    # WARNING 미만 로그의 요청 단위 샘플링 비율 (경로 prefix별 지정 가능)
+    LOG_SAMPLE_RATE: float = 1.0
+    LOG_ROUTE_SAMPLE_RATES: dict[str, float] = {}
+
+    # DB 커넥션 풀 설정
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT_SECONDS: float = 10.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800  # 30분마다 연결 재설정 (타임아웃 방지)
+    # pre-ping 전략: always(체크아웃마다), idle(오래 쉰 커넥션만), never
+    DB_POOL_PRE_PING: Literal["always", "idle", "never"] = "always"
+    DB_POOL_PRE_PING_IDLE_SECONDS: float = 60.0
+
+    # 읽기 전용 레플리카 (미설정 시 모든 쿼리를 primary로)
+    READ_DATABASE_URL: str | None = None
+    READ_REPLICA_MAX_LAG_SECONDS: float = (
+        5.0  # 허용 가능한 데이터 지연 (staleness 예산)
+    )
+    READ_REPLICA_CHECK_INTERVAL_SECONDS: float = 5.0
+
+    # 내부 운영 API 토큰 (미설정 시 /internal 엔드포인트 비활성화)
+    INTERNAL_API_TOKEN: str | None = None
+
+    # 인증 사용자(principal) 캐시 설정
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10000
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 300
+
+    # 검증된 JWT 캐시 설정 (항목은 토큰 exp와 이 값 중 먼저 오는 시점에 만료)
+    TOKEN_CACHE_MAX_SIZE: int = 10000
+    TOKEN_CACHE_MAX_TTL_SECONDS: int = 1800
+
+    # 비밀번호 해싱 풀 설정 (bcrypt를 이벤트 루프 밖에서 실행)
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 32  # 실행 중 + 대기 중 작업 상한 (초과 시 503)
+    PASSWORD_HASH_USE_PROCESSES: bool = True  # False면 스레드 풀 사용
+
+    # refresh token family 저장소
+    # - database: refresh_token_families 테이블 (모든 워커 공유, 재시작 후에도 유지)
+    # - memory  : 프로세스 내 캐시 (단일 워커/테스트 전용)
+    REFRESH_TOKEN_BACKEND: Literal["database", "memory"] = "database"
+
+    # OAuth state 설정 (state는 발급 후 이 시간 안에 한 번만 사용 가능)
+    OAUTH_STATE_TTL_SECONDS: int = 600
+    # 사용된 state 기록 위치
+    # - database: oauth_state_uses 테이블 (모든 워커 공유)
+    # - memory  : 프로세스 내 캐시 (단일 워커/테스트 전용)
+    OAUTH_STATE_BACKEND: Literal["database", "memory"] = "database"
+
+    # 외부 API(OAuth 등) 공용 HTTP 클라이언트 설정
+    HTTP_CONNECT_TIMEOUT_SECONDS: float = 3.0
+    HTTP_READ_TIMEOUT_SECONDS: float = 10.0
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+
+    # DATABASE_URL 생성
+    @model_validator(mode="after")
+    def _resolve_database_url(self) -> "Settings":
+        if self.DATABASE_URL:
+            return self
+        if self.DB_BACKEND == "sqlite":
+            self.DATABASE_URL = f"sqlite+aiosqlite:///{self.SQLITE_PATH}"
+            return self
+
+        missing = [
+            name
+            for name in ("MYSQL_USER", "MYSQL_PASSWORD", "MYSQL_HOST", "MYSQL_DATABASE")
+            if not getattr(self, name)
+        ]
+        if missing:
+            raise ValueError(
+                f"{', '.join(missing)} must be set "
+                "(or set DATABASE_URL / DB_BACKEND=sqlite)"
+            )
+        self.DATABASE_URL = f"mysql+asyncmy://{self.MYSQL_USER}:{self.MYSQL_PASSWORD}@{self.MYSQL_HOST}:{self.MYSQL_PORT}/{self.MYSQL_DATABASE}"
+        return self
 
 
 settings = Settings()
@@ -1,22 +1,172 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+import asyncio
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.exc import InterfaceError, OperationalError
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import settings
+from app.core.db_pool import InstrumentedAsyncPool, install_idle_pre_ping
+from app.core.query_stats import install_query_stats
+from app.core.read_replica import PRIMARY_PIN_COOKIE, ReplicaRouter
+
+
+def create_engine(url: str) -> AsyncEngine:
+    """설정된 풀 옵션으로 비동기 엔진 생성"""
+    connect_args = {}
+    if url.startswith("mysql"):
+        connect_args = {"charset": "utf8mb4"}  # UTF-8 지원 (MySQL 드라이버 전용 옵션)
+    elif url.startswith("sqlite"):
+        connect_args = {"timeout": 30}  # 동시 쓰기 시 잠금 해제까지 대기
+    engine = create_async_engine(
+        url,
+        # SQL 로그는 echo 대신 sqlalchemy.engine 로거 레벨로 제어 (SQL_LOG_LEVEL)
+        poolclass=InstrumentedAsyncPool,  # 체크아웃 대기/타임아웃 지표 수집
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=settings.DB_POOL_PRE_PING == "always",  # 끊어진 연결 자동 복구
+        connect_args=connect_args,
+    )
+    if settings.DB_POOL_PRE_PING == "idle":
+        install_idle_pre_ping(engine, settings.DB_POOL_PRE_PING_IDLE_SECONDS)
+    # 요청별 SQL 문 수 / DB 시간 집계 (Server-Timing, X-DB-Queries)
+    install_query_stats(engine)
+    return engine
+
 
 # ✅ SQLAlchemy 비동기 엔진 생성 (RDS에 최적화)
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=True,
-    pool_recycle=1800,  # 30분마다 연결 재설정 (타임아웃 방지)
-    pool_pre_ping=True,  # 끊어진 연결 자동 복구
-    connect_args={"charset": "utf8mb4"},  # UTF-8 지원
-)
+engine = create_engine(settings.DATABASE_URL)
 
 # ✅ 세션 생성
 async_session = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
 
+# ✅ 읽기 전용 레플리카 (선택)
+read_engine = (
+    create_engine(settings.READ_DATABASE_URL) if settings.READ_DATABASE_URL else None
+)
+read_session = (
+    sessionmaker(bind=read_engine, class_=AsyncSession, expire_on_commit=False)
+    if read_engine is not None
+    else None
+)
+replica_router = ReplicaRouter(
+    primary=async_session,
+    replica=read_session,
+    max_lag_seconds=settings.READ_REPLICA_MAX_LAG_SECONDS,
+    check_interval_seconds=settings.READ_REPLICA_CHECK_INTERVAL_SECONDS,
+)
+
+
+@event.listens_for(Session, "after_commit")
+def _mark_committed(session: Session) -> None:
+    session.info["committed"] = True
+
+
+class RequestSession:
+    """
+    요청 범위 DB 세션
+
+    - 첫 사용 시점에만 커넥션을 체크아웃 (DB를 쓰지 않는 요청은 체크아웃 없음)
+    - 세션을 그 커넥션에 묶어 두므로 커밋을 여러 번 해도 요청당 체크아웃은 한 번
+    - 미들웨어 / 의존성 / principal 지연 로딩이 같은 세션을 공유
+    - 응답이 끝나면 DBSessionMiddleware가 close()로 커넥션 반환
+    """
+
+    def __init__(self):
+        self._opened: dict[sessionmaker, tuple[AsyncConnection, AsyncSession]] = {}
+        # 동시에 get()이 불려도 factory당 커넥션은 하나만 열리도록 직렬화
+        self._lock = asyncio.Lock()
+
+    async def get(self, factory: sessionmaker | None = None) -> AsyncSession:
+        """factory(기본: primary)의 요청 세션 (없으면 이때 연결)"""
+        factory = factory or async_session
+        opened = self._opened.get(factory)
+        if opened is None:
+            async with self._lock:
+                opened = self._opened.get(factory)
+                if opened is None:
+                    connection = await factory.kw["bind"].connect()
+                    opened = (connection, factory(bind=connection))
+                    self._opened[factory] = opened
+        return opened[1]
+
+    @property
+    def is_open(self) -> bool:
+        return bool(self._opened)
+
+    @property
+    def committed(self) -> bool:
+        """이 요청에서 커밋한 세션이 있는지"""
+        return any(
+            session.info.get("committed") for _, session in self._opened.values()
+        )
+
+    async def close(self) -> None:
+        opened, self._opened = self._opened, {}
+        for connection, session in opened.values():
+            try:
+                await session.close()
+            finally:
+                await connection.close()
+
+
+def primary_pin_cookie(holder: RequestSession) -> str | None:
+    """쓰기를 커밋한 요청의 응답에 붙일 primary 고정 쿠키 (필요 없으면 None)"""
+    return replica_router.pin_cookie() if holder.committed else None
+
+
+def request_session(request: Request) -> tuple[RequestSession, bool]:
+    """
+    요청에 연결된 RequestSession (미들웨어가 없는 앱이면 새로 만들어 연결)
+    두 번째 값은 호출한 쪽이 직접 닫아야 하는지 여부
+    """
+    holder = getattr(request.state, "db_session", None)
+    if holder is not None:
+        return holder, False
+    holder = RequestSession()
+    request.state.db_session = holder
+    return holder, True
+
 
 # ✅ 의존성 주입
-async def get_db():
-    async with async_session() as session:
+async def get_db(request: Request):
+    holder, owned = request_session(request)
+    try:
+        session = await holder.get()
+        # ✅ 지연 로딩 principal이 라우트와 같은 세션을 재사용하도록 노출
+        request.state.db = session
+        yield session
+    finally:
+        if owned:
+            await holder.close()
+
+
+async def get_read_db(request: Request):
+    """
+    읽기 전용 엔드포인트용 세션
+    레플리카가 정상이고 지연이 예산 안이면 레플리카, 아니면 primary
+    """
+    # ✅ 최근 쓰기한 클라이언트는 staleness 예산 동안 primary에서 (read-your-writes)
+    pinned = PRIMARY_PIN_COOKIE in request.cookies
+    factory = replica_router.session_factory(pinned)
+    holder, owned = request_session(request)
+    try:
+        session = await holder.get(factory)
+        request.state.db = session
         yield session
+    except (OperationalError, InterfaceError):
+        # 레플리카 연결 문제면 다음 확인 시점까지 primary로 전환
+        if factory is not async_session:
+            replica_router.mark_unhealthy()
+        raise
+    finally:
+        if owned:
+            await holder.close()
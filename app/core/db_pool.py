@@ -0,0 +1,119 @@
+import bisect
+import logging
+import time
+
+from sqlalchemy import event
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+logger = logging.getLogger(__name__)
+
+# 커넥션 체크아웃 대기 시간 히스토그램 경계 (ms)
+WAIT_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+
+class PoolMetrics:
+    """커넥션 체크아웃 대기 시간/타임아웃 집계"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+        self.buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+
+    def record_wait(self, wait_ms: float) -> None:
+        self.checkouts += 1
+        self.total_wait_ms += wait_ms
+        self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+        self.buckets[bisect.bisect_left(WAIT_BUCKETS_MS, wait_ms)] += 1
+
+    def record_timeout(self) -> None:
+        self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        labels = [f"le_{bound}ms" for bound in WAIT_BUCKETS_MS] + ["inf"]
+        return {
+            "checkouts": self.checkouts,
+            "checkout_timeouts": self.timeouts,
+            "avg_wait_ms": (
+                self.total_wait_ms / self.checkouts if self.checkouts else 0.0
+            ),
+            "max_wait_ms": self.max_wait_ms,
+            "wait_histogram": dict(zip(labels, self.buckets)),
+        }
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """체크아웃 대기 시간과 타임아웃을 기록하는 AsyncAdaptedQueuePool"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except sa_exc.TimeoutError:
+            self.metrics.record_timeout()
+            logger.warning("DB pool checkout timed out: %s", self.status())
+            raise
+        self.metrics.record_wait((time.perf_counter() - start) * 1000)
+        return connection
+
+    def recreate(self):
+        # engine.dispose() 후에도 누적 지표 유지
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def install_idle_pre_ping(engine: AsyncEngine, idle_seconds: float) -> None:
+    """
+    pre-ping "idle" 전략: 일정 시간 이상 쉬었던 커넥션만 체크아웃 시 ping
+    (ping 실패 시 DisconnectionError -> 풀이 새 커넥션으로 재시도)
+    """
+
+    @event.listens_for(engine.sync_engine, "checkin")
+    def _mark_idle(dbapi_connection, connection_record):
+        connection_record.info["checked_in_at"] = time.monotonic()
+
+    @event.listens_for(engine.sync_engine, "checkout")
+    def _ping_if_idle(dbapi_connection, connection_record, connection_proxy):
+        checked_in_at = connection_record.info.get("checked_in_at")
+        if checked_in_at is None or time.monotonic() - checked_in_at < idle_seconds:
+            return
+        try:
+            cursor = dbapi_connection.cursor()
+            cursor.execute("SELECT 1")
+            cursor.close()
+        except Exception as e:
+            raise sa_exc.DisconnectionError() from e
+
+
+def pool_stats(engine: AsyncEngine) -> dict:
+    """엔진 커넥션 풀의 현재 상태와 누적 지표"""
+    pool = engine.sync_engine.pool
+    stats = {
+        "pool_class": type(pool).__name__,
+        "status": pool.status(),
+    }
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        stats.update(
+            {
+                "pool_size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": pool.overflow(),
+                "max_overflow": pool._max_overflow,
+                "timeout": pool.timeout(),
+            }
+        )
+    if isinstance(pool, InstrumentedAsyncPool):
+        stats.update(pool.metrics.snapshot())
+    return stats
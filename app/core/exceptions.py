@@ -1,4 +1,11 @@
-from fastapi import HTTPException, status
+from fastapi import HTTPException, Request, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import Response
+from fastapi.utils import is_body_allowed_for_status_code
+from starlette.exceptions import HTTPException as StarletteHTTPException
+
+from app.core.responses import CamelCaseJSONResponse
 
 
 class KakaoAPIException(HTTPException):
@@ -21,3 +28,25 @@ class ValidationError(HTTPException):
             status_code=status_code,
             detail={"code": code, "message": message, "details": details},
         )
+
+
+async def http_exception_handler(
+    request: Request, exc: StarletteHTTPException
+) -> Response:
+    """HTTPException 응답도 camelCase로 직렬화 (FastAPI 기본 핸들러와 동일한 형태)"""
+    headers = getattr(exc, "headers", None)
+    if not is_body_allowed_for_status_code(exc.status_code):
+        return Response(status_code=exc.status_code, headers=headers)
+    return CamelCaseJSONResponse(
+        {"detail": exc.detail}, status_code=exc.status_code, headers=headers
+    )
+
+
+async def request_validation_exception_handler(
+    request: Request, exc: RequestValidationError
+) -> CamelCaseJSONResponse:
+    """요청 검증 오류(422) 응답도 camelCase로 직렬화"""
+    return CamelCaseJSONResponse(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        content={"detail": jsonable_encoder(exc.errors())},
+    )
@@ -0,0 +1,166 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from passlib.context import CryptContext
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 비밀번호 해싱을 위한 context 생성 (워커 프로세스에서도 이 모듈만 import)
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+def hash_password_sync(password: str) -> str:
+    """비밀번호 해싱 (블로킹, 워커에서 실행)"""
+    return pwd_context.hash(password)
+
+
+def verify_password_sync(plain_password: str, hashed_password: str) -> bool:
+    """비밀번호 검증 (블로킹, 워커에서 실행)"""
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def _worker_context():
+    """
+    워커 프로세스 시작 방식
+    이미 스레드가 도는 프로세스(로깅 리스너, 기본 executor 등)에서 fork하면
+    fork 시점에 잡혀 있던 락 때문에 자식이 멈출 수 있으므로 fork는 쓰지 않음
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context(
+        "forkserver" if "forkserver" in methods else "spawn"
+    )
+
+
+class HashingPoolSaturated(Exception):
+    """해싱 대기열이 가득 차서 작업을 즉시 거절한 경우"""
+
+
+class PasswordHasher:
+    """
+    bcrypt 전용 실행기
+
+    - 프로세스 풀에서 실행하고, 프로세스 풀을 쓸 수 없으면 스레드 풀로 대체
+    - 동시에 실행되는 작업 수는 워커 수로 제한 (나머지는 대기)
+    - 실행 중 + 대기 중 작업이 max_pending에 도달하면 대기 없이 즉시 거절
+    """
+
+    def __init__(self, max_workers: int, max_pending: int, use_processes: bool = True):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.use_processes = use_processes
+        self._executor: Executor | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._pending = 0
+        self._running = 0
+        self._rejected = 0
+
+    @property
+    def backend(self) -> str:
+        if self._executor is None:
+            return "idle"
+        return (
+            "process" if isinstance(self._executor, ProcessPoolExecutor) else "thread"
+        )
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.use_processes:
+                try:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers, mp_context=_worker_context()
+                    )
+                except (OSError, NotImplementedError, ImportError, ValueError) as e:
+                    logger.warning("Process pool unavailable, using threads: %s", e)
+            if self._executor is None:
+                self._executor = self._thread_executor()
+        return self._executor
+
+    async def start(self) -> None:
+        """
+        앱 시작(lifespan) 시 실행기와 워커를 미리 띄움
+        (첫 로그인이 워커 기동 비용을 떠안지 않도록)
+        """
+        executor = self._get_executor()
+        if isinstance(executor, ProcessPoolExecutor):
+            loop = asyncio.get_running_loop()
+            try:
+                await asyncio.gather(
+                    *(
+                        loop.run_in_executor(executor, os.getpid)
+                        for _ in range(self.max_workers)
+                    )
+                )
+            except BrokenProcessPool:
+                logger.warning("Process pool broken, falling back to threads")
+                executor.shutdown(wait=False)
+                self._executor = self._thread_executor()
+
+    def _thread_executor(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="password-hash"
+        )
+
+    async def _run(self, func, *args):
+        if self._pending >= self.max_pending:
+            self._rejected += 1
+            raise HashingPoolSaturated("Password hashing queue is full")
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+
+        self._pending += 1
+        try:
+            async with self._semaphore:
+                self._running += 1
+                try:
+                    return await self._submit(func, *args)
+                finally:
+                    self._running -= 1
+        finally:
+            self._pending -= 1
+
+    async def _submit(self, func, *args):
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        except BrokenProcessPool:
+            # 워커 프로세스를 띄울 수 없는 환경 -> 스레드 풀로 전환 후 재시도
+            logger.warning("Process pool broken, falling back to threads")
+            self._executor.shutdown(wait=False)
+            self._executor = self._thread_executor()
+            return await loop.run_in_executor(self._executor, func, *args)
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password_sync, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password_sync, plain_password, hashed_password)
+
+    def stats(self) -> dict:
+        return {
+            "backend": self.backend,
+            "workers": self.max_workers,
+            "running": self._running,
+            "queue_depth": self._pending - self._running,
+            "max_pending": self.max_pending,
+            "rejected": self._rejected,
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        self._semaphore = None
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    use_processes=settings.PASSWORD_HASH_USE_PROCESSES,
+)
@@ -0,0 +1,60 @@
+import importlib.util
+import logging
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# ✅ 앱 전역 HTTP 클라이언트 (lifespan에서 생성/종료, keep-alive 커넥션 재사용)
+_client: httpx.AsyncClient | None = None
+
+
+def http2_available() -> bool:
+    """h2 패키지가 설치된 경우에만 HTTP/2 사용"""
+    return importlib.util.find_spec("h2") is not None
+
+
+def create_http_client(**kwargs) -> httpx.AsyncClient:
+    """타임아웃과 커넥션 풀 한도를 명시한 AsyncClient 생성"""
+    options = {
+        "timeout": httpx.Timeout(
+            settings.HTTP_READ_TIMEOUT_SECONDS,
+            connect=settings.HTTP_CONNECT_TIMEOUT_SECONDS,
+        ),
+        "limits": httpx.Limits(
+            max_connections=settings.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+        "http2": http2_available(),
+    }
+    options.update(kwargs)
+    return httpx.AsyncClient(**options)
+
+
+async def start_http_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = create_http_client()
+        logger.info("HTTP client started (http2=%s)", http2_available())
+    return _client
+
+
+async def close_http_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    공용 HTTP 클라이언트 반환
+    (lifespan 밖에서 호출되는 스크립트/테스트를 위해 없으면 생성)
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = create_http_client()
+    return _client
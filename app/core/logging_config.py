@@ -0,0 +1,118 @@
+import json
+import logging
+import random
+import sys
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+
+from app.core.config import settings
+
+# 현재 요청 경로 / 이 요청의 로그 샘플링 여부 (요청 컨텍스트 미들웨어가 설정)
+request_path: ContextVar[str | None] = ContextVar("log_request_path", default=None)
+request_sampled: ContextVar[bool] = ContextVar("log_request_sampled", default=True)
+
+_listener: QueueListener | None = None
+_queue_handler: QueueHandler | None = None
+
+
+class RouteSampler:
+    """경로 prefix별 샘플링 비율 (가장 긴 prefix 우선)"""
+
+    def __init__(self, default_rate: float, route_rates: dict[str, float]):
+        self.default_rate = default_rate
+        self._routes = sorted(route_rates.items(), key=lambda item: -len(item[0]))
+
+    def rate_for(self, path: str) -> float:
+        for prefix, rate in self._routes:
+            if path.startswith(prefix):
+                return rate
+        return self.default_rate
+
+    def should_sample(self, path: str) -> bool:
+        rate = self.rate_for(path)
+        if rate >= 1:
+            return True
+        return rate > 0 and random.random() < rate
+
+
+route_sampler = RouteSampler(settings.LOG_SAMPLE_RATE, settings.LOG_ROUTE_SAMPLE_RATES)
+
+
+class RequestContextFilter(logging.Filter):
+    """
+    로그 레코드에 요청 경로를 붙이고 요청 단위 샘플링 적용
+    (WARNING 이상은 샘플링과 무관하게 항상 남김)
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.path = request_path.get() or "-"
+        return record.levelno >= logging.WARNING or request_sampled.get()
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON 로그 포맷"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "path": getattr(record, "path", "-"),
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def sql_log_level() -> str:
+    if settings.SQL_LOG_LEVEL:
+        return settings.SQL_LOG_LEVEL
+    return "INFO" if settings.ENV == "development" else "WARNING"
+
+
+def setup_logging(stream=None) -> None:
+    """
+    루트 로거를 큐 핸들러로 구성
+
+    요청 처리 코드에서는 레코드를 큐에 넣기만 하고,
+    포맷팅과 I/O는 QueueListener 스레드에서 수행한다.
+    """
+    global _listener, _queue_handler
+
+    shutdown_logging()
+
+    if settings.LOG_FORMAT == "json":
+        formatter: logging.Formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(
+            "%(asctime)s %(levelname)s [%(name)s] %(path)s - %(message)s"
+        )
+    output = logging.StreamHandler(stream or sys.stderr)
+    output.setFormatter(formatter)
+
+    queue: SimpleQueue = SimpleQueue()
+    _queue_handler = QueueHandler(queue)
+    _queue_handler.addFilter(RequestContextFilter())
+    _listener = QueueListener(queue, output, respect_handler_level=True)
+    _listener.start()
+
+    root = logging.getLogger()
+    root.addHandler(_queue_handler)
+    root.setLevel(settings.LOG_LEVEL)
+
+    # engine echo 대신 로거 레벨로 SQL 로그 제어
+    logging.getLogger("sqlalchemy.engine").setLevel(sql_log_level())
+
+
+def shutdown_logging() -> None:
+    """큐에 남은 로그를 모두 내보내고 리스너 종료"""
+    global _listener, _queue_handler
+
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,108 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Literal
+
+from fastapi import HTTPException, Request
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+Direction = Literal["next", "prev"]
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """정렬 키 값과 방향 (next: 키보다 뒤, prev: 키보다 앞)"""
+
+    key: int
+    direction: Direction
+
+
+def encode_cursor(key: int, direction: Direction) -> str:
+    raw = json.dumps({"k": key, "d": direction}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(value: str) -> Cursor:
+    """클라이언트가 보낸 커서 해석 (형식이 틀리면 400)"""
+    try:
+        padded = value + "=" * (-len(value) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded))
+        key, direction = data["k"], data["d"]
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(key, int) or direction not in ("next", "prev"):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return Cursor(key, direction)
+
+
+@dataclass
+class Page:
+    rows: list
+    next_cursor: str | None
+    prev_cursor: str | None
+
+
+async def paginate(
+    db: AsyncSession,
+    stmt: Select,
+    column,
+    limit: int,
+    key: Callable[[Any], int],
+    cursor: Cursor | None = None,
+    page: int = 1,
+) -> Page:
+    """
+    column(유일한 정렬 키) 기준 페이지 조회
+
+    - cursor가 있으면 키셋: WHERE column > key ORDER BY column LIMIT n
+      (prev는 반대 방향으로 읽고 뒤집음) → 앞 페이지를 건너뛰는 비용 없음
+    - 없으면 기존 page 번호 방식 (OFFSET)
+    limit + 1개를 읽어 다음 페이지 존재 여부를 COUNT 없이 판단하고,
+    어느 방식이든 다음/이전 커서를 돌려준다.
+    key는 결과 행에서 column 값을 꺼내는 함수
+    """
+    backward = cursor is not None and cursor.direction == "prev"
+    if cursor is None:
+        stmt = stmt.order_by(column).offset((page - 1) * limit)
+    elif backward:
+        stmt = stmt.where(column < cursor.key).order_by(column.desc())
+    else:
+        stmt = stmt.where(column > cursor.key).order_by(column)
+
+    result = await db.execute(stmt.limit(limit + 1))
+    rows = list(result.all())
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if backward:
+        rows.reverse()
+
+    if not rows:
+        return Page(rows, None, None)
+
+    # 읽은 방향의 반대쪽은 커서/페이지로 넘어온 경우에만 존재
+    has_next = cursor is not None if backward else has_more
+    has_prev = has_more if backward else (cursor is not None or page > 1)
+    return Page(
+        rows,
+        encode_cursor(key(rows[-1]), "next") if has_next else None,
+        encode_cursor(key(rows[0]), "prev") if has_prev else None,
+    )
+
+
+def page_of(key: int, limit: int) -> int:
+    """1부터 빈틈없이 매겨진 키가 속한 페이지 번호 (커서 응답의 current_page)"""
+    return max(key - 1, 0) // limit + 1
+
+
+def cursor_links(
+    request: Request, next_cursor: str | None, prev_cursor: str | None
+) -> dict:
+    """현재 URL에서 page 파라미터를 커서로 바꾼 다음/이전 링크"""
+    url = request.url.remove_query_params(["page", "cursor"])
+
+    def link(cursor: str | None) -> str | None:
+        return str(url.include_query_params(cursor=cursor)) if cursor else None
+
+    return {"next": link(next_cursor), "prev": link(prev_cursor)}
@@ -1,28 +1,150 @@
-from enum import Enum
+from typing import Callable, Iterable, TypeVar
 
+from fastapi import FastAPI
+from starlette.routing import Route
 
-class PublicRoute(Enum):
-    # Auth 관련
-    LOGIN = "/api/v1/auth/login"
-    REGISTER = "/api/v1/auth/register"
+PUBLIC_ROUTE_ATTR = "__public_route__"
 
-    # OAuth 관련
-    KAKAO_LOGIN = "/oauth/kakao/login"
-    KAKAO_TOKEN = "/oauth/kakao/token"
-    KAKAO_CALLBACK = "/oauth/kakao/callback"
-    GOOGLE_LOGIN = "/oauth/google/login"
-    GOOGLE_CALLBACK = "/oauth/google/callback"
+_PARAM = "{param}"  # 경로 파라미터 세그먼트 (임의의 한 세그먼트와 매칭)
+_PATH = "{path}"  # :path 변환 파라미터 (남은 모든 세그먼트와 매칭, 마지막 세그먼트만)
+_EXACT_END = "$exact"  # 이 노드에서 끝나는 라우트의 메서드별 public 여부
+_PREFIX_END = "$prefix"  # 이 노드 아래 모든 경로가 public
+_ANY_METHOD = "*"  # 메서드를 제한하지 않는 라우트
 
-    # Docs 관련
-    SWAGGER = "/docs"
-    OPENAPI = "/openapi.json"
-    REDOC = "/redoc"
+EndpointT = TypeVar("EndpointT", bound=Callable)
 
-    # Pages
-    INDEX = "/index"
-    LOGIN_PAGE = "/login"
 
+def public_route(endpoint: EndpointT) -> EndpointT:
+    """
+    인증 없이 접근 가능한 엔드포인트로 표시하는 데코레이터
+    (라우터 데코레이터 아래에 둘 것)
 
-def is_public_path(path: str) -> bool:
-    """정확한 경로 매칭을 통해 public 경로 여부 확인"""
-    return path in [route.value for route in PublicRoute]
+        @router.post("/login")
+        @public_route
+        async def login(...): ...
+    """
+    setattr(endpoint, PUBLIC_ROUTE_ATTR, True)
+    return endpoint
+
+
+def _segments(path: str) -> list[str]:
+    return [segment for segment in path.split("/") if segment]
+
+
+def _trie_key(path: str, index: int, segment: str) -> str:
+    if segment[0] != "{":
+        return segment
+    if segment.endswith(":path}"):
+        if index != len(_segments(path)) - 1:
+            raise ValueError(
+                f"{path}: :path 파라미터는 마지막 세그먼트에만 올 수 있습니다"
+            )
+        return _PATH
+    return _PARAM
+
+
+def _route_methods(route: Route) -> Iterable[str]:
+    return route.methods or (_ANY_METHOD,)
+
+
+def _method_public(methods: dict[str, bool], method: str) -> bool:
+    if method in methods:
+        return methods[method]
+    return methods.get(_ANY_METHOD, False)
+
+
+class RoutePolicy:
+    """
+    라우트 인증 정책 테이블
+
+    앱 시작 시 라우트 선언(@public_route)으로부터 한 번 컴파일되며,
+    public 여부는 (메서드, 경로) 단위로 판단한다.
+    - 파라미터가 없는 경로: 해시 기반 정확 매칭 (O(1))
+    - 그 외: 모든 라우트(메서드별 public 여부)와 prefix 경로의 세그먼트 단위 트라이
+    로 조회한다. 트라이는 고정 세그먼트가 있으면 파라미터 세그먼트를 시도하지 않으므로
+    public인 /x/{id}가 private인 /x/me를 public으로 만들지 않고,
+    public GET이 같은 경로의 private POST를 public으로 만들지도 않는다.
+    """
+
+    def __init__(self):
+        self._exact: dict[str, dict[str, bool]] = {}
+        self._trie: dict = {}
+
+    def compile(self, app: FastAPI, public_prefixes: Iterable[str] = ()) -> None:
+        exact: dict[str, dict[str, bool]] = {}
+        trie: dict = {}
+
+        # (경로, 메서드, public 여부) - FastAPI가 직접 등록하는 문서 경로를 먼저
+        routes = [
+            (url, method, True)
+            for url in (
+                app.docs_url,
+                app.redoc_url,
+                app.openapi_url,
+                app.swagger_ui_oauth2_redirect_url,
+            )
+            if url
+            for method in ("GET", "HEAD")
+        ]
+        routes += [
+            (route.path, method, getattr(route.endpoint, PUBLIC_ROUTE_ATTR, False))
+            for route in app.routes
+            if isinstance(route, Route)
+            for method in _route_methods(route)
+        ]
+
+        for path, method, public in routes:
+            node = trie
+            for index, segment in enumerate(_segments(path)):
+                node = node.setdefault(_trie_key(path, index, segment), {})
+            # 같은 (메서드, 경로)가 여러 번 등록되면 라우팅처럼 먼저 등록된 쪽 기준
+            node.setdefault(_EXACT_END, {}).setdefault(method, public)
+            if "{" not in path:
+                exact.setdefault(path, {}).setdefault(method, public)
+
+        for prefix in public_prefixes:
+            node = trie
+            for segment in _segments(prefix):
+                node = node.setdefault(segment, {})
+            node[_PREFIX_END] = True
+
+        self._exact = exact
+        self._trie = trie
+
+    def is_public(self, path: str, method: str) -> bool:
+        methods = self._exact.get(path)
+        if methods is not None and _method_public(methods, method):
+            return True
+        return self._match(self._trie, _segments(path), 0, method)
+
+    def _match(self, node: dict, segments: list[str], index: int, method: str) -> bool:
+        if _PREFIX_END in node:
+            return True
+        if index == len(segments):
+            return _method_public(node.get(_EXACT_END, {}), method)
+
+        # 고정 세그먼트 라우트가 있으면 그쪽만 (파라미터 라우트로 넘어가지 않음)
+        child = node.get(segments[index])
+        if child is not None:
+            return self._match(child, segments, index + 1, method)
+        child = node.get(_PARAM)
+        if child is not None:
+            return self._match(child, segments, index + 1, method)
+        # :path 파라미터는 남은 세그먼트 전체를 소비
+        child = node.get(_PATH)
+        return child is not None and _method_public(child.get(_EXACT_END, {}), method)
+
+    @property
+    def public_paths(self) -> frozenset[str]:
+        """파라미터 없는 경로 중 public 메서드가 하나라도 있는 경로"""
+        return frozenset(
+            path for path, methods in self._exact.items() if any(methods.values())
+        )
+
+
+route_policy = RoutePolicy()
+
+
+def is_public_path(path: str, method: str) -> bool:
+    """컴파일된 라우트 정책 테이블로 (메서드, 경로)의 public 여부 확인"""
+    return route_policy.is_public(path, method)
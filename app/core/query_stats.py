@@ -0,0 +1,67 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+@dataclass
+class QueryStats:
+    """한 요청에서 실행된 SQL 문 수, DB 소요 시간, 커넥션 체크아웃 수"""
+
+    count: int = 0
+    duration_ms: float = 0.0
+    checkouts: int = 0
+
+    def record(self, duration_ms: float) -> None:
+        self.count += 1
+        self.duration_ms += duration_ms
+
+
+# ✅ 현재 요청의 쿼리 통계 (요청 밖에서 실행된 쿼리는 집계하지 않음)
+current_query_stats: ContextVar[QueryStats | None] = ContextVar(
+    "current_query_stats", default=None
+)
+
+_STARTED_AT = "query_stats_started_at"
+
+
+def install_query_stats(engine: AsyncEngine) -> None:
+    """엔진의 커서 실행 / 풀 체크아웃 이벤트로 현재 요청의 쿼리 통계를 집계"""
+
+    @event.listens_for(engine.sync_engine, "checkout")
+    def _checkout(dbapi_connection, connection_record, connection_proxy):
+        stats = current_query_stats.get()
+        if stats is not None:
+            stats.checkouts += 1
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(_STARTED_AT, []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started_at = conn.info[_STARTED_AT].pop()
+        stats = current_query_stats.get()
+        if stats is not None:
+            stats.record((time.perf_counter() - started_at) * 1000)
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def _error(exception_context):
+        # 실패한 문장은 after_cursor_execute가 호출되지 않으므로 시작 시각만 정리
+        conn = exception_context.connection
+        if conn is not None and conn.info.get(_STARTED_AT):
+            conn.info[_STARTED_AT].pop()
+
+
+@contextmanager
+def track_queries():
+    """블록 안에서 실행되는 쿼리를 새 QueryStats에 집계"""
+    stats = QueryStats()
+    token = current_query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        current_query_stats.reset(token)
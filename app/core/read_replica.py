@@ -0,0 +1,139 @@
+import asyncio
+import contextlib
+import logging
+import math
+import time
+from typing import Awaitable, Callable
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+logger = logging.getLogger(__name__)
+
+# 쓰기를 커밋한 클라이언트의 읽기를 primary로 고정하는 쿠키
+# (클라이언트가 들고 다니므로 다음 요청을 어느 워커가 받아도 유지됨)
+PRIMARY_PIN_COOKIE = "db_primary_pin"
+
+LagProbe = Callable[[AsyncSession], Awaitable[float | None]]
+
+
+async def default_lag_probe(session: AsyncSession) -> float | None:
+    """
+    복제 지연(초) 조회
+    - MySQL 레플리카: SHOW REPLICA STATUS의 Seconds_Behind_Source (복제 중단 시 None)
+    - 복제 설정이 없는 DB(로컬 대역 등): 지연 0으로 간주
+    """
+    if session.bind.dialect.name != "mysql":
+        await session.execute(text("SELECT 1"))
+        return 0.0
+
+    result = await session.execute(text("SHOW REPLICA STATUS"))
+    row = result.mappings().first()
+    if row is None:
+        return 0.0
+    lag = row.get("Seconds_Behind_Source", row.get("Seconds_Behind_Master"))
+    return None if lag is None else float(lag)
+
+
+class ReplicaRouter:
+    """
+    읽기 전용 쿼리를 레플리카로 보낼지 결정
+
+    - 레플리카가 없거나, 상태 확인이 실패했거나, 지연이 staleness 예산을 넘으면 primary
+    - 상태 확인(지연 조회)은 start()로 띄운 백그라운드 태스크가 check_interval마다 수행
+      (요청 경로에서는 캐시된 결과만 읽으므로 요청이 레플리카 커넥션을 따로 잡지 않음)
+    - 확인 결과가 check_interval의 두 배 넘게 갱신되지 않았으면 믿지 않고 primary
+    - 최근(예산 시간 안에) 쓰기를 한 클라이언트는 자기 쓰기를 읽도록 primary 고정
+      (쓰기 응답에 예산 시간만큼 유지되는 PRIMARY_PIN_COOKIE를 심고, 읽기 요청은
+      그 쿠키로 판단 - 쿠키를 보내지 않는 클라이언트는 고정되지 않음)
+    """
+
+    def __init__(
+        self,
+        primary: sessionmaker,
+        replica: sessionmaker | None,
+        max_lag_seconds: float,
+        check_interval_seconds: float,
+        lag_probe: LagProbe = default_lag_probe,
+        timer=time.monotonic,
+    ):
+        self.primary = primary
+        self.replica = replica
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self.lag_probe = lag_probe
+        self._timer = timer
+        self._healthy = False
+        self._checked_at: float | None = None
+        self._probe_task: asyncio.Task | None = None
+
+    async def refresh(self) -> bool:
+        """레플리카 지연을 조회해 상태를 갱신 (백그라운드 태스크/테스트에서 호출)"""
+        if self.replica is None:
+            return False
+
+        try:
+            async with self.replica() as session:
+                lag = await self.lag_probe(session)
+        except Exception as e:
+            logger.warning("Read replica unavailable, using primary: %s", e)
+            lag = None
+            healthy = False
+        else:
+            healthy = lag is not None and lag <= self.max_lag_seconds
+            if not healthy:
+                logger.warning("Read replica lag %s exceeds budget, using primary", lag)
+
+        self._healthy = healthy
+        self._checked_at = self._timer()
+        return healthy
+
+    async def _probe_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.check_interval_seconds)
+            await self.refresh()
+
+    async def start(self) -> None:
+        """앱 시작(lifespan) 시 첫 확인 후 주기적 확인 태스크 기동"""
+        if self.replica is None or self._probe_task is not None:
+            return
+        await self.refresh()
+        self._probe_task = asyncio.create_task(self._probe_loop())
+
+    async def stop(self) -> None:
+        task, self._probe_task = self._probe_task, None
+        if task is None:
+            return
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    def replica_available(self) -> bool:
+        """마지막 확인 결과 (I/O 없음)"""
+        if self.replica is None or self._checked_at is None:
+            return False
+        if self._timer() - self._checked_at > 2 * self.check_interval_seconds:
+            return False
+        return self._healthy
+
+    def mark_unhealthy(self) -> None:
+        """요청 중 레플리카 연결 오류 -> 다음 확인 시점까지 primary 사용"""
+        self._healthy = False
+
+    def pin_cookie(self) -> str | None:
+        """쓰기를 커밋한 응답에 붙일 Set-Cookie 값 (레플리카가 없으면 고정할 필요 없음)"""
+        if self.replica is None:
+            return None
+        max_age = math.ceil(self.max_lag_seconds)
+        return (
+            f"{PRIMARY_PIN_COOKIE}=1; Max-Age={max_age}; Path=/; HttpOnly; SameSite=lax"
+        )
+
+    def session_factory(self, pinned: bool = False) -> sessionmaker:
+        """pinned: 요청에 PRIMARY_PIN_COOKIE가 있음 (최근 쓰기한 클라이언트)"""
+        if pinned:
+            return self.primary
+        if self.replica_available():
+            return self.replica
+        return self.primary
@@ -0,0 +1,105 @@
+import importlib
+import inspect
+import pkgutil
+from typing import Any
+
+import inflection
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+# ✅ snake_case -> camelCase 키 변환 테이블 (프로세스 전역, 크기 제한)
+KEY_CACHE_MAX_SIZE = 4096
+_camel_keys: dict[str, str] = {}
+
+
+def camelize_key(key: Any) -> str:
+    """키 하나를 camelCase로 변환 (변환 결과는 테이블에 메모이즈)"""
+    if key.__class__ is not str:
+        key = str(key)
+
+    camel = _camel_keys.get(key)
+    if camel is None:
+        camel = inflection.camelize(key, uppercase_first_letter=False)
+        # 테이블이 가득 차면 더 저장하지 않음 (동적 키로 무한히 커지는 것 방지)
+        if len(_camel_keys) < KEY_CACHE_MAX_SIZE:
+            _camel_keys[key] = camel
+    return camel
+
+
+def warm_camel_case_keys(package: str = "app.schemas") -> int:
+    """
+    스키마 패키지의 모든 Pydantic 모델 필드명(과 alias)으로 키 테이블을 미리 채움
+    앱 시작 시 한 번 호출하며, 채워진 키 개수를 반환
+    """
+    module = importlib.import_module(package)
+    models: set[type[BaseModel]] = set()
+
+    for info in pkgutil.iter_modules(module.__path__, prefix=f"{package}."):
+        schema_module = importlib.import_module(info.name)
+        for _, obj in inspect.getmembers(schema_module, inspect.isclass):
+            if issubclass(obj, BaseModel) and obj is not BaseModel:
+                models.add(obj)
+
+    for model in models:
+        for name, field in model.model_fields.items():
+            camelize_key(name)
+            if field.alias:
+                camelize_key(field.alias)
+
+    return len(_camel_keys)
+
+
+def to_camel_case(data):
+    """
+    dict/list 구조의 모든 키를 camelCase로 변환
+
+    재귀 대신 명시적 스택을 사용하므로 깊게 중첩된 리스트에서도
+    재귀 한도에 걸리지 않는다. 키 순서와 중복 키 처리 방식은 기존과 동일.
+    """
+    if isinstance(data, dict):
+        root: Any = {}
+    elif isinstance(data, list):
+        root = []
+    else:
+        return data
+
+    stack = [(data, root)]
+    while stack:
+        source, target = stack.pop()
+
+        if isinstance(source, dict):
+            for key, value in source.items():
+                if isinstance(value, dict):
+                    child: Any = {}
+                elif isinstance(value, list):
+                    child = []
+                else:
+                    target[camelize_key(key)] = value
+                    continue
+                target[camelize_key(key)] = child
+                stack.append((value, child))
+        else:
+            for value in source:
+                if isinstance(value, dict):
+                    child = {}
+                elif isinstance(value, list):
+                    child = []
+                else:
+                    target.append(value)
+                    continue
+                target.append(child)
+                stack.append((value, child))
+
+    return root
+
+
+class CamelCaseJSONResponse(JSONResponse):
+    """
+    응답 키를 camelCase로 변환한 뒤 한 번만 직렬화하는 JSONResponse
+
+    앱의 default_response_class로 등록되어, 응답 본문을 다시 파싱하던
+    camel case 미들웨어 없이도 동일한 바이트를 내보낸다.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return super().render(to_camel_case(content))
@@ -0,0 +1,65 @@
+from typing import Any, Iterable, Mapping, Sequence
+
+from sqlalchemy import func
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+_INSERTS = {
+    "mysql": mysql.insert,
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+async def bulk_upsert(
+    db: AsyncSession,
+    model,
+    rows: Sequence[Mapping[str, Any]],
+    conflict_columns: Iterable[str],
+    update_columns: Iterable[str] = (),
+    increment_columns: Iterable[str] = (),
+) -> None:
+    """
+    여러 행을 한 번의 INSERT ... (ON DUPLICATE KEY UPDATE | ON CONFLICT) 로 저장
+
+    - conflict_columns: 충돌 판정에 쓰는 unique 인덱스 컬럼 (MySQL은 인덱스로 자동 판정)
+    - update_columns: 이미 있는 행이면 새 값으로 덮어쓸 컬럼
+    - increment_columns: 이미 있는 행이면 기존 값에 새 값을 더할 컬럼 (카운터)
+
+    UPDATE 후 rowcount를 보고 INSERT하는 방식과 달리 왕복이 한 번이고,
+    동시 요청이 같은 키를 쓰더라도 중복 행이나 unique 위반이 생기지 않는다.
+    """
+    if not rows:
+        return
+
+    dialect = db.get_bind().dialect.name
+    insert = _INSERTS.get(dialect)
+    if insert is None:
+        raise NotImplementedError(f"bulk_upsert is not supported on {dialect}")
+
+    table = model.__table__
+    stmt = insert(table).values(list(rows))
+    new = stmt.inserted if dialect == "mysql" else stmt.excluded
+
+    values = {column: new[column] for column in update_columns}
+    values.update(
+        {column: table.c[column] + new[column] for column in increment_columns}
+    )
+    # ORM onupdate는 벌크 INSERT에 적용되지 않으므로 직접 갱신
+    if values and "updated_at" in table.c:
+        values.setdefault("updated_at", func.now())
+
+    if dialect == "mysql":
+        # 갱신할 컬럼이 없으면 키 컬럼을 자기 자신으로 (no-op)
+        if not values:
+            column = next(iter(conflict_columns))
+            values = {column: table.c[column]}
+        stmt = stmt.on_duplicate_key_update(values)
+    elif values:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(conflict_columns), set_=values
+        )
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=list(conflict_columns))
+
+    await db.execute(stmt)
@@ -1,20 +1,35 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
 from fastapi.security import HTTPBearer
 from fastapi.staticfiles import StaticFiles
-from starlette.middleware.sessions import SessionMiddleware
+from starlette.exceptions import HTTPException as StarletteHTTPException
 
-from app.core.config import settings  # ✅ 환경 변수 설정 가져오기
-from app.core.public_routes import PublicRoute
-from app.middleware.auth_middleware import auth_middleware
-from app.middleware.camel_case_middleware import camel_case_middleware
+from app.core.config import settings
+from app.core.database import replica_router
+from app.core.exceptions import (
+    http_exception_handler,
+    request_validation_exception_handler,
+)
+from app.core.hashing import password_hasher
+from app.core.http_client import close_http_client, start_http_client
+from app.core.logging_config import setup_logging, shutdown_logging
+from app.core.public_routes import route_policy
+from app.core.responses import CamelCaseJSONResponse, warm_camel_case_keys
+from app.middleware.auth_middleware import AuthMiddleware
+from app.middleware.db_session_middleware import DBSessionMiddleware
+from app.middleware.logging_middleware import RequestLogContextMiddleware
+from app.middleware.query_stats_middleware import QueryStatsMiddleware
 from app.routers import (
     answer,
     answer_star,
     auth,
     basic_auth,
     grade,
+    internal,
     learning_progress,
     pages,
     quiz,
@@ -24,7 +39,31 @@ from app.routers import (
 # security_scheme 정의
 security_scheme = HTTPBearer(description="JWT 토큰을 입력하세요.")
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # ✅ 큐 기반 로깅 (요청 처리 중에는 로그 I/O를 하지 않음)
+    setup_logging()
+    # ✅ 스키마 필드명으로 camelCase 키 변환 테이블 미리 채우기
+    warm_camel_case_keys()
+    # ✅ OAuth 등 외부 API 호출용 공용 HTTP 클라이언트 (커넥션 재사용)
+    await start_http_client()
+    # ✅ 비밀번호 해싱 워커를 요청 처리 전에 기동 (fork 대신 forkserver/spawn)
+    await password_hasher.start()
+    # ✅ 레플리카 지연 확인은 요청 경로 밖 백그라운드 태스크에서
+    await replica_router.start()
+    yield
+    await replica_router.stop()
+    await close_http_client()
+    # ✅ 비밀번호 해싱 워커 정리
+    password_hasher.shutdown()
+    shutdown_logging()
+
+
+# ✅ 응답 camelCase 변환은 직렬화 시점에 한 번만 수행
+app = FastAPI(default_response_class=CamelCaseJSONResponse, lifespan=lifespan)
+app.add_exception_handler(StarletteHTTPException, http_exception_handler)
+app.add_exception_handler(RequestValidationError, request_validation_exception_handler)
 
 
 # OpenAPI 스키마에 보안 정의 추가
@@ -49,14 +88,12 @@ def custom_openapi():
         }
     }
 
-    # PublicRoute Enum 값들을 사용
-    public_paths = [route.value for route in PublicRoute]
-
+    # 인증 미들웨어와 같은 라우트 정책 테이블 사용
     for endpoint_path in openapi_schema["paths"].keys():
         path_item = openapi_schema["paths"][endpoint_path]
-        for method in path_item.values():
-            if endpoint_path not in public_paths:
-                method["security"] = [{"Bearer": []}]
+        for method, operation in path_item.items():
+            if not route_policy.is_public(endpoint_path, method.upper()):
+                operation["security"] = [{"Bearer": []}]
 
     app.openapi_schema = openapi_schema
     return app.openapi_schema
@@ -65,20 +102,11 @@ def custom_openapi():
 app.openapi = custom_openapi
 
 
-# ✅ SessionMiddleware 추가
-app.add_middleware(
-    SessionMiddleware,
-    secret_key=settings.SECRET_KEY,
-    session_cookie="sessionid",
-    same_site="lax",
-    https_only=False,
-    max_age=3600,
-)
-
-app.middleware("http")(auth_middleware)
+# ✅ 인증 미들웨어 추가 (순수 ASGI)
+app.add_middleware(AuthMiddleware)
 
-# ✅ Camel Case 미들웨어 추가
-app.middleware("http")(camel_case_middleware)
+# ✅ 요청 범위 DB 세션 (첫 사용 시 연결, 응답 종료 시 반환 - 요청당 체크아웃 최대 1회)
+app.add_middleware(DBSessionMiddleware)
 
 # ✅ CORS 미들웨어 추가 (모든 도메인 허용)
 # TODO: 배포 시에 도메인을 명시적으로 설정해야 함
@@ -90,6 +118,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ✅ 요청별 쿼리 수 / DB 시간 응답 헤더 (운영 환경 제외)
+if settings.ENV != "production":
+    app.add_middleware(QueryStatsMiddleware)
+
+# ✅ 로그 요청 컨텍스트 (경로, 요청 단위 샘플링) - 가장 바깥에서 설정
+app.add_middleware(RequestLogContextMiddleware)
+
 # Static files
 app.mount("/static", StaticFiles(directory="app/static", html=True), name="static")
 
@@ -106,3 +141,7 @@ app.include_router(
     learning_progress.router, prefix="/api/v1", tags=["learning-progress"]
 )
 app.include_router(study_dashboard.router, prefix="/api/v1", tags=["study-dashboard"])
+app.include_router(internal.router, tags=["internal"], include_in_schema=False)
+
+# ✅ 라우트 선언(@public_route)으로부터 인증 정책 테이블 컴파일
+route_policy.compile(app, public_prefixes=["/static"])
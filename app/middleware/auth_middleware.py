@@ -1,25 +1,65 @@
 import logging
 
 from fastapi import HTTPException, Request
-from fastapi.responses import JSONResponse
-from sqlalchemy.future import select
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from app.core.database import get_db
+from app.auth.principal import Principal
+from app.core.exceptions import http_exception_handler
 from app.core.public_routes import is_public_path
-from app.models.user import User
+from app.core.responses import CamelCaseJSONResponse
 from app.services.jwt_service import decode_token
 
 logger = logging.getLogger(__name__)
 
 
-async def auth_middleware(request: Request, call_next):
-    """인증 미들웨어"""
+class AuthMiddleware:
+    """
+    인증 미들웨어 (순수 ASGI)
 
-    # public 경로 체크
-    if is_public_path(request.url.path):
-        return await call_next(request)
+    BaseHTTPMiddleware를 거치지 않으므로 요청마다 별도 태스크/스트림을 만들지 않고,
+    스트리밍 응답도 그대로 통과시킨다.
+    """
 
-    try:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # public 경로 체크
+        if scope["type"] != "http" or is_public_path(scope["path"], scope["method"]):
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        try:
+            request.state.user = self.authenticate(request)
+        except HTTPException as e:
+            # 라우트에서 난 HTTPException과 같은 형태(camelCase, 헤더 포함)로 응답
+            response = await http_exception_handler(request, e)
+            await response(scope, receive, send)
+            return
+        except Exception as e:
+            await self.internal_error(e)(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            # 응답이 이미 시작됐다면 서버 에러 처리는 상위 미들웨어에 맡김
+            if response_started:
+                raise
+            await self.internal_error(e)(scope, receive, send)
+
+    @staticmethod
+    def authenticate(request: Request) -> Principal:
+        """Authorization 헤더의 토큰을 검증해 Principal 생성"""
         # Authorization 헤더 검증
         auth_header = request.headers.get("Authorization")
         if not auth_header:
@@ -35,25 +75,13 @@ async def auth_middleware(request: Request, call_next):
         if not user_id:
             raise HTTPException(status_code=401, detail="Invalid token")
 
-        # DB에서 사용자 조회
-        async for db in get_db():
-            result = await db.execute(select(User).filter(User.id == user_id))
-            user = result.scalars().first()
-
-            if not user:
-                raise HTTPException(status_code=404, detail="User not found")
-
-            request.state.user = user
-            break
-
-        response = await call_next(request)
-        return response
+        # 사용자 엔티티는 id 외의 속성이 필요할 때만 지연 로딩
+        return Principal(user_id, payload, request)
 
-    except HTTPException as e:
-        return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
-    except Exception as e:
+    @staticmethod
+    def internal_error(e: Exception) -> CamelCaseJSONResponse:
         # 예상치 못한 에러는 500으로 처리
-        logger.error(f"Internal Server Error: {str(e)}")
-        return JSONResponse(
+        logger.error("Internal Server Error: %s", e)
+        return CamelCaseJSONResponse(
             status_code=500, content={"detail": "Internal server error"}
         )
@@ -0,0 +1,37 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.database import RequestSession, primary_pin_cookie
+
+
+class DBSessionMiddleware:
+    """
+    요청 범위 DB 세션 홀더를 scope state에 연결하고 응답이 끝나면 닫는다 (순수 ASGI)
+
+    세션은 get_db / get_read_db / principal 로딩 중 처음 필요한 시점에 열리므로,
+    DB를 쓰지 않는 요청은 커넥션을 체크아웃하지 않는다.
+    응답 시작 전에 커밋이 있었으면 읽기를 primary로 고정하는 쿠키를 붙인다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        holder = RequestSession()
+        scope.setdefault("state", {})["db_session"] = holder
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                pin = primary_pin_cookie(holder)
+                if pin is not None:
+                    MutableHeaders(scope=message).append("Set-Cookie", pin)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            await holder.close()
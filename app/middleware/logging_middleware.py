@@ -0,0 +1,29 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.logging_config import request_path, request_sampled, route_sampler
+
+
+class RequestLogContextMiddleware:
+    """
+    요청 경로와 로그 샘플링 여부를 컨텍스트 변수에 설정 (순수 ASGI)
+
+    샘플링은 요청 단위로 한 번만 결정하므로, 한 요청의 로그는
+    모두 남거나 모두 생략된다 (WARNING 이상 제외).
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        path_token = request_path.set(path)
+        sampled_token = request_sampled.set(route_sampler.should_sample(path))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            request_sampled.reset(sampled_token)
+            request_path.reset(path_token)
@@ -0,0 +1,47 @@
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.query_stats import track_queries
+
+
+class QueryStatsMiddleware:
+    """
+    요청별 SQL 문 수, DB 시간, 커넥션 체크아웃 수를 응답 헤더로 노출
+    (순수 ASGI, 비운영 환경 전용)
+
+        Server-Timing: db;dur=12.3;desc="4 queries", app;dur=20.1
+        X-DB-Queries: 4
+        X-DB-Checkouts: 1
+
+    헤더는 응답 시작 시점에 붙으므로, 스트리밍 본문을 보내는 중 실행된 쿼리는
+    집계되지 않는다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started_at = time.perf_counter()
+
+        with track_queries() as stats:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    app_ms = (time.perf_counter() - started_at) * 1000
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing",
+                        f'db;dur={stats.duration_ms:.1f};desc="{stats.count} queries", '
+                        f"app;dur={app_ms:.1f}",
+                    )
+                    headers.append("X-DB-Queries", str(stats.count))
+                    headers.append("X-DB-Checkouts", str(stats.checkouts))
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
@@ -10,12 +10,15 @@ from app.models.answer_sheet import AnswerSheet
 from app.models.chapter import Chapter
 from app.models.grading_result import GradingResult
 from app.models.learning_progress import LearningProgress, LearningStatus
+from app.models.oauth_state_use import OAuthStateUse
 from app.models.problem import Problem
 from app.models.problem_in_quiz import ProblemInQuiz
 from app.models.quiz import Quiz
+from app.models.refresh_token_family import RefreshTokenFamily
 from app.models.study_log import StudyLog
 
 # 모든 모델 import
 from app.models.user import User
 from app.models.user_answer import UserAnswer
+from app.models.user_chapter_stat import UserChapterStat
 from app.models.user_problem_stat import UserProblemStat
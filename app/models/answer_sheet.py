@@ -1,12 +1,10 @@
 from enum import Enum as PyEnum
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import TIMESTAMP
-from sqlalchemy import Enum as SQLAlchemyEnum
-from sqlalchemy import ForeignKey, Integer
+from sqlalchemy import TIMESTAMP, ForeignKey, Index, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base, BaseTimestamp
+from app.models.base import Base, BaseTimestamp, db_enum
 
 if TYPE_CHECKING:
     from app.models.grading_result import GradingResult
@@ -23,20 +21,23 @@ class AnswerSheetStatus(PyEnum):
 
 class AnswerSheet(Base, BaseTimestamp):
     __tablename__ = "answer_sheets"
+    __table_args__ = (Index("ix_answer_sheets_user_status", "user_id", "status"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     quiz_id: Mapped[int] = mapped_column(ForeignKey("quizzes.id"), nullable=False)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     status: Mapped[AnswerSheetStatus] = mapped_column(
-        SQLAlchemyEnum(
-            AnswerSheetStatus, values_callable=lambda obj: [e.value for e in obj]
-        ),
+        db_enum(AnswerSheetStatus, values_callable=lambda obj: [e.value for e in obj]),
         nullable=False,
     )
     resumed_at: Mapped[TIMESTAMP | None] = mapped_column(TIMESTAMP, nullable=True)
     stopped_at: Mapped[TIMESTAMP | None] = mapped_column(TIMESTAMP, nullable=True)
     passed_time: Mapped[int | None] = mapped_column(Integer, nullable=True)
     unanswered_count: Mapped[int] = mapped_column(Integer, default=0)
+    # 채점할 때마다 1 증가 (동시 재채점 판별용 compare-and-set 키)
+    grade_version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
 
     # Relationships
     quiz: Mapped["Quiz"] = relationship("Quiz", back_populates="answer_sheets")
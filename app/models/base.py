@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import TIMESTAMP, func
+from sqlalchemy import TIMESTAMP, Enum, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -11,6 +11,19 @@ class Base(DeclarativeBase):
     pass
 
 
+def db_enum(*enums, **kwargs) -> Enum:
+    """
+    DB 종류에 맞게 생성되는 Enum 컬럼 타입
+
+    - MySQL: 네이티브 ENUM
+    - SQLite 등 ENUM이 없는 DB: VARCHAR + CHECK 제약
+    어느 DB에서든 허용되지 않은 문자열은 쿼리 실행 전에 거부한다.
+    """
+    kwargs.setdefault("create_constraint", True)
+    kwargs.setdefault("validate_strings", True)
+    return Enum(*enums, **kwargs)
+
+
 class BaseTimestamp:
     """타임스탬프 믹스인(Mixin)"""
 
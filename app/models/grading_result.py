@@ -1,9 +1,9 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Enum, ForeignKey, Integer
+from sqlalchemy import ForeignKey, Index, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base, BaseTimestamp
+from app.models.base import Base, BaseTimestamp, db_enum
 
 if TYPE_CHECKING:
     from app.models.answer_sheet import AnswerSheet
@@ -12,13 +12,21 @@ if TYPE_CHECKING:
 
 class GradingResult(Base, BaseTimestamp):
     __tablename__ = "grading_results"
+    __table_args__ = (
+        Index(
+            "uq_grading_results_answer_sheet_problem",
+            "answer_sheet_id",
+            "problem_id",
+            unique=True,
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     answer_sheet_id: Mapped[int] = mapped_column(
         ForeignKey("answer_sheets.id"), nullable=False
     )
     problem_id: Mapped[int] = mapped_column(ForeignKey("problems.id"), nullable=False)
-    result: Mapped[str] = mapped_column(Enum("correct", "incorrect"), nullable=False)
+    result: Mapped[str] = mapped_column(db_enum("correct", "incorrect"), nullable=False)
 
     # Relationships
     answer_sheet: Mapped["AnswerSheet"] = relationship(
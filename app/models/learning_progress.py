@@ -2,10 +2,10 @@ import enum
 from datetime import date
 from typing import TYPE_CHECKING
 
-from sqlalchemy import CheckConstraint, Date, Enum, ForeignKey, Integer, String
+from sqlalchemy import CheckConstraint, Date, ForeignKey, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.models.base import Base, BaseTimestamp
+from app.models.base import Base, BaseTimestamp, db_enum
 
 # 타입 힌트에 필요한 모델 임포트
 if TYPE_CHECKING:
@@ -33,7 +33,7 @@ class LearningProgress(Base, BaseTimestamp):
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     progress: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     status: Mapped[LearningStatus] = mapped_column(
-        Enum(LearningStatus), nullable=False, default=LearningStatus.IN_PROGRESS
+        db_enum(LearningStatus), nullable=False, default=LearningStatus.IN_PROGRESS
     )
     learning_date: Mapped[date] = mapped_column(
         Date, nullable=False, default=date.today
@@ -0,0 +1,17 @@
+from sqlalchemy import BigInteger, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class OAuthStateUse(Base):
+    """
+    콜백에서 이미 사용된 OAuth state (워커 간 공유되는 DB 백엔드용)
+    state가 기본 키이므로 같은 state의 두 번째 INSERT는 실패한다.
+    """
+
+    __tablename__ = "oauth_state_uses"
+    __table_args__ = (Index("ix_oauth_state_uses_expires_at", "expires_at"),)
+
+    state: Mapped[str] = mapped_column(String(64), primary_key=True)
+    expires_at: Mapped[int] = mapped_column(BigInteger, nullable=False)  # epoch 초
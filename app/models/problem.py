@@ -1,9 +1,9 @@
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base, BaseTimestamp
+from app.models.base import Base, BaseTimestamp, db_enum
 
 if TYPE_CHECKING:
     from app.models.chapter import Chapter
@@ -15,11 +15,14 @@ if TYPE_CHECKING:
 
 class Problem(Base, BaseTimestamp):
     __tablename__ = "problems"
+    __table_args__ = (
+        Index("ix_problems_chapter_difficulty", "chapter_id", "difficulty"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     chapter_id: Mapped[int] = mapped_column(ForeignKey("chapters.id"), nullable=False)
     difficulty: Mapped[str] = mapped_column(
-        Enum("easy", "medium", "hard"), nullable=False
+        db_enum("easy", "medium", "hard"), nullable=False
     )
     image_url: Mapped[str | None] = mapped_column(String(255), nullable=True)
     correct_answer: Mapped[str] = mapped_column(Text, nullable=False)
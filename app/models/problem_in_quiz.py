@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, Integer
+from sqlalchemy import ForeignKey, Index, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, BaseTimestamp
@@ -12,6 +12,9 @@ if TYPE_CHECKING:
 
 class ProblemInQuiz(Base, BaseTimestamp):
     __tablename__ = "problems_in_quizzes"
+    __table_args__ = (
+        Index("ix_problems_in_quizzes_quiz_number", "quiz_id", "problem_number"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     quiz_id: Mapped[int] = mapped_column(ForeignKey("quizzes.id"), nullable=False)
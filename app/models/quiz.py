@@ -1,9 +1,9 @@
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import Enum, ForeignKey, Integer, String
+from sqlalchemy import ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
-from app.models.base import Base, BaseTimestamp
+from app.models.base import Base, BaseTimestamp, db_enum
 
 if TYPE_CHECKING:
     from app.models.answer_sheet import AnswerSheet
@@ -18,16 +18,19 @@ ALLOWED_PROBLEM_COUNTS = {5, 10, 20, 30}
 
 class Quiz(Base, BaseTimestamp):
     __tablename__ = "quizzes"
+    __table_args__ = (Index("ix_quizzes_user_created_at", "user_id", "created_at"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     difficulty: Mapped[str] = mapped_column(
-        Enum("easy", "medium", "hard", "random"), nullable=False
+        db_enum("easy", "medium", "hard", "random"), nullable=False
     )
     total_problems_count: Mapped[int] = mapped_column(Integer, nullable=False)
     status: Mapped[str] = mapped_column(
-        Enum("in_progress", "graded", "reviewed"), nullable=False, default="in_progress"
+        db_enum("in_progress", "graded", "reviewed"),
+        nullable=False,
+        default="in_progress",
     )
     chapter_id: Mapped[int] = mapped_column(ForeignKey("chapters.id"), nullable=False)
 
@@ -0,0 +1,20 @@
+from sqlalchemy import BigInteger, Boolean, ForeignKey, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base, BaseTimestamp
+
+
+class RefreshTokenFamily(Base, BaseTimestamp):
+    """
+    refresh token family (워커 간 공유되는 DB 백엔드용)
+    family의 현재 jti만 유효하므로 jti별 폐기 목록은 따로 두지 않는다.
+    """
+
+    __tablename__ = "refresh_token_families"
+    __table_args__ = (Index("ix_refresh_token_families_expires_at", "expires_at"),)
+
+    family_id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    current_jti: Mapped[str] = mapped_column(String(64), nullable=False)
+    expires_at: Mapped[int] = mapped_column(BigInteger, nullable=False)  # epoch 초
+    revoked: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
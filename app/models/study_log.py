@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Date, ForeignKey, Integer
+from sqlalchemy import Date, ForeignKey, Index, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, BaseTimestamp
@@ -11,6 +11,9 @@ if TYPE_CHECKING:
 
 class StudyLog(Base, BaseTimestamp):
     __tablename__ = "study_logs"
+    __table_args__ = (
+        Index("uq_study_logs_user_date", "user_id", "quiz_date", unique=True),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, ForeignKey, Integer, Text
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, BaseTimestamp
@@ -12,6 +12,14 @@ if TYPE_CHECKING:
 
 class UserAnswer(Base, BaseTimestamp):
     __tablename__ = "user_answers"
+    __table_args__ = (
+        Index(
+            "uq_user_answers_answer_sheet_problem",
+            "answer_sheet_id",
+            "problem_id",
+            unique=True,
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     answer_sheet_id: Mapped[int] = mapped_column(
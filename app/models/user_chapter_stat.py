@@ -0,0 +1,24 @@
+from sqlalchemy import ForeignKey, Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base, BaseTimestamp
+
+
+class UserChapterStat(Base, BaseTimestamp):
+    """
+    사용자별 단원 통계 롤업 (채점된 답안지의 답안 수 / 정답 수)
+    채점 시 증분 갱신되며, 단원 통계 API는 이 테이블만 읽는다.
+    """
+
+    __tablename__ = "user_chapter_stats"
+    __table_args__ = (
+        Index(
+            "uq_user_chapter_stats_user_chapter", "user_id", "chapter_id", unique=True
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    chapter_id: Mapped[int] = mapped_column(ForeignKey("chapters.id"), nullable=False)
+    solved_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    correct_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -0,0 +1,26 @@
+import argparse
+import asyncio
+
+from app.core.database import async_session, engine
+from app.services.counter_service import reconcile_counters
+
+
+async def main(fix: bool) -> int:
+    async with async_session() as db:
+        report = await reconcile_counters(db, fix=fix)
+    await engine.dispose()
+
+    for name, drift in report.items():
+        print(f"{'⚠️' if drift else '✅'} {name}: {drift} rows drifted")
+    return 1 if any(report.values()) and not fix else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="비정규화 카운터를 원본 테이블 기준으로 재계산하고 어긋난 행 수를 출력"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="보정하지 않고 어긋난 행 수만 확인"
+    )
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(main(fix=not args.dry_run)))
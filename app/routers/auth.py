@@ -1,24 +1,25 @@
 import logging
-import secrets  # CSRF 방지를 위한 state 생성
-from datetime import datetime, timedelta, timezone
 from urllib.parse import urlencode
 
 import httpx
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from fastapi.responses import RedirectResponse
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from app.auth.google_auth import google_login  # Google OAuth 추가
+from app.auth.oauth_state import (
+    OAUTH_STATE_COOKIE,
+    OAUTH_STATE_COOKIE_PATH,
+    oauth_state_signer,
+)
+from app.auth.token_store import refresh_token_store
 from app.core.config import settings
 from app.core.database import get_db
+from app.core.public_routes import public_route
 from app.models.user import User
-from app.services.jwt_service import (
-    create_access_token,
-    create_refresh_token,
-    decode_token,
-)
+from app.services.jwt_service import create_access_token, decode_token
 from app.services.kakao_service import get_kakao_access_token, get_kakao_user_info
 from app.services.user_service import find_or_create_kakao_user
 
@@ -33,15 +34,14 @@ class OAuthRequest(BaseModel):
 
 router = APIRouter()
 
-# ✅ 로거 설정 (중복 적용 방지)
+# ✅ 로거 (핸들러/레벨은 app.core.logging_config에서 일괄 설정)
 logger = logging.getLogger(__name__)
-if not logger.hasHandlers():
-    logging.basicConfig(level=logging.DEBUG)
 
 
 ### ✅ Kakao OAuth
 ### TODO: 삭제필요
 @router.get("/oauth/kakao/login")
+@public_route
 async def kakao_login_redirect():
     """카카오 로그인 URL을 JSON 응답으로 반환"""
     params = {
@@ -55,6 +55,7 @@ async def kakao_login_redirect():
 
 
 @router.post("/oauth/kakao/token")
+@public_route
 async def kakao_token_exchange(
     request: OAuthRequest,  # ✅ `Body`에서 안전하게 받기
     db: AsyncSession = Depends(get_db),
@@ -62,7 +63,7 @@ async def kakao_token_exchange(
     """카카오 OAuth 인증 후 서비스 자체 JWT 발급"""
 
     code = request.code
-    logger.debug(f"🔹 Received code: {code}")
+    logger.debug("🔹 Received code: %s", code)
 
     if not code:
         raise HTTPException(status_code=400, detail="Authorization code is required")
@@ -77,7 +78,7 @@ async def kakao_token_exchange(
         )
 
         # ✅ 3. 응답 값 검증 및 디버깅 로그 추가
-        logger.debug(f"🔹 Kakao Token Response: {kakao_token_response}")
+        logger.debug("🔹 Kakao Token Response: %s", kakao_token_response)
 
         kakao_access_token = kakao_token_response.get("access_token")
         kakao_refresh_token = kakao_token_response.get("refresh_token")
@@ -89,7 +90,7 @@ async def kakao_token_exchange(
 
         # ✅ 4. 카카오 API에서 사용자 정보 가져오기
         kakao_user_info = await get_kakao_user_info(kakao_access_token)
-        logger.debug(f"🔹 Kakao User Info: {kakao_user_info}")
+        logger.debug("🔹 Kakao User Info: %s", kakao_user_info)
 
         # ✅ 5. 사용자 확인 및 refresh_token 저장 (`refresh_token`이 없으면 기존 값 유지)
         user = await find_or_create_kakao_user(kakao_user_info, kakao_refresh_token, db)
@@ -99,7 +100,7 @@ async def kakao_token_exchange(
 
         # ✅ 7. 서비스 자체 JWT 발급
         service_access_token = create_access_token(data={"user_id": user.id})
-        service_refresh_token = create_refresh_token(data={"user_id": user.id})
+        service_refresh_token = await refresh_token_store.issue(user.id, db=db)
 
         return {
             "access_token": service_access_token,
@@ -114,23 +115,24 @@ async def kakao_token_exchange(
         }
 
     except httpx.HTTPStatusError as e:
-        logger.error(f"🔺 Kakao API Request Failed: {e.response.json()}")
+        logger.error("🔺 Kakao API Request Failed: %s", e.response.text)
         raise HTTPException(
             status_code=400, detail=f"Kakao API Error: {e.response.text}"
         )
 
     except KeyError as e:
-        logger.error(f"🔺 KeyError: {e}")
+        logger.error("🔺 KeyError: %s", e)
         raise HTTPException(
             status_code=500, detail="Internal Server Error: Missing data in response"
         )
 
     except Exception as e:
-        logger.error(f"🔺 Unexpected Error: {e}")
+        logger.error("🔺 Unexpected Error: %s", e)
         raise HTTPException(status_code=500, detail="Internal Server Error")
 
 
 @router.get("/oauth/kakao/callback")
+@public_route
 async def kakao_callback(
     code: str = Query(..., description="OAuth Authorization Code"),
     db: AsyncSession = Depends(get_db),
@@ -148,8 +150,7 @@ async def kakao_callback(
             client_secret=settings.KAKAO_CLIENT_SECRET,
         )
 
-        # 🚨 디버깅: 카카오에서 받은 토큰 확인
-        print("🔹 Kakao Token Response:", kakao_token_response)
+        logger.debug("🔹 Kakao Token Response: %s", kakao_token_response)
 
         # ✅ 2. 카카오 API에서 사용자 정보 가져오기
         kakao_access_token = kakao_token_response.get("access_token")
@@ -164,18 +165,16 @@ async def kakao_callback(
 
         kakao_user_info = await get_kakao_user_info(kakao_access_token)
 
-        # 🚨 디버깅: 사용자 정보 확인
-        print("🔹 Kakao User Info:", kakao_user_info)
+        logger.debug("🔹 Kakao User Info: %s", kakao_user_info)
 
         # ✅ 3. 서비스 DB에서 사용자 확인 또는 신규 회원가입 처리
         user = await find_or_create_kakao_user(kakao_user_info, kakao_refresh_token, db)
 
-        # 🚨 디버깅: 사용자 정보 확인
-        print("🔹 Found or Created User:", user.id)
+        logger.debug("🔹 Found or Created User: %s", user.id)
 
         # ✅ 4. 서비스 자체 JWT 발급
         service_access_token = create_access_token(data={"user_id": user.id})
-        service_refresh_token = create_refresh_token(data={"user_id": user.id})
+        service_refresh_token = await refresh_token_store.issue(user.id, db=db)
 
         return {
             "access_token": service_access_token,
@@ -184,23 +183,19 @@ async def kakao_callback(
         }
 
     except Exception as e:
-        print(f"🔺 Error occurred: {e}")
+        logger.error("🔺 Error occurred: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
 
 ### ✅ Google OAuth 개선 (보안 강화)
 @router.get("/oauth/google/login")
+@public_route
 async def google_login_redirect(request: Request):
     """구글 로그인 페이지로 리디렉션"""
 
-    state = secrets.token_urlsafe(32)  # ✅ state 값 생성
-    request.session["oauth_state"] = {
-        "value": state,
-        "created_at": datetime.now(timezone.utc).isoformat(),
-    }
-
-    logger.debug(f"Generated state: {state}")
-    logger.debug(f"Session stored state: {request.session.get('oauth_state')}")
+    # ✅ state는 서명해서 OAuth 경로 전용 쿠키에 보관 (서버 측 저장소 없음)
+    state, state_cookie = oauth_state_signer.issue()
+    logger.debug("Generated state: %s", state)
 
     params = {
         "client_id": settings.GOOGLE_CLIENT_ID,
@@ -213,39 +208,37 @@ async def google_login_redirect(request: Request):
     }
     google_auth_url = f"https://accounts.google.com/o/oauth2/auth?{urlencode(params)}"
 
-    return RedirectResponse(url=google_auth_url)
+    response = RedirectResponse(url=google_auth_url)
+    response.set_cookie(
+        OAUTH_STATE_COOKIE,
+        state_cookie,
+        max_age=settings.OAUTH_STATE_TTL_SECONDS,
+        path=OAUTH_STATE_COOKIE_PATH,
+        httponly=True,
+        samesite="lax",
+    )
+    return response
 
 
 @router.get("/oauth/google/callback")
+@public_route
 async def google_callback(
     request: Request,
+    response: Response,
     code: str,
     state: str,
     db: AsyncSession = Depends(get_db),
 ):
     """Google OAuth 인증 후 Access Token 및 사용자 정보 반환"""
     try:
-        logger.debug(f"Received state from client: {state}")
-        stored_state = request.session.pop("oauth_state", None)  # ✅ pop으로 제거
-
-        if not stored_state:
-            logger.error("No state found in session")
+        logger.debug("Received state from client: %s", state)
+        # ✅ 서명/만료/일치 여부를 확인하고 state를 사용 처리 (같은 쌍의 재사용 거부)
+        state_cookie = request.cookies.get(OAUTH_STATE_COOKIE)
+        response.delete_cookie(OAUTH_STATE_COOKIE, path=OAUTH_STATE_COOKIE_PATH)
+        if not await oauth_state_signer.consume(state, state_cookie, db=db):
+            logger.error("Invalid or expired state")
             raise HTTPException(status_code=400, detail="Invalid state parameter")
 
-        if stored_state["value"] != state:
-            logger.error(
-                f"State mismatch! Stored: {stored_state['value']}, Received: {state}"
-            )
-            raise HTTPException(status_code=400, detail="Invalid state parameter")
-
-        # ✅ State 생성 시간 검증 (10분 초과 시 만료)
-        created_at = datetime.fromisoformat(stored_state["created_at"])
-        now = datetime.now(timezone.utc)
-
-        if now - created_at > timedelta(minutes=10):
-            logger.error("State expired!")
-            raise HTTPException(status_code=400, detail="State parameter expired")
-
         # ✅ Google OAuth 로그인 처리
         result = await google_login(code, db)
         user = result["user"]
@@ -263,12 +256,13 @@ async def google_callback(
         }
 
     except Exception as e:
-        logger.error(f"Google login failed: {e}")
+        logger.error("Google login failed: %s", e)
         raise HTTPException(status_code=400, detail=f"Login failed: {str(e)}") from e
 
 
 ### ✅ 현재 로그인한 사용자 정보 조회
 @router.get("/api/user/me")
+@public_route
 async def get_current_user(token: str = Query(...), db: AsyncSession = Depends(get_db)):
     """현재 사용자 정보 반환 (Access Token 사용)"""
     try:
@@ -287,5 +281,5 @@ async def get_current_user(token: str = Query(...), db: AsyncSession = Depends(g
             "email": user.email,
         }
     except Exception as e:
-        logger.error(f"Token validation failed: {e}")
+        logger.error("Token validation failed: %s", e)
         raise HTTPException(status_code=401, detail=f"Invalid token: {str(e)}")
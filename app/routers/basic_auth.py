@@ -2,19 +2,35 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.schemas.basic_auth import TokenResponse, UserLogin, UserRegister
+from app.core.public_routes import public_route
+from app.schemas.basic_auth import (
+    TokenRefresh,
+    TokenRefreshResponse,
+    TokenResponse,
+    UserLogin,
+    UserRegister,
+)
 from app.services import basic_auth_service  # 함수들을 직접 import
 
 router = APIRouter(prefix="/auth", tags=["basic-auth"])
 
 
 @router.post("/register")
+@public_route
 async def register(user_data: UserRegister, db: AsyncSession = Depends(get_db)):
     """일반 회원가입"""
     return await basic_auth_service.register(db, user_data)
 
 
 @router.post("/login", response_model=TokenResponse)
+@public_route
 async def login(user_data: UserLogin, db: AsyncSession = Depends(get_db)):
     """일반 로그인"""
     return await basic_auth_service.login(db, user_data)
+
+
+@router.post("/refresh", response_model=TokenRefreshResponse)
+@public_route
+async def refresh(token_data: TokenRefresh, db: AsyncSession = Depends(get_db)):
+    """refresh token으로 토큰 재발급 (users 조회 없음, 토큰 family만 갱신)"""
+    return await basic_auth_service.refresh(db, token_data)
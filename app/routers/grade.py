@@ -1,7 +1,10 @@
+from typing import Optional
+
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
+from app.core.pagination import cursor_links, decode_cursor
 from app.schemas.grade import GradeRequest, GradingResultResponse
 from app.services import grade_service
 
@@ -35,16 +38,25 @@ async def grade_quiz(
     status_code=status.HTTP_200_OK,
 )
 async def get_grading_results_api(
+    request: Request,
     answersheet_id: int,
     page: int = Query(1, ge=1),  # 기본값은 1페이지부터 시작
     page_size: int = Query(6, ge=1),  # 기본값은 한 페이지에 6개 표시
-    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(None),  # 있으면 page 대신 커서 기준으로 조회
+    db: AsyncSession = Depends(get_read_db),
 ):
     results = await grade_service.get_grading_results_with_pagination(
-        answersheet_id, page, page_size, db
+        answersheet_id,
+        page,
+        page_size,
+        db,
+        cursor=decode_cursor(cursor) if cursor else None,
     )
 
     if not results:
         raise HTTPException(status_code=404, detail="채점 결과를 찾을 수 없습니다.")
 
+    results.update(
+        cursor_links(request, results["next_cursor"], results["prev_cursor"])
+    )
     return results
@@ -0,0 +1,39 @@
+import hmac
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.core.db_pool import pool_stats
+from app.core.hashing import password_hasher
+from app.core.public_routes import public_route
+
+router = APIRouter(prefix="/internal")
+
+
+async def verify_internal_token(x_internal_token: str | None = Header(None)):
+    """운영 API 토큰 검증 (토큰 미설정 시 엔드포인트 자체를 숨김)"""
+    if not settings.INTERNAL_API_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not x_internal_token or not hmac.compare_digest(
+        x_internal_token, settings.INTERNAL_API_TOKEN
+    ):
+        raise HTTPException(status_code=403, detail="Forbidden")
+
+
+@router.get("/db-pool", dependencies=[Depends(verify_internal_token)])
+@public_route
+async def get_db_pool_stats():
+    """
+    DB 커넥션 풀 현황 (사용자 JWT 대신 X-Internal-Token으로 보호)
+    """
+    return pool_stats(async_session.kw["bind"])
+
+
+@router.get("/password-hashing", dependencies=[Depends(verify_internal_token)])
+@public_route
+async def get_password_hashing_stats():
+    """
+    비밀번호 해싱 풀 현황 (실행 중 / 대기열 깊이 / 거절 수)
+    """
+    return password_hasher.stats()
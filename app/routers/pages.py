@@ -1,6 +1,8 @@
 from fastapi import APIRouter
 from fastapi.responses import FileResponse
 
+from app.core.public_routes import public_route
+
 router = APIRouter()
 
 
@@ -11,7 +13,17 @@ from fastapi import HTTPException
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 
+@router.get("/")
+@public_route
+async def read_root():
+    """
+    서버 동작 확인용 루트 엔드포인트
+    """
+    return {"message": "Welcome to Ticha AI Backend!"}
+
+
 @router.get("/index")
+@public_route
 async def serve_index_page():
     """
     index.html 파일 반환
@@ -23,6 +35,7 @@ async def serve_index_page():
 
 
 @router.get("/login")
+@public_route
 async def serve_login_page():
     """
     로그인 페이지 반환
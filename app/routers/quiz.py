@@ -1,10 +1,12 @@
 import logging
+from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.core.exceptions import ValidationError
+from app.core.pagination import cursor_links, decode_cursor
 from app.schemas.quiz import (
     QuizCreateRequest,
     QuizData,
@@ -43,12 +45,12 @@ async def create_quiz_endpoint(
             message="Quiz created successfully.",
         )
     except ValidationError as ve:
-        logger.error(f"Validation error: {ve.detail}")
+        logger.error("Validation error: %s", ve.detail)
         raise ve
     except HTTPException as he:
         raise he
     except Exception as e:
-        logger.error(f"Error creating quiz: {e}", exc_info=True)
+        logger.error("Error creating quiz: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={"code": "SERVER_ERROR", "message": "An unexpected error occurred."},
@@ -61,13 +63,22 @@ async def create_quiz_endpoint(
     status_code=status.HTTP_200_OK,
 )
 async def get_questions(
+    request: Request,
     quiz_id: int,
     page: int = Query(1, ge=1),
     limit: int = Query(5, ge=1),
+    cursor: Optional[str] = Query(None, description="next/prev 링크의 커서"),
     db: AsyncSession = Depends(get_db),
 ):
     """
     문제지의 문제 조회하는 API
+    cursor가 있으면 page 대신 커서 기준으로 조회
     """
-    response = await get_quiz_questions(db, quiz_id, page, limit)
+    response = await get_quiz_questions(
+        db, quiz_id, page, limit, decode_cursor(cursor) if cursor else None
+    )
+    pagination = response["data"]["pagination"]
+    pagination.update(
+        cursor_links(request, pagination["next_cursor"], pagination["prev_cursor"])
+    )
     return response
@@ -1,8 +1,10 @@
+from datetime import date, timedelta
+
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import get_read_db
 from app.schemas.study_dashboard import (
     CalendarStudyRecordsResponse,
     ChapterStatisticsResponse,
@@ -13,6 +15,10 @@ from app.services.study_dashboard_service import StudyDashboardService
 router = APIRouter()
 
 
+# 기간 조회 시 한 번에 조회할 수 있는 최대 일수 (연간 보기)
+MAX_CALENDAR_RANGE_DAYS = 366
+
+
 @router.get(
     "/calendars/study-records",
     response_model=CalendarStudyRecordsResponse,
@@ -20,26 +26,55 @@ router = APIRouter()
 )
 async def get_calendar_study_records(
     request: Request,
-    year: int = Query(..., description="Year to fetch records for"),
-    month: int = Query(..., description="Month to fetch records for", ge=1, le=12),
-    db: Session = Depends(get_db),
+    year: int | None = Query(None, description="Year to fetch records for"),
+    month: int | None = Query(
+        None, description="Month to fetch records for", ge=1, le=12
+    ),
+    date_from: date | None = Query(
+        None, alias="from", description="First day of the range (inclusive)"
+    ),
+    date_to: date | None = Query(
+        None, alias="to", description="Last day of the range (inclusive)"
+    ),
+    db: Session = Depends(get_read_db),
 ):
     """
     학습 대시보드의 캘린더 학습 기록을 조회합니다.
-    - 해당 월의 모든 날짜에 대한 학습 기록 여부
+    - 해당 월(year, month) 또는 기간(from ~ to)의 모든 날짜에 대한 학습 기록 여부
     - 학습한 날의 경우 관련 퀴즈 정보 포함
 
     Args:
         request (Request): 사용자 정보가 포함된 요청 객체
         year (int): 조회할 연도
         month (int): 조회할 월 (1-12)
+        date_from (date): 조회 시작일 (포함, 모바일 연간 보기 등 여러 달 조회)
+        date_to (date): 조회 종료일 (포함, 최대 366일)
 
     Returns:
         CalendarStudyRecordsResponse: 캘린더 학습 기록
     """
+    if date_from is not None or date_to is not None:
+        if date_from is None or date_to is None:
+            raise HTTPException(
+                status_code=422, detail="from과 to는 함께 지정해야 합니다."
+            )
+        if not 0 <= (date_to - date_from).days < MAX_CALENDAR_RANGE_DAYS:
+            raise HTTPException(
+                status_code=422,
+                detail=f"조회 기간은 1일 이상 {MAX_CALENDAR_RANGE_DAYS}일 이하여야 합니다.",
+            )
+    elif year is None or month is None:
+        raise HTTPException(
+            status_code=422, detail="year와 month 또는 from과 to를 지정해야 합니다."
+        )
+
     try:
         user = request.state.user
         service = StudyDashboardService(db)
+        if date_from is not None:
+            return await service.get_study_records_between(
+                user.id, date_from, date_to + timedelta(days=1)
+            )
         return await service.get_calendar_study_records(user.id, year, month)
     except Exception as e:
         raise HTTPException(
@@ -50,7 +85,7 @@ async def get_calendar_study_records(
 
 @router.get("/answer-sheets/in-progress", response_model=InProgressAnswerSheetResponse)
 async def get_in_progress_answer_sheets(
-    request: Request, db: AsyncSession = Depends(get_db)
+    request: Request, db: AsyncSession = Depends(get_read_db)
 ):
     """
     현재 로그인한 사용자가 진행 중인 답안지 목록을 조회합니다.
@@ -79,7 +114,9 @@ async def get_in_progress_answer_sheets(
 
 
 @router.get("/chapters/statistics", response_model=ChapterStatisticsResponse)
-async def get_chapter_statistics(request: Request, db: AsyncSession = Depends(get_db)):
+async def get_chapter_statistics(
+    request: Request, db: AsyncSession = Depends(get_read_db)
+):
 
     try:
         user = request.state.user
@@ -19,6 +19,15 @@ class TokenResponse(BaseModel):
     message: str = "Login successful"
 
 
+class TokenRefresh(BaseModel):
+    refresh_token: str
+
+
+class TokenRefreshResponse(BaseModel):
+    access_token: str
+    refresh_token: str
+
+
 class UserResponse(BaseModel):
     id: int
     email: str
@@ -35,3 +35,7 @@ class GradingResultResponse(BaseModel):
     problems: List[ProblemDetail]  # 문제별 상세 정보
     current_page: int  # 현재 페이지 번호
     total_pages: int  # 총 페이지 수
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (cursor 파라미터로 전달)
+    prev_cursor: Optional[str] = None  # 이전 페이지 커서
+    next: Optional[str] = None  # 다음 페이지 URL
+    prev: Optional[str] = None  # 이전 페이지 URL
@@ -13,6 +13,7 @@ class QuizCreateRequest(BaseModel):
 
 
 class QuizData(BaseModel):
+    quiz_id: int
     chapter_id: int
     question_count: int
     difficulty: str
@@ -32,6 +33,11 @@ class Pagination(BaseModel):
     total_pages: int
     limit: int
     total_questions: int
+    # 키셋 페이지네이션 (cursor 파라미터로 전달하는 불투명 값 / 해당 URL)
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+    next: Optional[str] = None
+    prev: Optional[str] = None
 
 
 class Question(BaseModel):
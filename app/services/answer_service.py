@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.core.exceptions import ValidationError
+from app.core.upsert import bulk_upsert
 from app.models import AnswerSheet, Quiz, UserAnswer
 from app.models.answer_sheet import AnswerSheetStatus
 from app.schemas.answer import AnswerCreate, AnswerSheetCreate
@@ -27,8 +28,9 @@ class AnswerService:
         """
         try:
             logger.info(
-                f"Starting to save answers for quiz {quiz_id} "
-                f"from user {answer_data.user_id}"
+                "Starting to save answers for quiz %s from user %s",
+                quiz_id,
+                answer_data.user_id,
             )
 
             async with self.db.begin():
@@ -40,7 +42,9 @@ class AnswerService:
                 for answer in answer_data.answers:
                     if answer.problem_id not in valid_problem_ids:
                         logger.error(
-                            f"Problem ID {answer.problem_id} is not part of quiz {quiz_id}"
+                            "Problem ID %s is not part of quiz %s",
+                            answer.problem_id,
+                            quiz_id,
                         )
                         raise ValidationError(
                             code="INVALID_PROBLEM",
@@ -48,20 +52,21 @@ class AnswerService:
                             details={"problem_id": answer.problem_id},
                         )
                 logger.debug("All provided problems are valid for this quiz")
-                logger.debug(f"Quiz {quiz_id} validated successfully")
+                logger.debug("Quiz %s validated successfully", quiz_id)
 
                 # 2. AnswerSheet 업데이트 또는 생성
                 answer_sheet = await self._upsert_answer_sheet(
                     quiz_id, answer_data.user_id, answer_data.passed_time
                 )
                 logger.debug(
-                    f"Answer sheet {'updated' if answer_sheet.id else 'created'} "
-                    f"with ID {answer_sheet.id}"
+                    "Answer sheet %s with ID %s",
+                    "updated" if answer_sheet.id else "created",
+                    answer_sheet.id,
                 )
 
                 # 3. 답변 저장
                 await self._save_user_answers(answer_sheet.id, answer_data.answers)
-                logger.debug(f"Saved {len(answer_data.answers)} answers successfully")
+                logger.debug("Saved %s answers successfully", len(answer_data.answers))
 
                 return {
                     "success": True,
@@ -70,10 +75,10 @@ class AnswerService:
                 }
 
         except ValidationError as ve:
-            logger.error(f"Validation error: {ve.detail}")
+            logger.error("Validation error: %s", ve.detail)
             raise ve
         except SQLAlchemyError as e:
-            logger.error(f"Database error while saving answers: {e}", exc_info=True)
+            logger.error("Database error while saving answers: %s", e, exc_info=True)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail={
@@ -82,7 +87,7 @@ class AnswerService:
                 },
             )
         except Exception as e:
-            logger.error(f"Unexpected error while saving answers: {e}", exc_info=True)
+            logger.error("Unexpected error while saving answers: %s", e, exc_info=True)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail={
@@ -107,8 +112,9 @@ class AnswerService:
 
         if not quiz:
             logger.error(
-                f"Quiz not found or not in progress. "
-                f"Quiz ID: {quiz_id}, User ID: {user_id}"
+                "Quiz not found or not in progress. Quiz ID: %s, User ID: %s",
+                quiz_id,
+                user_id,
             )
             raise ValidationError(
                 code="INVALID_QUIZ",
@@ -138,7 +144,7 @@ class AnswerService:
                 )
                 await self.db.execute(stmt)
                 await self.db.refresh(answer_sheet)
-                logger.debug(f"Updated answer sheet {answer_sheet.id}")
+                logger.debug("Updated answer sheet %s", answer_sheet.id)
             else:
                 answer_sheet = AnswerSheet(
                     quiz_id=quiz_id,
@@ -153,44 +159,33 @@ class AnswerService:
             return answer_sheet
 
         except SQLAlchemyError as e:
-            logger.error(f"Database error in answer sheet upsert: {e}", exc_info=True)
+            logger.error("Database error in answer sheet upsert: %s", e, exc_info=True)
             raise
 
     async def _save_user_answers(
         self, answer_sheet_id: int, answers: List[AnswerCreate]
     ) -> None:
-        """Save or update user answers."""
+        """Save or update user answers in a single upsert statement."""
         try:
-            for answer in answers:
-                stmt = (
-                    update(UserAnswer)
-                    .where(
-                        UserAnswer.answer_sheet_id == answer_sheet_id,
-                        UserAnswer.problem_id == answer.problem_id,
-                    )
-                    .values(
-                        user_answer=answer.selected_option,
-                        is_starred=answer.is_starred,
-                        has_answer=answer.selected_option is not None,
-                    )
-                )
-                result = await self.db.execute(stmt)
-
-                if result.rowcount == 0:
-                    new_answer = UserAnswer(
-                        answer_sheet_id=answer_sheet_id,
-                        problem_id=answer.problem_id,
-                        user_answer=answer.selected_option,
-                        is_starred=answer.is_starred,
-                        has_answer=answer.selected_option is not None,
-                    )
-                    self.db.add(new_answer)
-                    logger.debug(f"Created new answer for problem {answer.problem_id}")
-                else:
-                    logger.debug(f"Updated answer for problem {answer.problem_id}")
+            await bulk_upsert(
+                self.db,
+                UserAnswer,
+                [
+                    {
+                        "answer_sheet_id": answer_sheet_id,
+                        "problem_id": answer.problem_id,
+                        "user_answer": answer.selected_option,
+                        "is_starred": answer.is_starred,
+                        "has_answer": answer.selected_option is not None,
+                    }
+                    for answer in answers
+                ],
+                conflict_columns=("answer_sheet_id", "problem_id"),
+                update_columns=("user_answer", "is_starred", "has_answer"),
+            )
 
         except SQLAlchemyError as e:
-            logger.error(f"Database error in saving answers: {e}", exc_info=True)
+            logger.error("Database error in saving answers: %s", e, exc_info=True)
             raise
 
     async def get_answer_sheet_by_id(self, answersheet_id: int) -> AnswerSheet:
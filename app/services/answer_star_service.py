@@ -1,10 +1,11 @@
 from typing import List
 
 from fastapi import HTTPException, status
-from sqlalchemy import select, update
+from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.upsert import bulk_upsert
 from app.models import AnswerSheet, ProblemInQuiz, UserAnswer
 from app.schemas.answer_star import StarredProblem
 
@@ -13,9 +14,7 @@ async def update_star_status(
     db, answer_sheet_id: int, problem_id: int, is_starred: bool
 ) -> None:
     # 1. 해당 answer_sheet를 조회하여 quiz_id를 가져옴
-    query = select(AnswerSheet).where(AnswerSheet.id == answer_sheet_id)
-    result = await db.execute(query)
-    answer_sheet = result.scalar_one_or_none()
+    answer_sheet = await db.get(AnswerSheet, answer_sheet_id)
     if not answer_sheet:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -35,27 +34,22 @@ async def update_star_status(
             detail=f"문제 {problem_id}는 퀴즈 {quiz_id}에 포함되지 않습니다.",
         )
 
-    # 3. UserAnswer 테이블에서 해당 레코드를 별표 상태 업데이트
-    stmt = (
-        update(UserAnswer)
-        .where(
-            UserAnswer.answer_sheet_id == answer_sheet_id,
-            UserAnswer.problem_id == problem_id,
-        )
-        .values(is_starred=is_starred)
+    # 3. UserAnswer 별표 상태 upsert (레코드가 없으면 빈 답안으로 생성)
+    await bulk_upsert(
+        db,
+        UserAnswer,
+        [
+            {
+                "answer_sheet_id": answer_sheet_id,
+                "problem_id": problem_id,
+                "is_starred": is_starred,
+                "user_answer": None,
+                "has_answer": False,
+            }
+        ],
+        conflict_columns=("answer_sheet_id", "problem_id"),
+        update_columns=("is_starred",),
     )
-    result = await db.execute(stmt)
-
-    # 4. 레코드가 없으면 새 레코드 생성
-    if result.rowcount == 0:
-        new_answer = UserAnswer(
-            answer_sheet_id=answer_sheet_id,
-            problem_id=problem_id,
-            is_starred=is_starred,
-            user_answer=None,
-            has_answer=False,
-        )
-        db.add(new_answer)
 
     try:
         await db.commit()
@@ -1,24 +1,43 @@
+import logging
+
 from fastapi import HTTPException
-from passlib.context import CryptContext
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from app.auth.principal_cache import invalidate_principal
+from app.auth.token_store import RefreshTokenReuseError, refresh_token_store
+from app.core.hashing import HashingPoolSaturated, password_hasher
 from app.models.user import User
-from app.schemas.basic_auth import UserLogin, UserRegister
-from app.services.jwt_service import create_access_token, create_refresh_token
+from app.schemas.basic_auth import TokenRefresh, UserLogin, UserRegister
+from app.services.jwt_service import create_access_token
+
+logger = logging.getLogger(__name__)
 
-# 비밀번호 해싱을 위한 context 생성
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+def _hashing_unavailable() -> HTTPException:
+    # 해싱 대기열 포화 시 대기하지 않고 즉시 거절
+    logger.warning("Password hashing pool saturated: %s", password_hasher.stats())
+    return HTTPException(
+        status_code=503,
+        detail="로그인 요청이 많습니다. 잠시 후 다시 시도해주세요",
+        headers={"Retry-After": "1"},
+    )
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """비밀번호 검증"""
-    return pwd_context.verify(plain_password, hashed_password)
 
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """비밀번호 검증 (해싱 풀에서 실행)"""
+    try:
+        return await password_hasher.verify(plain_password, hashed_password)
+    except HashingPoolSaturated:
+        raise _hashing_unavailable()
 
-def get_password_hash(password: str) -> str:
-    """비밀번호 해싱"""
-    return pwd_context.hash(password)
+
+async def get_password_hash(password: str) -> str:
+    """비밀번호 해싱 (해싱 풀에서 실행)"""
+    try:
+        return await password_hasher.hash(password)
+    except HashingPoolSaturated:
+        raise _hashing_unavailable()
 
 
 async def register(db: AsyncSession, user_data: UserRegister):
@@ -29,13 +48,14 @@ async def register(db: AsyncSession, user_data: UserRegister):
         raise HTTPException(status_code=400, detail="이미 등록된 이메일입니다")
 
     # 비밀번호 해싱
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await get_password_hash(user_data.password)
 
     # 새 사용자 생성
     user = User(email=user_data.email, password=hashed_password, name=user_data.name)
     db.add(user)
     await db.commit()
     await db.refresh(user)
+    invalidate_principal(user.id)
 
     return {"id": user.id, "email": user.email, "name": user.name}
 
@@ -50,20 +70,30 @@ async def login(db: AsyncSession, user_data: UserLogin):
         raise HTTPException(status_code=400, detail="등록되지 않은 이메일입니다")
 
     # 비밀번호 검증
-    if not verify_password(user_data.password, user.password):
+    if not await verify_password(user_data.password, user.password):
         raise HTTPException(status_code=400, detail="비밀번호가 일치하지 않습니다")
 
     # 토큰 생성
     access_token = create_access_token(data={"user_id": user.id})
-    refresh_token = create_refresh_token(data={"user_id": user.id})
-
-    # refresh_token 저장
-    user.refresh_token = refresh_token
-    db.add(user)
-    await db.commit()
+    # refresh token family는 토큰 저장소에만 기록 (users 행은 갱신하지 않음)
+    refresh_token = await refresh_token_store.issue(user.id, db=db)
 
     return {
         "access_token": access_token,
         "refresh_token": refresh_token,
         "user": {"id": user.id, "email": user.email, "name": user.name},
     }
+
+
+async def refresh(db: AsyncSession, token_data: TokenRefresh):
+    """
+    refresh token으로 access/refresh token 재발급 (rotation)
+    users 테이블 조회 없이 토큰 family 저장소만 사용 (요청 세션을 그대로 넘김)
+    """
+    try:
+        return await refresh_token_store.rotate(token_data.refresh_token, db=db)
+    except RefreshTokenReuseError:
+        logger.warning("Refresh token reuse detected; token family revoked")
+        raise HTTPException(status_code=401, detail="Refresh token reuse detected")
+    except ValueError as e:
+        raise HTTPException(status_code=401, detail=str(e))
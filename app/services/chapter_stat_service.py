@@ -0,0 +1,149 @@
+import logging
+from typing import Iterable
+
+from sqlalchemy import Select, case, delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.upsert import bulk_upsert
+from app.models.answer_sheet import AnswerSheet, AnswerSheetStatus
+from app.models.grading_result import GradingResult
+from app.models.problem import Problem
+from app.models.user_chapter_stat import UserChapterStat
+
+logger = logging.getLogger(__name__)
+
+# chapter_id → (푼 문제 수, 정답 수)
+ChapterTotals = dict[int, tuple[int, int]]
+
+
+def chapter_totals(*where) -> Select:
+    """
+    채점된 답안지의 채점 결과를 (사용자, 단원)별로 집계하는 원본 쿼리
+    롤업 테이블의 기준값 (백필 / 정합성 확인 / 답안지 단위 증분에 공통 사용)
+
+    채점 결과는 채점 때만 쓰이므로, 채점 후 별표/답안 저장으로 생긴
+    UserAnswer 행은 채점 전까지 통계에 들어가지 않는다.
+    """
+    return (
+        select(
+            AnswerSheet.user_id,
+            Problem.chapter_id,
+            func.count(GradingResult.id).label("solved_count"),
+            func.sum(case((GradingResult.result == "correct", 1), else_=0)).label(
+                "correct_count"
+            ),
+        )
+        .join(AnswerSheet, AnswerSheet.id == GradingResult.answer_sheet_id)
+        .join(Problem, Problem.id == GradingResult.problem_id)
+        .where(AnswerSheet.status == AnswerSheetStatus.GRADED, *where)
+        .group_by(AnswerSheet.user_id, Problem.chapter_id)
+    )
+
+
+async def sheet_chapter_totals(db: AsyncSession, answer_sheet_id: int) -> ChapterTotals:
+    """답안지 하나가 단원 통계에 기여하는 양 (채점 상태가 아니면 빈 dict)"""
+    result = await db.execute(chapter_totals(AnswerSheet.id == answer_sheet_id))
+    return {row.chapter_id: (row.solved_count, row.correct_count) for row in result}
+
+
+async def apply_chapter_stats(
+    db: AsyncSession, user_id: int, before: ChapterTotals, after: ChapterTotals
+) -> None:
+    """
+    답안지 채점 전후 기여분의 차이만큼 롤업을 한 번의 upsert로 증감
+    (호출한 트랜잭션 안에서 반영)
+    """
+    rows = []
+    for chapter_id in before.keys() | after.keys():
+        solved_before, correct_before = before.get(chapter_id, (0, 0))
+        solved_after, correct_after = after.get(chapter_id, (0, 0))
+        delta = (solved_after - solved_before, correct_after - correct_before)
+        if delta != (0, 0):
+            rows.append(
+                {
+                    "user_id": user_id,
+                    "chapter_id": chapter_id,
+                    "solved_count": delta[0],
+                    "correct_count": delta[1],
+                }
+            )
+
+    await bulk_upsert(
+        db,
+        UserChapterStat,
+        rows,
+        conflict_columns=("user_id", "chapter_id"),
+        increment_columns=("solved_count", "correct_count"),
+    )
+
+
+async def backfill_chapter_stats(
+    db: AsyncSession, user_ids: Iterable[int] | None = None
+) -> int:
+    """
+    롤업을 원본 집계로 다시 채움 (user_ids가 없으면 전체)
+    DELETE + INSERT ... SELECT 두 문장으로 처리하고 채운 행 수를 반환
+    """
+    user_ids = list(user_ids) if user_ids is not None else None
+    stale = delete(UserChapterStat)
+    where = ()
+    if user_ids is not None:
+        stale = stale.where(UserChapterStat.user_id.in_(user_ids))
+        where = (AnswerSheet.user_id.in_(user_ids),)
+
+    await db.execute(stale)
+    result = await db.execute(
+        insert(UserChapterStat).from_select(
+            ["user_id", "chapter_id", "solved_count", "correct_count"],
+            chapter_totals(*where),
+        )
+    )
+    await db.commit()
+    return result.rowcount
+
+
+async def check_chapter_stats(
+    db: AsyncSession, user_ids: Iterable[int] | None = None
+) -> list[dict]:
+    """
+    롤업과 원본 집계를 비교해 어긋난 (사용자, 단원) 목록을 반환
+    각 항목: user_id, chapter_id, expected=(푼 수, 정답 수), actual=(...)
+    """
+    user_ids = list(user_ids) if user_ids is not None else None
+    live_query = chapter_totals()
+    rollup_query = select(
+        UserChapterStat.user_id,
+        UserChapterStat.chapter_id,
+        UserChapterStat.solved_count,
+        UserChapterStat.correct_count,
+    )
+    if user_ids is not None:
+        live_query = live_query.where(AnswerSheet.user_id.in_(user_ids))
+        rollup_query = rollup_query.where(UserChapterStat.user_id.in_(user_ids))
+
+    def by_key(rows) -> dict:
+        return {
+            (row.user_id, row.chapter_id): (row.solved_count, row.correct_count)
+            for row in rows
+        }
+
+    live = by_key(await db.execute(live_query))
+    rollup = by_key(await db.execute(rollup_query))
+
+    mismatches = []
+    for user_id, chapter_id in sorted(live.keys() | rollup.keys()):
+        expected = live.get((user_id, chapter_id), (0, 0))
+        actual = rollup.get((user_id, chapter_id), (0, 0))
+        if expected != actual:
+            mismatches.append(
+                {
+                    "user_id": user_id,
+                    "chapter_id": chapter_id,
+                    "expected": expected,
+                    "actual": actual,
+                }
+            )
+
+    if mismatches:
+        logger.warning("user_chapter_stats drift: %d rows", len(mismatches))
+    return mismatches
@@ -0,0 +1,125 @@
+import logging
+
+from sqlalchemy import ColumnElement, case, exists, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.answer_sheet import AnswerSheet, AnswerSheetStatus
+from app.models.chapter import Chapter
+from app.models.grading_result import GradingResult
+from app.models.problem import Problem
+from app.models.quiz import Quiz
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+# 채점이 끝난 답안지 상태 (복습 완료도 채점된 것으로 집계)
+FINISHED_STATUSES = (AnswerSheetStatus.GRADED, AnswerSheetStatus.REVIEWED)
+
+
+def _add(column, delta: int) -> ColumnElement:
+    """column + delta (감소는 0 아래로 내려가지 않도록, CHECK 제약 보호)"""
+    if delta >= 0:
+        return column + delta
+    return case((column >= -delta, column + delta), else_=0)
+
+
+async def add_to_user_counters(db: AsyncSession, user_id: int, **deltas: int) -> None:
+    """
+    User 카운터를 한 번의 UPDATE로 증감 (호출한 트랜잭션 안에서 반영)
+    예: add_to_user_counters(db, 1, ongoing_quizzes_count=-1, graded_quizzes_count=1)
+    """
+    values = {name: _add(getattr(User, name), d) for name, d in deltas.items() if d}
+    if not values:
+        return
+    await db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(values)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def add_problem_results(
+    db: AsyncSession, deltas: dict[int, tuple[int, int]]
+) -> None:
+    """
+    문제별 (시도 수, 정답 수) 증감을 한 번의 UPDATE ... CASE 로 반영
+    deltas: {problem_id: (attempt_delta, correct_delta)}
+    """
+    attempts = {pid: a for pid, (a, _) in deltas.items() if a}
+    corrects = {pid: c for pid, (_, c) in deltas.items() if c}
+    if not attempts and not corrects:
+        return
+
+    values = {}
+    if attempts:
+        values[Problem.attempt_count] = Problem.attempt_count + case(
+            attempts, value=Problem.id, else_=0
+        )
+    if corrects:
+        values[Problem.correct_count] = Problem.correct_count + case(
+            corrects, value=Problem.id, else_=0
+        )
+    await db.execute(
+        update(Problem)
+        .where(Problem.id.in_(attempts.keys() | corrects.keys()))
+        .values(values)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _expected_counters() -> dict:
+    """비정규화 카운터별 원본 테이블 기준 기댓값 (대상 행에 상관된 서브쿼리)"""
+
+    def count(*where) -> ColumnElement:
+        return select(func.count()).where(*where).scalar_subquery()
+
+    sheet_finished = AnswerSheet.status.in_(FINISHED_STATUSES)
+    return {
+        Problem.attempt_count: count(GradingResult.problem_id == Problem.id),
+        Problem.correct_count: count(
+            GradingResult.problem_id == Problem.id, GradingResult.result == "correct"
+        ),
+        Chapter.problems_count: count(Problem.chapter_id == Chapter.id),
+        User.ongoing_quizzes_count: count(
+            Quiz.user_id == User.id,
+            ~exists().where(AnswerSheet.quiz_id == Quiz.id, sheet_finished),
+        ),
+        User.graded_quizzes_count: count(
+            AnswerSheet.user_id == User.id, sheet_finished
+        ),
+        User.review_completed_quizzes_count: count(
+            AnswerSheet.user_id == User.id,
+            AnswerSheet.status == AnswerSheetStatus.REVIEWED,
+        ),
+    }
+
+
+async def reconcile_counters(db: AsyncSession, fix: bool = True) -> dict[str, int]:
+    """
+    카운터를 원본 행에서 일괄 재계산해 어긋난 행 수를 반환
+    fix=True면 어긋난 행을 카운터별 UPDATE 한 번으로 바로잡고 커밋
+
+    증분 갱신이 놓친 변경(배포 이전 데이터, 수동 수정, 실패한 요청)을 보정하는 용도
+    """
+    report = {}
+    for column, expected in _expected_counters().items():
+        model = column.class_
+        drifted = func.coalesce(column, -1) != expected
+        count = await db.scalar(select(func.count()).select_from(model).where(drifted))
+        report[f"{model.__tablename__}.{column.key}"] = count
+        if count and fix:
+            await db.execute(
+                update(model)
+                .where(drifted)
+                .values({column: expected})
+                .execution_options(synchronize_session=False)
+            )
+
+    if fix:
+        await db.commit()
+
+    drift = {name: count for name, count in report.items() if count}
+    if drift:
+        logger.warning("Counter drift %s: %s", "fixed" if fix else "found", drift)
+    return report
@@ -6,13 +6,17 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import joinedload
 
-from app.models.answer_sheet import AnswerSheet
+from app.core.pagination import Cursor, page_of, paginate
+from app.core.upsert import bulk_upsert
+from app.models.answer_sheet import AnswerSheet, AnswerSheetStatus
 from app.models.grading_result import GradingResult
 from app.models.problem import Problem
 from app.models.problem_in_quiz import ProblemInQuiz
 from app.models.quiz import Quiz
 from app.models.user_answer import UserAnswer
 from app.schemas.grade import AnswerGrade
+from app.services.chapter_stat_service import apply_chapter_stats, sheet_chapter_totals
+from app.services.counter_service import add_problem_results, add_to_user_counters
 
 
 async def grade_answer_sheet(
@@ -22,108 +26,151 @@ async def grade_answer_sheet(
     user_id: int,
 ):
 
-    # AnswerSheet 조회
-    result = await db.execute(
-        select(AnswerSheet).where(
-            AnswerSheet.id == answer_sheet_id,
-            AnswerSheet.user_id == user_id,
-        )
+    # AnswerSheet 조회 - 이전 채점 결과를 읽기 전에 행을 잠가서 (MySQL)
+    # 같은 답안지의 (재)채점이 동시에 오면 앞의 커밋 이후 결과를 기준으로 계산
+    answer_sheet = await db.scalar(
+        select(AnswerSheet)
+        .where(AnswerSheet.id == answer_sheet_id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
     )
-    answer_sheet = result.scalars().first()
-    if not answer_sheet:
+    if not answer_sheet or answer_sheet.user_id != user_id:
         return None
 
     # Quiz의 total_problems_count 가져오기
-    quiz_result = await db.execute(select(Quiz).where(Quiz.id == answer_sheet.quiz_id))
-    quiz = quiz_result.scalars().first()
+    quiz = await db.get(Quiz, answer_sheet.quiz_id)
     if not quiz:
         raise HTTPException(status_code=404, detail="퀴즈를 찾을 수 없습니다.")
 
     total_questions = quiz.total_problems_count
 
+    # 퀴즈에 포함된 문제들의 정답과 (재채점이면) 이전 채점 결과를 한 번에 조회
+    problem_ids = {answer.problem_id for answer in answers}
+    correct_answers_result = await db.execute(
+        select(Problem.id, Problem.correct_answer, GradingResult.result)
+        .join(ProblemInQuiz, ProblemInQuiz.problem_id == Problem.id)
+        .outerjoin(
+            GradingResult,
+            (GradingResult.answer_sheet_id == answer_sheet_id)
+            & (GradingResult.problem_id == Problem.id),
+        )
+        .where(
+            ProblemInQuiz.quiz_id == quiz.id,
+            ProblemInQuiz.problem_id.in_(problem_ids),
+        )
+    )
+    correct_answers = {}
+    previous_results = {}
+    for problem_id, correct_answer, previous_result in correct_answers_result.all():
+        correct_answers[problem_id] = correct_answer
+        previous_results[problem_id] = previous_result
+
     correct_count = 0
+    user_answer_rows = []
+    grading_result_rows = []
+    problem_deltas = {}  # problem_id → (시도 수 증감, 정답 수 증감)
 
-    # 사용자 답안 저장 및 정답 여부 확인
+    # 사용자 답안 정답 여부 확인
     for answer in answers:
         # 문제가 해당 퀴즈에 포함되어 있는지 확인
-        problem_in_quiz_result = await db.execute(
-            select(ProblemInQuiz).where(
-                ProblemInQuiz.quiz_id == quiz.id,
-                ProblemInQuiz.problem_id == answer.problem_id,
+        if answer.problem_id not in correct_answers:
+            raise HTTPException(
+                status_code=400,
+                detail=f"문제 {answer.problem_id}는 퀴즈 {quiz.id}에 포함되지 않습니다.",
             )
+
+        # 정답 여부 확인
+        is_correct = str(answer.selected_option) == str(
+            correct_answers[answer.problem_id]
         )
-    problem_in_quiz = problem_in_quiz_result.scalars().first()
-    if not problem_in_quiz:
-        raise HTTPException(
-            status_code=400,
-            detail=f"문제 {answer.problem_id}는 퀴즈 {quiz.id}에 포함되지 않습니다.",
+        user_answer_rows.append(
+            {
+                "answer_sheet_id": answer_sheet_id,
+                "problem_id": answer.problem_id,
+                "user_answer": answer.selected_option,
+                "has_answer": answer.selected_option is not None,
+                "is_correct": is_correct,  # 정답 여부 저장
+            }
+        )
+        grading_result_rows.append(
+            {
+                "answer_sheet_id": answer_sheet_id,
+                "problem_id": answer.problem_id,
+                "result": "correct" if is_correct else "incorrect",
+            }
         )
 
-    # 문제의 정답 가져오기
-    problem_result = await db.execute(
-        select(Problem).where(Problem.id == answer.problem_id)
-    )
-    problem = problem_result.scalars().first()
-    if not problem:
-        raise HTTPException(
-            status_code=404,
-            detail=f"문제를 찾을 수 없습니다. (ID: {answer.problem_id})",
+        if is_correct:
+            correct_count += 1
+
+        previous = previous_results[answer.problem_id]
+        problem_deltas[answer.problem_id] = (
+            0 if previous else 1,
+            int(is_correct) - int(previous == "correct"),
         )
 
-    # 정답 여부 확인
-    is_correct = str(answer.selected_option) == str(problem.correct_answer)
-    result_text = "correct" if is_correct else "incorrect"
+    # 재채점이면 이 답안지가 이미 단원 통계에 반영한 양을 먼저 구해 둠
+    previous_status = AnswerSheetStatus(answer_sheet.status)
+    chapter_totals_before = (
+        await sheet_chapter_totals(db, answer_sheet_id)
+        if previous_status == AnswerSheetStatus.GRADED
+        else {}
+    )
 
-    # UserAnswer 업데이트 또는 생성
-    stmt = (
-        update(UserAnswer)
+    # 답안지를 채점 완료 상태로 선점 - 읽은 상태와 채점 버전이 그대로일 때만
+    # (재채점은 GRADED→GRADED라 상태만으로는 구분되지 않으므로 버전도 비교)
+    # 지면 위에서 읽은 이전 결과가 낡은 것이므로 아무것도 쓰지 않고 409
+    transition = await db.execute(
+        update(AnswerSheet)
         .where(
-            UserAnswer.answer_sheet_id == answer_sheet_id,
-            UserAnswer.problem_id == answer.problem_id,
+            AnswerSheet.id == answer_sheet_id,
+            AnswerSheet.status == previous_status,
+            AnswerSheet.grade_version == answer_sheet.grade_version,
         )
         .values(
-            user_answer=answer.selected_option,
-            has_answer=answer.selected_option is not None,
-            is_correct=is_correct,  # 정답 여부 저장
+            status=AnswerSheetStatus.GRADED,
+            grade_version=AnswerSheet.grade_version + 1,
         )
+        .execution_options(synchronize_session=False)
     )
-    result = await db.execute(stmt)
-
-    if result.rowcount == 0:
-        # 새로 추가된 답안 처리
-        new_answer = UserAnswer(
-            answer_sheet_id=answer_sheet_id,
-            problem_id=answer.problem_id,
-            user_answer=answer.selected_option,
-            has_answer=answer.selected_option is not None,
-            is_correct=is_correct,  # 정답 여부 저장
+    if transition.rowcount != 1:
+        await db.rollback()
+        raise HTTPException(
+            status_code=409,
+            detail="같은 답안지의 다른 채점 요청이 먼저 처리되었습니다. 다시 시도해주세요.",
         )
-        db.add(new_answer)
 
-    # GradingResult
-    grading_result_stmt = (
-        update(GradingResult)
-        .where(
-            GradingResult.answer_sheet_id == answer_sheet_id,
-            GradingResult.problem_id == answer.problem_id,
-        )
-        .values(result=result_text)
+    # UserAnswer / GradingResult 각각 한 번의 upsert로 저장
+    await bulk_upsert(
+        db,
+        UserAnswer,
+        user_answer_rows,
+        conflict_columns=("answer_sheet_id", "problem_id"),
+        update_columns=("user_answer", "has_answer", "is_correct"),
+    )
+    await bulk_upsert(
+        db,
+        GradingResult,
+        grading_result_rows,
+        conflict_columns=("answer_sheet_id", "problem_id"),
+        update_columns=("result",),
     )
-    grading_result_update = await db.execute(grading_result_stmt)
 
-    if grading_result_update.rowcount == 0:
-        new_grading_result = GradingResult(
-            answer_sheet_id=answer_sheet_id,
-            problem_id=answer.problem_id,
-            result=result_text,
+    # 문제별 시도/정답 수는 이전 채점 결과와의 차이만큼 한 번에 증감
+    await add_problem_results(db, problem_deltas)
+    # 단원 통계 롤업은 답안지 기여분의 변화량만큼 증감
+    await apply_chapter_stats(
+        db,
+        user_id,
+        chapter_totals_before,
+        await sheet_chapter_totals(db, answer_sheet_id),
+    )
+    if previous_status == AnswerSheetStatus.IN_PROGRESS:
+        await add_to_user_counters(
+            db, user_id, ongoing_quizzes_count=-1, graded_quizzes_count=1
         )
-        db.add(new_grading_result)
-
-    if is_correct:
-        correct_count += 1
-
-    # 답안지 상태 업데이트 - 채점 완료 상태로
-    answer_sheet.status = "graded"
+    elif previous_status == AnswerSheetStatus.REVIEWED:
+        await add_to_user_counters(db, user_id, review_completed_quizzes_count=-1)
     await db.commit()
     await db.refresh(answer_sheet)
 
@@ -142,12 +189,10 @@ async def get_grading_results_with_pagination(
     page: int,
     page_size: int,
     db: AsyncSession,
+    cursor: Cursor | None = None,
 ):
     # 해당 답안지 AnswerSheet 조회
-    answer_sheet_query = await db.execute(
-        select(AnswerSheet).where(AnswerSheet.id == answer_sheet_id)
-    )
-    answer_sheet = answer_sheet_query.scalars().first()
+    answer_sheet = await db.get(AnswerSheet, answer_sheet_id)
     if not answer_sheet:
         raise HTTPException(status_code=404, detail="답안지를 찾을 수 없습니다.")
 
@@ -161,32 +206,38 @@ async def get_grading_results_with_pagination(
     if not quiz:
         raise HTTPException(status_code=404, detail="퀴즈를 찾을 수 없습니다.")
 
-    # ProblemInQuiz 기준으로 모든 문제 가져오기 (페이지네이션 적용)
+    # ProblemInQuiz 기준으로 페이지의 문제와 채점 결과/사용자 답안을 한 번에 조회
+    # (problem_number 기준 키셋 / 페이지 번호)
     problems_in_quiz_query = (
-        select(ProblemInQuiz, Problem)
-        .join(Problem, ProblemInQuiz.problem_id == Problem.id)
+        select(Problem, GradingResult, UserAnswer, ProblemInQuiz.problem_number)
+        .join(ProblemInQuiz, ProblemInQuiz.problem_id == Problem.id)
+        .outerjoin(
+            GradingResult,
+            (GradingResult.answer_sheet_id == answer_sheet_id)
+            & (GradingResult.problem_id == Problem.id),
+        )
+        .outerjoin(
+            UserAnswer,
+            (UserAnswer.answer_sheet_id == answer_sheet_id)
+            & (UserAnswer.problem_id == Problem.id),
+        )
         .where(ProblemInQuiz.quiz_id == quiz.id)
-        .offset((page - 1) * page_size)
-        .limit(page_size)
     )
-    problems_in_quiz = await db.execute(problems_in_quiz_query)
+    problems_in_quiz = await paginate(
+        db,
+        problems_in_quiz_query,
+        ProblemInQuiz.problem_number,
+        page_size,
+        key=lambda row: row.problem_number,
+        cursor=cursor,
+        page=page,
+    )
+    if cursor is not None:
+        first = problems_in_quiz.rows[0] if problems_in_quiz.rows else None
+        page = page_of(first.problem_number if first else cursor.key, page_size)
 
     problems = []
-    for problem_in_quiz, problem in problems_in_quiz.all():
-        # GradingResult와 UserAnswer 조회
-        grading_result_query = await db.execute(
-            select(GradingResult, UserAnswer)
-            .join(UserAnswer, GradingResult.problem_id == UserAnswer.problem_id)
-            .where(
-                GradingResult.answer_sheet_id == answer_sheet_id,
-                GradingResult.problem_id == problem.id,
-            )
-        )
-        result = grading_result_query.first()
-
-        grading_result = result[0] if result else None
-        user_answer = result[1] if result else None
-
+    for problem, grading_result, user_answer, _ in problems_in_quiz.rows:
         # 문제별 데이터 추가
         problems.append(
             {
@@ -222,4 +273,6 @@ async def get_grading_results_with_pagination(
         "problems": problems,
         "current_page": page,
         "total_pages": total_pages,
+        "next_cursor": problems_in_quiz.next_cursor,
+        "prev_cursor": problems_in_quiz.prev_cursor,
     }
@@ -1,11 +1,19 @@
+import hashlib
+import hmac
+import time
 from datetime import datetime, timedelta
 
 import jwt
 
+from app.core.cache import TTLCache
 from app.core.config import settings
 
-SECRET_KEY = settings.SECRET_KEY
-ALGORITHM = settings.ALGORITHM
+# ✅ 검증이 끝난 토큰 payload 캐시 (토큰 다이제스트 -> payload, 토큰 exp까지만 유지)
+_verified_tokens = TTLCache(
+    maxsize=settings.TOKEN_CACHE_MAX_SIZE,
+    ttl=settings.TOKEN_CACHE_MAX_TTL_SECONDS,
+)
+_verified_tokens_key: bytes | None = None
 
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
@@ -15,7 +23,7 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None) -> s
     to_encode = data.copy()
     expire = datetime.utcnow() + (expires_delta or timedelta(minutes=30))
     to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
 
 def create_refresh_token(data: dict, expires_delta: timedelta | None = None) -> str:
@@ -25,16 +33,59 @@ def create_refresh_token(data: dict, expires_delta: timedelta | None = None) ->
     to_encode = data.copy()
     expire = datetime.utcnow() + (expires_delta or timedelta(days=7))  # 기본 7일 만료
     to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+
+
+def _token_digest(token: str) -> bytes:
+    """
+    캐시 키로 쓰는 토큰 다이제스트
+
+    SECRET_KEY로 키잉한 HMAC이므로 키를 모르면 캐시 키를 만들거나 추측할 수 없고,
+    키가 바뀌면 이전 항목과 절대 같은 키가 나오지 않는다.
+    """
+    global _verified_tokens_key
+
+    key = hashlib.sha256(
+        f"{settings.ALGORITHM}:{settings.SECRET_KEY}".encode()
+    ).digest()
+    if _verified_tokens_key is None or not hmac.compare_digest(
+        key, _verified_tokens_key
+    ):
+        # SECRET_KEY(또는 알고리즘) 로테이션 -> 이전 키로 검증된 항목 모두 폐기
+        _verified_tokens.clear()
+        _verified_tokens_key = key
+
+    return hmac.new(key, token.encode(), hashlib.sha256).digest()
 
 
 def decode_token(token: str):
     """
     Access Token 또는 Refresh Token 디코딩
+    (한 번 검증된 토큰은 만료 시각까지 캐시된 payload 재사용)
     """
+    digest = _token_digest(token)
+    payload = _verified_tokens.get(digest)
+    if payload is not None:
+        return dict(payload)
+
     try:
-        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(
+            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+        )
     except jwt.ExpiredSignatureError:
         raise ValueError("Token expired")
     except jwt.InvalidTokenError:
         raise ValueError("Invalid token")
+
+    # exp가 있는 토큰만 캐시 (exp가 지나면 캐시에서도 사라짐)
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        ttl = min(exp - time.time(), _verified_tokens.ttl)
+        _verified_tokens.set(digest, dict(payload), ttl=ttl)
+
+    return payload
+
+
+def token_cache_stats() -> dict:
+    """검증 토큰 캐시 hit/miss 통계"""
+    return _verified_tokens.stats()
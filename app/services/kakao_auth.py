@@ -4,6 +4,7 @@ import httpx
 from fastapi import HTTPException
 
 from app.core.config import settings  # Assuming settings is defined in app.config
+from app.core.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -27,12 +28,11 @@ async def get_kakao_access_token(code: str, client_id: str, redirect_uri: str) -
         data["client_secret"] = settings.KAKAO_CLIENT_SECRET
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(token_url, headers=headers, data=data)
+        response = await get_http_client().post(token_url, headers=headers, data=data)
 
-        logger.debug(f"Kakao Token Request Data: {data}")  # ✅ 요청 데이터 로깅
-        logger.debug(f"Kakao Token Response Status: {response.status_code}")
-        logger.debug(f"Kakao Token Response Body: {response.text}")
+        logger.debug("Kakao Token Request Data: %s", data)  # ✅ 요청 데이터 로깅
+        logger.debug("Kakao Token Response Status: %s", response.status_code)
+        logger.debug("Kakao Token Response Body: %s", response.text)
 
         if response.status_code != 200:
             raise HTTPException(
@@ -52,7 +52,7 @@ async def get_kakao_access_token(code: str, client_id: str, redirect_uri: str) -
         return access_token
 
     except httpx.RequestError as e:
-        logger.error(f"HTTP request error while getting Kakao token: {str(e)}")
+        logger.error("HTTP request error while getting Kakao token: %s", e)
         raise HTTPException(status_code=500, detail="Kakao login request failed")
 
 
@@ -63,8 +63,7 @@ async def get_kakao_profile(access_token: str) -> dict:
     profile_url = "https://kapi.kakao.com/v2/user/me"
     headers = {"Authorization": f"Bearer {access_token}"}
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(profile_url, headers=headers)
-        if response.status_code == 200:
-            return response.json()
-        response.raise_for_status()
+    response = await get_http_client().get(profile_url, headers=headers)
+    if response.status_code == 200:
+        return response.json()
+    response.raise_for_status()
@@ -6,16 +6,17 @@ from fastapi import HTTPException, status
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
-from sqlalchemy.sql import func
 
 from app.core.exceptions import ValidationError
+from app.core.pagination import Cursor, page_of, paginate
+from app.core.upsert import bulk_upsert
 from app.models.chapter import Chapter
 from app.models.problem import Problem
 from app.models.problem_in_quiz import ProblemInQuiz
 from app.models.quiz import Quiz
 from app.models.study_log import StudyLog
 from app.schemas.quiz import QuizCreateRequest
+from app.services.counter_service import add_to_user_counters
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +36,7 @@ async def create_quiz(
         )
         chapter = result.scalars().first()
         if not chapter:
-            logger.error(f"Chapter with id {quiz_in.chapter_id} does not exist")
+            logger.error("Chapter with id %s does not exist", quiz_in.chapter_id)
             raise ValidationError(
                 code="INVALID_CHAPTER_ID",
                 message=f"Chapter with ID {quiz_in.chapter_id} does not exist.",
@@ -44,7 +45,7 @@ async def create_quiz(
 
         # 문제 수 유효성 검사
         if quiz_in.question_count not in ALLOWED_PROBLEM_COUNTS:
-            logger.error(f"Invalid question count: {quiz_in.question_count}")
+            logger.error("Invalid question count: %s", quiz_in.question_count)
             raise ValidationError(
                 code="INVALID_QUESTION_COUNT",
                 message="Invalid question count.",
@@ -55,7 +56,7 @@ async def create_quiz(
 
         # Difficulty  유효성 검사
         if quiz_in.difficulty not in ALLOWED_DIFFICULTY:
-            logger.error(f"Invalid difficulty level: {quiz_in.difficulty}")
+            logger.error("Invalid difficulty level: %s", quiz_in.difficulty)
             raise ValidationError(
                 code="VALIDATION_ERROR",
                 message="Invalid difficulty level.",
@@ -79,7 +80,9 @@ async def create_quiz(
         # 문제 개수 부족하면 오류 발생
         if len(problems) < quiz_in.question_count:
             logger.error(
-                f"Not enough problems in chapter {quiz_in.chapter_id} with difficulty {quiz_in.difficulty}."
+                "Not enough problems in chapter %s with difficulty %s.",
+                quiz_in.chapter_id,
+                quiz_in.difficulty,
             )
             raise ValidationError(
                 code="NOT_ENOUGH_PROBLEMS",
@@ -102,7 +105,7 @@ async def create_quiz(
             chapter_id=quiz_in.chapter_id,
         )
         db.add(new_quiz)
-        await db.commit()
+        await db.flush()
         await db.refresh(new_quiz)
 
         # 문제지와 문제 연결 (ProblemInQuiz 생성)
@@ -112,73 +115,61 @@ async def create_quiz(
             )
             db.add(problem_in_quiz)
 
+        # 문제지 / 문제 연결 / 진행 중 카운터를 한 트랜잭션으로 커밋
+        await add_to_user_counters(db, user_id, ongoing_quizzes_count=1)
         await db.commit()
 
         # StudyLog 생성 또는 업데이트
         try:
-            today = date.today()
-            study_log_query = select(StudyLog).where(
-                StudyLog.user_id == user_id, StudyLog.quiz_date == today
+            # 같은 날짜 행이 있으면 quiz_count만 1 증가 (동시 생성에도 중복 행 없음)
+            await bulk_upsert(
+                db,
+                StudyLog,
+                [{"user_id": user_id, "quiz_date": date.today(), "quiz_count": 1}],
+                conflict_columns=("user_id", "quiz_date"),
+                increment_columns=("quiz_count",),
             )
-            result = await db.execute(study_log_query)
-            study_log = result.scalar_one_or_none()
-
-            if study_log:
-                study_log.quiz_count += 1
-            else:
-                study_log = StudyLog(user_id=user_id, quiz_date=today, quiz_count=1)
-                db.add(study_log)
-
-            logger.info(f"Quiz created with id {new_quiz.id}")
-            return new_quiz
+            await db.commit()
         except SQLAlchemyError as e:
-            logger.error(f"StudyLog 업데이트 실패: {e}")
+            await db.rollback()
+            logger.error("StudyLog 업데이트 실패: %s", e)
             # StudyLog 실패는 퀴즈 생성에 영향을 주지 않도록 함
 
+        logger.info("Quiz created with id %s", new_quiz.id)
+        return new_quiz
+
     except SQLAlchemyError as e:
         await db.rollback()
-        logger.error(f"Database error: {e}", exc_info=True)
+        logger.error("Database error: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={"code": "DATABASE_ERROR", "message": "A database error occurred."},
         )
     except ValidationError as ve:
-        logger.error(f"Validation error: {ve.detail}")
+        logger.error("Validation error: %s", ve.detail)
         raise ve
     except Exception as e:
-        logger.error(f"Unexpected error: {e}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={"code": "SERVER_ERROR", "message": "An unexpected error occurred."},
         )
 
 
-async def get_quiz_questions(db: AsyncSession, quiz_id: int, page: int, limit: int):
-    offset = (page - 1) * limit
-
+async def get_quiz_questions(
+    db: AsyncSession,
+    quiz_id: int,
+    page: int,
+    limit: int,
+    cursor: Cursor | None = None,
+):
     # 퀴즈 존재 여부 확인
-    quiz_query = await db.execute(select(Quiz).filter(Quiz.id == quiz_id))
-    quiz = quiz_query.scalar_one_or_none()
+    quiz = await db.get(Quiz, quiz_id)
     if not quiz:
         raise HTTPException(status_code=404, detail="Quiz not found")
 
-    # 문제 조회 (Eager Loading)
-    problems_query = (
-        select(ProblemInQuiz)
-        .filter(ProblemInQuiz.quiz_id == quiz_id)
-        .options(selectinload(ProblemInQuiz.problem))
-        .offset(offset)
-        .limit(limit)
-    )
-    problems_result = await db.execute(problems_query)
-    problems = problems_result.scalars().all()
-
-    # 총 문제 개수 계산
-    total_query = select(func.count(ProblemInQuiz.id)).filter(
-        ProblemInQuiz.quiz_id == quiz_id
-    )
-    total_result = await db.execute(total_query)
-    total_count = total_result.scalar()
+    # 총 문제 개수는 퀴즈 생성 시 저장된 값 사용 (페이지마다 COUNT 하지 않음)
+    total_count = quiz.total_problems_count
 
     # 문제가 없는 경우 에러 처리
     if total_count == 0:
@@ -190,20 +181,36 @@ async def get_quiz_questions(db: AsyncSession, quiz_id: int, page: int, limit: i
     # 전체 페이지 수 계산
     total_pages = (total_count + limit - 1) // limit
 
-    if page > total_pages:
+    if cursor is None and page > total_pages:
         raise HTTPException(
             status_code=400,
             detail=f"Page {page} exceeds available pages. Max page is {total_pages}",
         )
 
+    # 문제 조회 (problem_number 기준 키셋 / 페이지 번호)
+    result = await paginate(
+        db,
+        select(ProblemInQuiz, Problem)
+        .join(Problem, Problem.id == ProblemInQuiz.problem_id)
+        .where(ProblemInQuiz.quiz_id == quiz_id),
+        ProblemInQuiz.problem_number,
+        limit,
+        key=lambda row: row[0].problem_number,
+        cursor=cursor,
+        page=page,
+    )
+    if cursor is not None:
+        first = result.rows[0] if result.rows else None
+        page = page_of(first[0].problem_number if first else cursor.key, limit)
+
     #  문제 데이터 변환
     questions = [
         {
-            "question_id": problem.problem_id,
-            "image_url": problem.problem.image_url if problem.problem.image_url else "",
-            "choices_count": problem.problem.choices_count,  # ✅ 선지 개수 반환으로 수정
+            "question_id": problem_in_quiz.problem_id,
+            "image_url": problem.image_url if problem.image_url else "",
+            "choices_count": problem.choices_count,  # ✅ 선지 개수 반환으로 수정
         }
-        for problem in problems
+        for problem_in_quiz, problem in result.rows
     ]
 
     return {
@@ -218,6 +225,8 @@ async def get_quiz_questions(db: AsyncSession, quiz_id: int, page: int, limit: i
                 "total_pages": total_pages,
                 "limit": limit,
                 "total_questions": total_count,
+                "next_cursor": result.next_cursor,
+                "prev_cursor": result.prev_cursor,
             },
         },
         "message": "Questions fetched successfully.",
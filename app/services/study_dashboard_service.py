@@ -1,19 +1,18 @@
 import logging
-from calendar import monthrange
-from datetime import date
+from datetime import date, datetime, time, timedelta
 
 from fastapi import HTTPException, status
-from sqlalchemy import Integer, extract, func, select
+from sqlalchemy import Select, func, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from app.models.answer_sheet import AnswerSheet, AnswerSheetStatus
 from app.models.chapter import Chapter
-from app.models.problem import Problem
 from app.models.quiz import Quiz
 from app.models.study_log import StudyLog
 from app.models.user_answer import UserAnswer
+from app.models.user_chapter_stat import UserChapterStat
 from app.schemas.study_dashboard import (
     CalendarStudyRecordsResponse,
     ChapterStatistics,
@@ -26,6 +25,34 @@ from app.schemas.study_dashboard import (
 logger = logging.getLogger(__name__)
 
 
+def month_range(year: int, month: int) -> tuple[date, date]:
+    """해당 월의 반열린 구간 [1일, 다음 달 1일)"""
+    start = date(year, month, 1)
+    end = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+    return start, end
+
+
+# ✅ 날짜 컬럼에 함수를 씌우지 않는 범위 조건이라 (user_id, 날짜) 인덱스 range scan 가능
+def study_logs_between(user_id: int, start: date, end: date) -> Select:
+    return select(StudyLog).where(
+        StudyLog.user_id == user_id,
+        StudyLog.quiz_date >= start,
+        StudyLog.quiz_date < end,
+    )
+
+
+def quizzes_between(user_id: int, start: date, end: date) -> Select:
+    return (
+        select(Quiz)
+        .where(
+            Quiz.user_id == user_id,
+            Quiz.created_at >= datetime.combine(start, time.min),
+            Quiz.created_at < datetime.combine(end, time.min),
+        )
+        .options(joinedload(Quiz.answer_sheets), joinedload(Quiz.chapter))
+    )
+
+
 class StudyDashboardService:
     def __init__(self, db: AsyncSession):
         self.db = db
@@ -40,27 +67,21 @@ class StudyDashboardService:
                 detail="월은 1에서 12 사이의 값이어야 합니다.",
             )
 
+        return await self.get_study_records_between(user_id, *month_range(year, month))
+
+    async def get_study_records_between(
+        self, user_id: int, start: date, end: date
+    ) -> CalendarStudyRecordsResponse:
+        """[start, end) 기간의 날짜별 학습 기록 (여러 달도 한 번에 조회)"""
         try:
             # 1. StudyLog 조회
-            study_logs_query = select(StudyLog).where(
-                StudyLog.user_id == user_id,
-                extract("year", StudyLog.quiz_date) == year,
-                extract("month", StudyLog.quiz_date) == month,
+            study_logs_result = await self.db.execute(
+                study_logs_between(user_id, start, end)
             )
-            study_logs_result = await self.db.execute(study_logs_query)
             study_logs = study_logs_result.scalars().all()
 
-            # 2. 해당 월의 Quiz 조회
-            quizzes_query = (
-                select(Quiz)
-                .where(
-                    Quiz.user_id == user_id,
-                    extract("year", Quiz.created_at) == year,
-                    extract("month", Quiz.created_at) == month,
-                )
-                .options(joinedload(Quiz.answer_sheets), joinedload(Quiz.chapter))
-            )
-            quizzes_result = await self.db.execute(quizzes_query)
+            # 2. 해당 기간의 Quiz 조회
+            quizzes_result = await self.db.execute(quizzes_between(user_id, start, end))
             quizzes = quizzes_result.unique().scalars().all()
 
             # 날짜별 퀴즈 매핑
@@ -87,30 +108,24 @@ class StudyDashboardService:
                     }
                 )
 
+            # study_logs를 날짜별로 딕셔너리로 매핑
+            study_log_by_date = {log.quiz_date: log for log in study_logs}
+
             # 캘린더 데이터 구성
             calendar_data = []
-            _, last_day = monthrange(year, month)
-
-            for day in range(1, last_day + 1):
-                current_date = date(year, month, day)
-                # study_logs를 날짜별로 딕셔너리로 매핑
-                study_log_by_date = {log.quiz_date: log for log in study_logs}
-
-                # 딕셔너리에서 특정 날짜의 study_log를 조회
-                study_log = study_log_by_date.get(current_date)
-                quizzes = quiz_by_date.get(current_date, [])
-
+            for offset in range((end - start).days):
+                current_date = start + timedelta(days=offset)
                 calendar_data.append(
                     StudyRecordDay(
                         date=current_date,
-                        has_study=study_log is not None,
-                        quizzes=quizzes,
+                        has_study=current_date in study_log_by_date,
+                        quizzes=quiz_by_date.get(current_date, []),
                     )
                 )
 
             return CalendarStudyRecordsResponse(study_records=calendar_data)
         except SQLAlchemyError as e:
-            logger.error(f"데이터베이스 조회 중 오류 발생: {e}")
+            logger.error("데이터베이스 조회 중 오류 발생: %s", e)
             raise HTTPException(
                 status_code=500, detail="캘린더 기록을 조회하는 중 오류가 발생했습니다."
             )
@@ -119,8 +134,18 @@ class StudyDashboardService:
         self, user_id: int
     ) -> InProgressAnswerSheetResponse:
         try:
+            # user_answer 테이블에서 답안지별 공백이 아닌 답변 개수 (상관 서브쿼리)
+            answered_count = (
+                select(func.count(UserAnswer.id))
+                .where(
+                    UserAnswer.answer_sheet_id == AnswerSheet.id,
+                    UserAnswer.user_answer != "",  # 공백이 아닌 답변만 카운트
+                )
+                .correlate(AnswerSheet)
+                .scalar_subquery()
+            )
             query = (
-                select(AnswerSheet)
+                select(AnswerSheet, answered_count)
                 .where(
                     AnswerSheet.user_id == user_id,
                     AnswerSheet.status == AnswerSheetStatus.IN_PROGRESS.value,
@@ -128,21 +153,12 @@ class StudyDashboardService:
                 .options(joinedload(AnswerSheet.quiz))
             )
             result = await self.db.execute(query)
-            answer_sheets = result.scalars().all()
 
             # 응답 데이터 구성
             response_data = []
-            for answer_sheet in answer_sheets:
+            for answer_sheet, answered_count in result.all():
                 total_problems = answer_sheet.quiz.total_problems_count
 
-                # user_answer 테이블에서 해당 answer_sheet의 공백이 아닌 답변 개수 조회
-                answered_count_query = select(func.count(UserAnswer.id)).where(
-                    UserAnswer.answer_sheet_id == answer_sheet.id,
-                    UserAnswer.user_answer != "",  # 공백이 아닌 답변만 카운트
-                )
-                answered_count_result = await self.db.execute(answered_count_query)
-                answered_count = answered_count_result.scalar()
-
                 # 진행률 계산
                 progress_rate = (
                     (answered_count / total_problems * 100) if total_problems > 0 else 0
@@ -166,7 +182,7 @@ class StudyDashboardService:
             return InProgressAnswerSheetResponse(answer_sheets=response_data)
 
         except Exception as e:
-            logger.error(f"Error fetching in-progress answer sheets: {e}")
+            logger.error("Error fetching in-progress answer sheets: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to fetch in-progress answer sheets.",
@@ -174,25 +190,20 @@ class StudyDashboardService:
 
     async def get_chapter_statistics(self, user_id: int) -> ChapterStatisticsResponse:
         try:
-            # 단원별 통계 쿼리
+            # 단원별 통계는 채점 시 갱신되는 롤업 테이블에서 (user_id, chapter_id) 인덱스로 조회
             query = (
                 select(
-                    Problem.chapter_id,
+                    UserChapterStat.chapter_id,
                     Chapter.name.label("chapter_name"),
-                    func.count(UserAnswer.id).label("total_problems"),
-                    func.sum(UserAnswer.is_correct.cast(Integer)).label(
-                        "correct_answers"
-                    ),
+                    UserChapterStat.solved_count.label("total_problems"),
+                    UserChapterStat.correct_count.label("correct_answers"),
                 )
-                .join(UserAnswer, UserAnswer.problem_id == Problem.id)
-                .join(AnswerSheet, AnswerSheet.id == UserAnswer.answer_sheet_id)
-                .join(Chapter, Chapter.id == Problem.chapter_id)
+                .join(Chapter, Chapter.id == UserChapterStat.chapter_id)
                 .where(
-                    AnswerSheet.user_id == user_id,
-                    AnswerSheet.status
-                    == AnswerSheetStatus.GRADED.value,  # 채점이 완료된 답안지만
+                    UserChapterStat.user_id == user_id,
+                    UserChapterStat.solved_count > 0,
                 )
-                .group_by(Problem.chapter_id, Chapter.name)
+                .order_by(UserChapterStat.chapter_id)
             )
 
             result = await self.db.execute(query)
@@ -236,7 +247,7 @@ class StudyDashboardService:
             )
 
         except Exception as e:
-            logger.error(f"단원 통계를 조회하는 중 오류가 발생했습니다: {e}")
+            logger.error("단원 통계를 조회하는 중 오류가 발생했습니다: %s", e)
             raise HTTPException(
                 status_code=500,
                 detail="단원 통계를 조회하는 중 오류가 발생했습니다.",
@@ -4,6 +4,7 @@ from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from app.auth.principal_cache import invalidate_principal
 from app.models.user import User
 
 logger = logging.getLogger(__name__)
@@ -30,7 +31,7 @@ async def find_or_create_kakao_user(
         user = result.scalars().first()
 
         if user:
-            print(f"🔹 Existing Kakao User Found: {user.id}")
+            logger.debug("🔹 Existing Kakao User Found: %s", user.id)
             user.refresh_token = kakao_refresh_token
             user.last_login_at = datetime.utcnow()
 
@@ -55,11 +56,12 @@ async def find_or_create_kakao_user(
             await db.commit()
             await db.refresh(user)
 
-            print(f"🔹 New Kakao User Created: {user.id}")
+            logger.debug("🔹 New Kakao User Created: %s", user.id)
 
+        invalidate_principal(user.id)
         return user
 
     except Exception as e:
-        print(f"🔺 Kakao User Save Error: {e}")
+        logger.error("🔺 Kakao User Save Error: %s", e)
         await db.rollback()
         raise ValueError("Failed to create or find Kakao user")
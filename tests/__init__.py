@@ -0,0 +1,26 @@
+"""
+테스트 / 로컬 벤치마크 공용 패키지
+
+패키지 import 시점에 앱 필수 설정값의 기본값을 채워 두므로,
+.env나 MySQL 서버 없이도 테스트와 벤치마크를 실행할 수 있다.
+"""
+
+import os
+
+# ✅ app 모듈 import 전에 필수 설정값을 채워 둔다 (실제 값이 있으면 그대로 사용)
+for key, value in {
+    # 스키마는 tests.harness가 모델 metadata로 만든 SQLite DB에 생성
+    "DATABASE_URL": "sqlite+aiosqlite:///:memory:",
+    "KAKAO_CLIENT_ID": "test",
+    "KAKAO_CLIENT_SECRET": "test",
+    "KAKAO_REDIRECT_URI": "http://localhost/oauth/kakao/callback",
+    "GOOGLE_CLIENT_ID": "test",
+    "GOOGLE_CLIENT_SECRET": "test",
+    "GOOGLE_REDIRECT_URI": "http://localhost/oauth/google/callback",
+    "SECRET_KEY": "test-secret-key-for-local-runs-only",
+    "ALGORITHM": "HS256",
+    # 스키마가 없는 기본 DB에서도 토큰 발급이 되도록 (DB 백엔드는 개별 테스트에서)
+    "REFRESH_TOKEN_BACKEND": "memory",
+    "OAUTH_STATE_BACKEND": "memory",
+}.items():
+    os.environ.setdefault(key, value)
@@ -0,0 +1,6 @@
+"""
+로컬 벤치마크 모음 (`python -m tests.benchmarks.<name>`으로 실행)
+
+필수 설정값의 기본값은 상위 tests 패키지에서 채워지므로,
+.env나 MySQL 서버 없이도 벤치마크를 실행할 수 있다.
+"""
@@ -0,0 +1,109 @@
+"""
+답안 저장: 행 단위 UPDATE→INSERT 와 벌크 upsert 비교
+
+    python -m tests.benchmarks.bench_bulk_upsert
+
+- row-by-row: 변경 전 동작 (답안마다 UPDATE 후 rowcount가 0이면 INSERT)
+- bulk upsert: 현재 동작 (답안지 전체를 한 번의 INSERT ... ON CONFLICT)
+
+30문항 답안지를 반복 저장하며 문장 수와 p50/p99를 측정한다.
+"""
+
+import asyncio
+import time
+
+from sqlalchemy import event, update
+
+from app.core.database import async_session
+from app.core.upsert import bulk_upsert
+from app.models.user_answer import UserAnswer
+from tests.benchmarks.common import print_table, summarize
+from tests.harness import init_database, seed
+
+PROBLEMS_PER_QUIZ = 30
+ROUNDS = 200
+
+
+async def save_row_by_row(db, answer_sheet_id: int, rows: list[dict]) -> None:
+    """변경 전 동작"""
+    for row in rows:
+        result = await db.execute(
+            update(UserAnswer)
+            .where(
+                UserAnswer.answer_sheet_id == answer_sheet_id,
+                UserAnswer.problem_id == row["problem_id"],
+            )
+            .values(user_answer=row["user_answer"], has_answer=True)
+        )
+        if result.rowcount == 0:
+            db.add(UserAnswer(**row))
+
+
+async def save_bulk(db, answer_sheet_id: int, rows: list[dict]) -> None:
+    await bulk_upsert(
+        db,
+        UserAnswer,
+        rows,
+        conflict_columns=("answer_sheet_id", "problem_id"),
+        update_columns=("user_answer", "has_answer"),
+    )
+
+
+async def run(save, sheets: list[tuple[int, list[int]]]) -> dict:
+    latencies = []
+    start = time.perf_counter()
+    for n in range(ROUNDS):
+        answer_sheet_id, problem_ids = sheets[n % len(sheets)]
+        rows = [
+            {
+                "answer_sheet_id": answer_sheet_id,
+                "problem_id": problem_id,
+                "user_answer": str(n % 5 + 1),
+                "has_answer": True,
+            }
+            for problem_id in problem_ids
+        ]
+        began = time.perf_counter()
+        async with async_session() as db:
+            await save(db, answer_sheet_id, rows)
+            await db.commit()
+        latencies.append(time.perf_counter() - began)
+    return summarize(latencies, time.perf_counter() - start)
+
+
+async def main() -> None:
+    engine = await init_database()
+    await seed(users=2, quizzes_per_user=10, problems_per_quiz=PROBLEMS_PER_QUIZ)
+
+    async with async_session() as db:
+        result = await db.execute(
+            UserAnswer.__table__.select().order_by(UserAnswer.answer_sheet_id)
+        )
+        by_sheet: dict[int, list[int]] = {}
+        for row in result.mappings():
+            by_sheet.setdefault(row["answer_sheet_id"], []).append(row["problem_id"])
+    sheets = list(by_sheet.items())
+
+    statements = 0
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def count(*_):
+        nonlocal statements
+        statements += 1
+
+    rows, counts = {}, {}
+    for name, save in (
+        ("row-by-row (before)", save_row_by_row),
+        ("bulk upsert", save_bulk),
+    ):
+        statements = 0
+        rows[name] = await run(save, sheets)
+        counts[name] = statements / ROUNDS
+
+    print_table(f"Saving a {PROBLEMS_PER_QUIZ}-answer sheet", rows)
+    print("statements per save:", {k: round(v, 1) for k, v in counts.items()})
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
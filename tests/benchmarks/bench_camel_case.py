@@ -0,0 +1,105 @@
+"""
+camelCase 키 변환 마이크로벤치마크
+
+    python -m tests.benchmarks.bench_camel_case
+
+- legacy: inflection.camelize를 모든 키마다 호출하는 재귀 변환
+- cached: 스키마 필드명으로 미리 채운 키 테이블 + 반복(스택) 변환
+"""
+
+import timeit
+from calendar import monthrange
+from datetime import date
+
+import inflection
+from fastapi.encoders import jsonable_encoder
+
+from app.core.responses import to_camel_case, warm_camel_case_keys
+from app.schemas.grade import GradingResultResponse, ProblemDetail
+from app.schemas.study_dashboard import (
+    CalendarStudyRecordsResponse,
+    QuizInfo,
+    StudyRecordDay,
+)
+
+ROUNDS = 2000
+
+
+def legacy_to_camel_case(data):
+    if isinstance(data, dict):
+        return {
+            inflection.camelize(str(k), uppercase_first_letter=False): (
+                legacy_to_camel_case(v)
+            )
+            for k, v in data.items()
+        }
+    elif isinstance(data, list):
+        return [legacy_to_camel_case(i) for i in data]
+    else:
+        return data
+
+
+def grading_response() -> dict:
+    """30문제 채점 결과 응답"""
+    problems = [
+        ProblemDetail(
+            problem_id=i,
+            user_answer=i % 5 + 1,
+            correct_answer=(i * 7) % 5 + 1,
+            is_correct=i % 3 == 0,
+            is_starred=i % 4 == 0,
+        )
+        for i in range(1, 31)
+    ]
+    return jsonable_encoder(
+        GradingResultResponse(
+            total_questions=30,
+            correct_count=10,
+            passed_time="12:34",
+            chapter_name="Chapter 1",
+            difficulty="random",
+            problems=problems,
+            current_page=1,
+            total_pages=1,
+        )
+    )
+
+
+def calendar_response() -> dict:
+    """한 달(31일) 캘린더 응답, 하루 3개 퀴즈"""
+    _, last_day = monthrange(2025, 1)
+    days = [
+        StudyRecordDay(
+            date=date(2025, 1, day),
+            has_study=True,
+            quizzes=[
+                QuizInfo(quiz_id=day * 10 + n, title="Chapter 1", status="graded")
+                for n in range(3)
+            ],
+        )
+        for day in range(1, last_day + 1)
+    ]
+    return jsonable_encoder(CalendarStudyRecordsResponse(study_records=days))
+
+
+def main():
+    warm_camel_case_keys()
+
+    payloads = {
+        "grading (30 problems)": grading_response(),
+        "calendar (full month)": calendar_response(),
+    }
+
+    print(f"{'payload':<24}{'legacy(us)':>12}{'cached(us)':>12}{'speedup':>10}")
+    for name, payload in payloads.items():
+        assert to_camel_case(payload) == legacy_to_camel_case(payload)
+        legacy = timeit.timeit(lambda: legacy_to_camel_case(payload), number=ROUNDS)
+        cached = timeit.timeit(lambda: to_camel_case(payload), number=ROUNDS)
+        print(
+            f"{name:<24}{legacy / ROUNDS * 1e6:>12.1f}{cached / ROUNDS * 1e6:>12.1f}"
+            f"{legacy / cached:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
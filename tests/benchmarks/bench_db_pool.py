@@ -0,0 +1,117 @@
+"""
+커넥션 풀 포화 부하 테스트
+
+    python -m tests.benchmarks.bench_db_pool
+
+풀 크기/overflow 조합별로 대시보드 엔드포인트에 동시 요청을 몰아넣고,
+/internal/db-pool 엔드포인트가 보여주는 체크아웃 대기 히스토그램과
+타임아웃 횟수를 함께 출력한다.
+"""
+
+import asyncio
+import logging
+import time
+
+import httpx
+from fastapi import FastAPI
+
+from app.core.config import settings
+from app.core.db_pool import InstrumentedAsyncPool
+from app.core.public_routes import route_policy
+from app.middleware.auth_middleware import AuthMiddleware
+from app.routers import internal, study_dashboard
+from tests.benchmarks.common import summarize
+from tests.harness import auth_headers, init_database, seed
+
+POOLS = [
+    # (pool_size, max_overflow)
+    (1, 0),
+    (4, 0),
+    (8, 16),
+]
+POOL_TIMEOUT_SECONDS = 0.5
+REQUESTS = 1500
+CONCURRENCY = 96
+INTERNAL_TOKEN = "bench-internal-token"
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(AuthMiddleware)
+    app.include_router(study_dashboard.router, prefix="/api/v1")
+    app.include_router(internal.router)
+    route_policy.compile(app)
+    return app
+
+
+async def run(pool_size: int, max_overflow: int) -> tuple[dict, dict, int]:
+    engine = await init_database(
+        poolclass=InstrumentedAsyncPool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=POOL_TIMEOUT_SECONDS,
+    )
+    await seed()
+    engine.sync_engine.pool.metrics.reset()  # 시딩 체크아웃 제외
+
+    headers = auth_headers(1)
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    failures = 0
+
+    transport = httpx.ASGITransport(app=build_app(), raise_app_exceptions=False)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+
+        async def one(n: int) -> float | None:
+            nonlocal failures
+            url = (
+                "/api/v1/answer-sheets/in-progress"
+                if n % 2
+                else "/api/v1/chapters/statistics"
+            )
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.get(url, headers=headers)
+                if response.status_code != 200:
+                    failures += 1
+                    return None
+                return time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(one(n) for n in range(REQUESTS)))
+        elapsed = time.perf_counter() - start
+
+        stats = (
+            await client.get(
+                "/internal/db-pool", headers={"X-Internal-Token": INTERNAL_TOKEN}
+            )
+        ).json()
+
+    await engine.dispose()
+    latencies = [latency for latency in results if latency is not None]
+    return summarize(latencies, elapsed), stats, failures
+
+
+async def main():
+    settings.INTERNAL_API_TOKEN = INTERNAL_TOKEN
+    # 풀 타임아웃마다 남는 에러 로그는 결과 표에서 제외
+    logging.disable(logging.CRITICAL)
+
+    print(f"\nDashboard burst: {REQUESTS} requests, concurrency {CONCURRENCY}")
+    for pool_size, max_overflow in POOLS:
+        summary, stats, failures = await run(pool_size, max_overflow)
+        print(
+            f"\npool_size={pool_size} max_overflow={max_overflow}: "
+            f"rps={summary['rps']:.1f} p50={summary['p50_ms']:.1f}ms "
+            f"p99={summary['p99_ms']:.1f}ms failed={failures}"
+        )
+        print(
+            f"  checkouts={stats['checkouts']} timeouts={stats['checkout_timeouts']} "
+            f"avg_wait={stats['avg_wait_ms']:.2f}ms max_wait={stats['max_wait_ms']:.1f}ms"
+        )
+        print(f"  wait histogram: {stats['wait_histogram']}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
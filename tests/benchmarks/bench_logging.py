@@ -0,0 +1,136 @@
+"""
+채점/답안 엔드포인트의 로깅 오버헤드 비교
+
+    python -m tests.benchmarks.bench_logging
+
+- before: engine echo=True + 루트 DEBUG basicConfig (동기 파일 핸들러)
+- after : 큐 핸들러 + SQL_LOG_LEVEL=WARNING + LOG_LEVEL=INFO
+
+두 경우 모두 로그는 임시 파일에 기록한다.
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+import tempfile
+import time
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy.future import select
+
+from app.core import logging_config
+from app.core.database import async_session
+from app.core.logging_config import setup_logging, shutdown_logging
+from app.core.public_routes import route_policy
+from app.middleware.auth_middleware import AuthMiddleware
+from app.middleware.logging_middleware import RequestLogContextMiddleware
+from app.models.problem_in_quiz import ProblemInQuiz
+from app.routers import answer, grade
+from tests.benchmarks.common import print_table, summarize, timed
+from tests.harness import auth_headers, init_database, seed
+
+SHEETS = range(1, 21)  # user 1의 답안지
+ROUNDS = 15
+CONCURRENCY = 8
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(AuthMiddleware)
+    app.add_middleware(RequestLogContextMiddleware)
+    app.include_router(answer.router, prefix="/api/v1")
+    app.include_router(grade.router, prefix="/api/v1")
+    route_policy.compile(app)
+    return app
+
+
+async def quiz_problems() -> dict[int, int]:
+    """답안지(= 퀴즈) id -> 그 퀴즈에 포함된 문제 id 하나"""
+    async with async_session() as db:
+        rows = await db.execute(
+            select(ProblemInQuiz.quiz_id, ProblemInQuiz.problem_id).where(
+                ProblemInQuiz.quiz_id.in_(SHEETS), ProblemInQuiz.problem_number == 1
+            )
+        )
+        return dict(rows.all())
+
+
+def requests_for(sheet_id: int, problem_id: int) -> list[tuple[str, str, dict]]:
+    grade_body = {"answers": [{"problem_id": problem_id, "selected_option": 1}]}
+    return [
+        ("GET", f"/api/v1/answers/{sheet_id}", {}),
+        ("GET", f"/api/v1/answers/{sheet_id}/grade", {}),
+        ("POST", f"/api/v1/answers/{sheet_id}/grade", {"json": grade_body}),
+    ]
+
+
+async def run(app: FastAPI, problems: dict[int, int]) -> dict:
+    headers = auth_headers(1)
+    calls = [
+        call for sheet in SHEETS for call in requests_for(sheet, problems[sheet])
+    ] * ROUNDS
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+
+        async def one(method: str, url: str, kwargs: dict) -> float:
+            async with semaphore:
+                return await timed(client, method, url, headers=headers, **kwargs)
+
+        for method, url, kwargs in calls[:3]:
+            await one(method, url, kwargs)
+
+        start = time.perf_counter()
+        latencies = await asyncio.gather(*(one(*call) for call in calls))
+        elapsed = time.perf_counter() - start
+
+    return summarize(latencies, elapsed)
+
+
+async def main():
+    engine = await init_database()
+    await seed()
+    problems = await quiz_problems()
+    app = build_app()
+    log_dir = tempfile.mkdtemp(prefix="ticha-bench-logs-")
+    root = logging.getLogger()
+
+    # after: 큐 기반 로깅
+    logging_config.settings.LOG_LEVEL = "INFO"
+    logging_config.settings.SQL_LOG_LEVEL = "WARNING"
+    with open(os.path.join(log_dir, "after.log"), "w") as log_file:
+        setup_logging(log_file)
+        after = await run(app, problems)
+        shutdown_logging()
+
+    # before: echo=True + DEBUG basicConfig (동기 I/O)
+    with open(os.path.join(log_dir, "before.log"), "w") as log_file:
+        with contextlib.redirect_stdout(log_file):
+            engine.echo = True  # echo 핸들러는 이 시점의 stdout에 연결됨
+        handler = logging.StreamHandler(log_file)
+        root.addHandler(handler)
+        root.setLevel(logging.DEBUG)
+        before = await run(app, problems)
+        root.removeHandler(handler)
+        engine.echo = False
+        logging.getLogger("sqlalchemy.engine.Engine").handlers.clear()
+
+    sizes = {
+        name: os.path.getsize(os.path.join(log_dir, f"{name}.log"))
+        for name in ("before", "after")
+    }
+    print_table(
+        "Grade/answer endpoints",
+        {"echo + DEBUG (before)": before, "queue logging (after)": after},
+    )
+    print(f"log bytes: {sizes}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,121 @@
+"""
+로그인 폭주 중 퀴즈 엔드포인트 지연 시간 비교
+
+    python -m tests.benchmarks.bench_login_burst
+
+- inline: 변경 전 동작 (bcrypt를 이벤트 루프에서 직접 실행)
+- pool  : 현재 동작 (해싱 전용 프로세스 풀에서 실행)
+
+로그인 요청을 동시에 쏟아붓는 동안 퀴즈 문제 조회 API의 p50/p99를 측정한다.
+"""
+
+import asyncio
+import time
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import update
+
+from app.core.database import async_session
+from app.core.hashing import hash_password_sync, password_hasher, verify_password_sync
+from app.core.public_routes import route_policy
+from app.middleware.auth_middleware import AuthMiddleware
+from app.models.user import User
+from app.routers import basic_auth, quiz
+from app.services import basic_auth_service
+from tests.benchmarks.common import print_table, summarize, timed
+from tests.harness import auth_headers, init_database, seed
+
+PASSWORD = "bench-password"
+LOGIN_BURST = 24
+QUIZ_CONCURRENCY = 4
+
+
+async def inline_verify_password(plain_password: str, hashed_password: str) -> bool:
+    """변경 전 동작: 이벤트 루프에서 bcrypt 검증"""
+    return verify_password_sync(plain_password, hashed_password)
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(AuthMiddleware)
+    app.include_router(basic_auth.router, prefix="/api/v1")
+    app.include_router(quiz.router, prefix="/api/v1")
+    route_policy.compile(app)
+    return app
+
+
+async def run(app: FastAPI, users: int) -> dict:
+    headers = auth_headers(1)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        # 워밍업 (풀 워커 기동 포함)
+        await timed(client, "GET", "/api/v1/quizzes/1/questions", headers=headers)
+        await client.post(
+            "/api/v1/auth/login",
+            json={"email": "user1@ticha.ai", "password": PASSWORD},
+        )
+
+        burst_done = asyncio.Event()
+        latencies: list[float] = []
+
+        async def quiz_reader(quiz_id: int):
+            while not burst_done.is_set():
+                latencies.append(
+                    await timed(
+                        client,
+                        "GET",
+                        f"/api/v1/quizzes/{quiz_id}/questions",
+                        headers=headers,
+                    )
+                )
+
+        async def login(n: int) -> int:
+            uid = n % users + 1
+            response = await client.post(
+                "/api/v1/auth/login",
+                json={"email": f"user{uid}@ticha.ai", "password": PASSWORD},
+            )
+            return response.status_code
+
+        start = time.perf_counter()
+        readers = [
+            asyncio.create_task(quiz_reader(n + 1)) for n in range(QUIZ_CONCURRENCY)
+        ]
+        statuses = await asyncio.gather(*(login(n) for n in range(LOGIN_BURST)))
+        burst_done.set()
+        await asyncio.gather(*readers)
+        elapsed = time.perf_counter() - start
+
+    result = summarize(latencies, elapsed)
+    print(f"login statuses: {sorted(set(statuses))}, hasher: {password_hasher.stats()}")
+    return result
+
+
+async def main():
+    engine = await init_database()
+    counts = await seed()
+    async with async_session() as db:
+        await db.execute(update(User).values(password=hash_password_sync(PASSWORD)))
+        await db.commit()
+
+    app = build_app()
+    pooled_verify = basic_auth_service.verify_password
+
+    basic_auth_service.verify_password = inline_verify_password
+    inline = await run(app, counts["users"])
+    basic_auth_service.verify_password = pooled_verify
+    pooled = await run(app, counts["users"])
+
+    print_table(
+        f"Quiz questions during a {LOGIN_BURST}-login burst",
+        {"inline bcrypt (before)": inline, "hashing pool (after)": pooled},
+    )
+    password_hasher.shutdown()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,94 @@
+"""
+미들웨어 스택 지연 시간 비교: BaseHTTPMiddleware(app.middleware("http")) vs 순수 ASGI
+
+    python -m tests.benchmarks.bench_middleware_stack
+
+GET /api/v1/quizzes/{id}/questions 를 in-process ASGI transport로 호출해
+p50/p99 지연 시간을 비교한다.
+"""
+
+import asyncio
+import time
+
+import httpx
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse
+
+from app.core.public_routes import is_public_path
+from app.core.responses import CamelCaseJSONResponse
+from app.middleware.auth_middleware import AuthMiddleware
+from app.routers import quiz
+from tests.benchmarks.common import print_table, summarize, timed
+from tests.harness import auth_headers, init_database, seed
+
+REQUESTS = 500
+ROUNDS = 4  # 두 스택을 번갈아 실행해 순서에 따른 편향을 줄임
+CONCURRENCY = 1  # 순차 호출로 미들웨어 자체 오버헤드만 비교
+
+
+async def legacy_auth_middleware(request: Request, call_next):
+    """변경 전 방식: 같은 인증 로직을 app.middleware("http")로 등록"""
+    if is_public_path(request.url.path, request.method):
+        return await call_next(request)
+    try:
+        request.state.user = AuthMiddleware.authenticate(request)
+        return await call_next(request)
+    except HTTPException as e:
+        return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
+
+def build_app(pure_asgi: bool) -> FastAPI:
+    app = FastAPI(default_response_class=CamelCaseJSONResponse)
+    if pure_asgi:
+        app.add_middleware(AuthMiddleware)
+    else:
+        app.middleware("http")(legacy_auth_middleware)
+    app.include_router(quiz.router, prefix="/api/v1")
+    return app
+
+
+async def run(app: FastAPI, headers: dict) -> tuple[list[float], float]:
+    url = "/api/v1/quizzes/1/questions?page=1&limit=5"
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        for _ in range(20):  # 워밍업
+            await timed(client, "GET", url, headers=headers)
+
+        async def one() -> float:
+            async with semaphore:
+                return await timed(client, "GET", url, headers=headers)
+
+        start = time.perf_counter()
+        latencies = await asyncio.gather(*(one() for _ in range(REQUESTS)))
+        elapsed = time.perf_counter() - start
+
+    return list(latencies), elapsed
+
+
+async def main():
+    engine = await init_database()
+    await seed()
+    headers = auth_headers(1)
+
+    apps = {
+        "BaseHTTPMiddleware": build_app(pure_asgi=False),
+        "pure ASGI": build_app(pure_asgi=True),
+    }
+    samples = {name: ([], 0.0) for name in apps}
+    for _ in range(ROUNDS):
+        for name, app in apps.items():
+            latencies, elapsed = await run(app, headers)
+            total, total_elapsed = samples[name]
+            samples[name] = (total + latencies, total_elapsed + elapsed)
+
+    results = {name: summarize(*sample) for name, sample in samples.items()}
+    print_table("GET /api/v1/quizzes/{id}/questions", results)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,92 @@
+"""
+대시보드 엔드포인트 requests/sec 비교: 사용자 즉시 로딩 vs 지연 로딩 principal
+
+    python -m tests.benchmarks.bench_principal
+
+- eager: 이전 auth_middleware 동작 (요청마다 별도 세션으로 users 조회)
+- lazy : 현재 auth_middleware (토큰 클레임만으로 Principal 생성)
+"""
+
+import asyncio
+import time
+
+import httpx
+from fastapi import FastAPI, Request
+from sqlalchemy.future import select
+
+from app.core.database import async_session
+from app.middleware.auth_middleware import AuthMiddleware
+from app.models.user import User
+from app.routers import study_dashboard
+from tests.benchmarks.common import print_table, summarize, timed
+from tests.harness import auth_headers, init_database, seed
+
+ENDPOINTS = [
+    "/api/v1/calendars/study-records?year={year}&month={month}",
+    "/api/v1/answer-sheets/in-progress",
+    "/api/v1/chapters/statistics",
+]
+REQUESTS_PER_ENDPOINT = 300
+CONCURRENCY = 10
+
+
+class EagerAuthMiddleware(AuthMiddleware):
+    """변경 전 동작: 모든 인증 요청마다 User 행 전체를 로드"""
+
+    async def __call__(self, scope, receive, send):
+        request = Request(scope)
+        user_id = self.authenticate(request).id
+        async with async_session() as db:
+            result = await db.execute(select(User).filter(User.id == user_id))
+            request.state.user = result.scalars().first()
+        await self.app(scope, receive, send)
+
+
+def build_app(middleware) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(middleware)
+    app.include_router(study_dashboard.router, prefix="/api/v1")
+    return app
+
+
+async def run(app: FastAPI, headers: dict) -> dict:
+    today = time.localtime()
+    urls = [
+        url.format(year=today.tm_year, month=today.tm_mon) for url in ENDPOINTS
+    ] * REQUESTS_PER_ENDPOINT
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        # 워밍업
+        for url in urls[: len(ENDPOINTS)]:
+            await timed(client, "GET", url, headers=headers)
+
+        async def one(url: str) -> float:
+            async with semaphore:
+                return await timed(client, "GET", url, headers=headers)
+
+        start = time.perf_counter()
+        latencies = await asyncio.gather(*(one(url) for url in urls))
+        elapsed = time.perf_counter() - start
+
+    return summarize(latencies, elapsed)
+
+
+async def main():
+    engine = await init_database()
+    await seed()
+    headers = auth_headers(1)
+
+    results = {
+        "eager (before)": await run(build_app(EagerAuthMiddleware), headers),
+        "lazy principal (after)": await run(build_app(AuthMiddleware), headers),
+    }
+    print_table("Dashboard endpoints", results)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
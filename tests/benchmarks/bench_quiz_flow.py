@@ -0,0 +1,118 @@
+"""
+전체 학습 흐름 부하 테스트 (MySQL / 네트워크 없이 로컬 SQLite)
+
+    python -m tests.benchmarks.bench_quiz_flow
+
+가상 사용자마다 실제 앱(app.main)에 대해 다음 흐름을 반복하고,
+단계별 p50/p99와 요청당 평균 쿼리 수(X-DB-Queries)를 출력한다.
+
+    퀴즈 생성 → 문제 조회 → 답안 저장 → 채점 → 채점 결과 → 대시보드
+"""
+
+import asyncio
+import time
+from collections import defaultdict
+from datetime import date
+
+import httpx
+
+from app.main import app
+from tests.benchmarks.common import print_table, summarize
+from tests.harness import auth_headers, init_database, seed
+
+USERS = 8
+ITERATIONS = 10
+QUESTIONS = 10
+
+
+async def flow(client: httpx.AsyncClient, user_id: int, record) -> None:
+    headers = auth_headers(user_id)
+
+    async def call(step: str, method: str, url: str, **kwargs) -> dict:
+        start = time.perf_counter()
+        response = await client.request(method, url, headers=headers, **kwargs)
+        record(step, time.perf_counter() - start, response)
+        response.raise_for_status()
+        return response.json()
+
+    created = await call(
+        "create quiz",
+        "POST",
+        "/api/v1/quizzes",
+        json={"chapter_id": 1, "question_count": QUESTIONS, "difficulty": "random"},
+    )
+    quiz_id = created["data"]["quizId"]
+    questions = await call(
+        "get questions", "GET", f"/api/v1/quizzes/{quiz_id}/questions?limit=10"
+    )
+    problem_ids = [q["questionId"] for q in questions["data"]["questions"]]
+
+    saved = await call(
+        "save answers",
+        "POST",
+        f"/api/v1/quizzes/{quiz_id}/answers",
+        json={
+            "user_id": user_id,
+            "passed_time": 120,
+            "answers": [
+                {"problem_id": pid, "selected_option": "1"} for pid in problem_ids
+            ],
+        },
+    )
+    sheet_id = saved["data"]["answerSheetId"]
+    await call(
+        "grade",
+        "POST",
+        f"/api/v1/answers/{sheet_id}/grade",
+        json={
+            "answers": [
+                {"problem_id": pid, "selected_option": 1} for pid in problem_ids
+            ]
+        },
+    )
+    await call("grade results", "GET", f"/api/v1/answers/{sheet_id}/grade")
+
+    today = date.today()
+    await call(
+        "calendar",
+        "GET",
+        f"/api/v1/calendars/study-records?year={today.year}&month={today.month}",
+    )
+    await call("in-progress", "GET", "/api/v1/answer-sheets/in-progress")
+
+
+async def main() -> None:
+    await init_database()
+    counts = await seed(users=USERS, chapters=3, problems_per_chapter=60)
+    print("seeded:", counts)
+
+    latencies: dict[str, list[float]] = defaultdict(list)
+    queries: dict[str, list[int]] = defaultdict(list)
+
+    def record(step: str, elapsed: float, response: httpx.Response) -> None:
+        latencies[step].append(elapsed)
+        queries[step].append(int(response.headers.get("X-DB-Queries", 0)))
+
+    async def virtual_user(user_id: int) -> None:
+        for _ in range(ITERATIONS):
+            await flow(client, user_id, record)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        start = time.perf_counter()
+        await asyncio.gather(*(virtual_user(uid) for uid in range(1, USERS + 1)))
+        elapsed = time.perf_counter() - start
+
+    print_table(
+        f"{USERS} users x {ITERATIONS} flows",
+        {step: summarize(values, elapsed) for step, values in latencies.items()},
+    )
+    print("avg queries per request:")
+    for step, values in queries.items():
+        print(f"  {step:<20}{sum(values) / len(values):>6.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,38 @@
+"""
+벤치마크 공용 유틸리티 (지연 시간 측정 / 결과 출력)
+
+DB 준비와 시딩은 tests.harness 참고
+"""
+
+import statistics
+import time
+
+
+def summarize(latencies: list[float], elapsed: float) -> dict:
+    """지연 시간(초) 목록을 p50/p99/rps 요약으로 변환"""
+    ordered = sorted(latencies)
+    p99_index = max(0, int(len(ordered) * 0.99) - 1)
+    return {
+        "requests": len(ordered),
+        "rps": len(ordered) / elapsed if elapsed else 0.0,
+        "p50_ms": statistics.median(ordered) * 1000,
+        "p99_ms": ordered[p99_index] * 1000,
+    }
+
+
+async def timed(client, method: str, url: str, **kwargs) -> float:
+    start = time.perf_counter()
+    response = await client.request(method, url, **kwargs)
+    elapsed = time.perf_counter() - start
+    response.raise_for_status()
+    return elapsed
+
+
+def print_table(title: str, rows: dict[str, dict]) -> None:
+    print(f"\n{title}")
+    print(f"{'variant':<24}{'requests':>10}{'rps':>12}{'p50(ms)':>12}{'p99(ms)':>12}")
+    for name, row in rows.items():
+        print(
+            f"{name:<24}{row['requests']:>10}{row['rps']:>12.1f}"
+            f"{row['p50_ms']:>12.2f}{row['p99_ms']:>12.2f}"
+        )
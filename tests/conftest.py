@@ -0,0 +1,48 @@
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.database import async_session
+
+
+@pytest.fixture(autouse=True)
+def restore_session_bind():
+    """harness.init_database가 바꾼 앱 세션 팩토리의 엔진을 테스트 후 원복"""
+    bind = async_session.kw["bind"]
+    yield
+    async_session.configure(bind=bind)
+
+
+@pytest.fixture
+def assert_max_queries():
+    """
+    블록 안에서 실행된 SQL 문 수가 예산을 넘으면 테스트 실패 (N+1 회귀 방지)
+
+        with assert_max_queries(3):
+            client.get("/api/v1/answers/1/grade")
+    """
+
+    @contextmanager
+    def check(budget: int):
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        # 모든 엔진 대상 (TestClient 스레드에서 실행되는 쿼리 포함)
+        event.listen(Engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(Engine, "before_cursor_execute", record)
+
+        if len(statements) > budget:
+            pytest.fail(
+                f"{len(statements)} queries executed, budget is {budget}:\n"
+                + "\n".join(statements),
+                pytrace=False,
+            )
+
+    return check
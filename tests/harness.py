@@ -0,0 +1,186 @@
+"""
+오프라인 테스트 / 부하 테스트 하니스
+
+MySQL 없이 로컬에서 돌릴 수 있도록 임시 SQLite(aiosqlite) 파일 DB에
+app.models metadata로 스키마를 만들고, 퀴즈→답안→채점→대시보드 흐름에
+필요한 데이터를 대량 insert로 빠르게 시딩한다.
+"""
+
+import os
+import random
+import tempfile
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+import app.models  # noqa: F401  (모든 모델을 metadata에 등록)
+from app.core.database import async_session
+from app.core.query_stats import install_query_stats
+from app.models.answer_sheet import AnswerSheet, AnswerSheetStatus
+from app.models.base import Base
+from app.models.chapter import Chapter
+from app.models.grading_result import GradingResult
+from app.models.problem import Problem
+from app.models.problem_in_quiz import ProblemInQuiz
+from app.models.quiz import Quiz
+from app.models.study_log import StudyLog
+from app.models.user import User
+from app.models.user_answer import UserAnswer
+from app.services.chapter_stat_service import backfill_chapter_stats
+from app.services.jwt_service import create_access_token
+
+
+async def init_database(path: str | None = None, **engine_kwargs) -> AsyncEngine:
+    """
+    SQLite 파일 DB에 모델 스키마를 만들고 앱 세션 팩토리를 그 DB로 연결
+    (path가 없으면 임시 디렉터리 사용, engine_kwargs는 풀 설정 등
+    create_async_engine 인자로 전달)
+    """
+    if path is None:
+        path = os.path.join(tempfile.mkdtemp(prefix="ticha-"), "ticha.db")
+    # 동시 쓰기(로그인 등)가 몰려도 잠금 대기 후 진행하도록 timeout 지정
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{path}", connect_args={"timeout": 30}, **engine_kwargs
+    )
+    install_query_stats(engine)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async_session.configure(bind=engine)
+    return engine
+
+
+async def seed(
+    users: int = 5,
+    chapters: int = 5,
+    problems_per_chapter: int = 40,
+    quizzes_per_user: int = 20,
+    problems_per_quiz: int = 10,
+) -> dict:
+    """대량 insert로 빠르게 시딩하고 생성된 id 범위를 반환"""
+    rng = random.Random(42)
+    today = date.today()
+    month_start = datetime(today.year, today.month, 1)
+
+    async with async_session() as db:
+        await db.execute(
+            insert(User),
+            [
+                {"id": uid, "name": f"user{uid}", "email": f"user{uid}@ticha.ai"}
+                for uid in range(1, users + 1)
+            ],
+        )
+        await db.execute(
+            insert(Chapter),
+            [
+                {"id": cid, "name": f"Chapter {cid}", "chapter_order": cid}
+                for cid in range(1, chapters + 1)
+            ],
+        )
+
+        problems = []
+        for cid in range(1, chapters + 1):
+            for _ in range(problems_per_chapter):
+                problems.append(
+                    {
+                        "id": len(problems) + 1,
+                        "chapter_id": cid,
+                        "difficulty": rng.choice(["easy", "medium", "hard"]),
+                        "correct_answer": str(rng.randint(1, 5)),
+                        "problem_text": "bench problem",
+                        "choices_count": 5,
+                    }
+                )
+        await db.execute(insert(Problem), problems)
+
+        quizzes, piqs, sheets, answers, results, logs = [], [], [], [], [], []
+        for uid in range(1, users + 1):
+            for n in range(quizzes_per_user):
+                quiz_id = len(quizzes) + 1
+                chapter_id = rng.randint(1, chapters)
+                created_at = month_start + timedelta(days=n % 28, hours=n % 12)
+                quizzes.append(
+                    {
+                        "id": quiz_id,
+                        "title": f"Quiz for Chapter {chapter_id}",
+                        "user_id": uid,
+                        "difficulty": "random",
+                        "total_problems_count": problems_per_quiz,
+                        "status": "in_progress",
+                        "chapter_id": chapter_id,
+                        "created_at": created_at,
+                    }
+                )
+                status = rng.choice(list(AnswerSheetStatus))
+                sheets.append(
+                    {
+                        "id": quiz_id,
+                        "quiz_id": quiz_id,
+                        "user_id": uid,
+                        "status": status,
+                        "passed_time": rng.randint(60, 900),
+                        "created_at": created_at,
+                    }
+                )
+                chapter_problems = [
+                    p for p in problems if p["chapter_id"] == chapter_id
+                ]
+                for number, problem in enumerate(
+                    rng.sample(chapter_problems, problems_per_quiz), start=1
+                ):
+                    piqs.append(
+                        {
+                            "quiz_id": quiz_id,
+                            "problem_id": problem["id"],
+                            "problem_number": number,
+                        }
+                    )
+                    selected = str(rng.randint(1, 5))
+                    is_correct = selected == problem["correct_answer"]
+                    answers.append(
+                        {
+                            "answer_sheet_id": quiz_id,
+                            "problem_id": problem["id"],
+                            "user_answer": selected,
+                            "is_correct": is_correct,
+                            "has_answer": True,
+                        }
+                    )
+                    # 채점이 끝난 답안지만 채점 결과 보유
+                    if status != AnswerSheetStatus.IN_PROGRESS:
+                        results.append(
+                            {
+                                "answer_sheet_id": quiz_id,
+                                "problem_id": problem["id"],
+                                "result": "correct" if is_correct else "incorrect",
+                            }
+                        )
+            for day in range(1, 29, 2):
+                logs.append(
+                    {
+                        "user_id": uid,
+                        "quiz_date": date(today.year, today.month, day),
+                        "quiz_count": 1,
+                    }
+                )
+
+        await db.execute(insert(Quiz), quizzes)
+        await db.execute(insert(ProblemInQuiz), piqs)
+        await db.execute(insert(AnswerSheet), sheets)
+        await db.execute(insert(UserAnswer), answers)
+        if results:
+            await db.execute(insert(GradingResult), results)
+        await db.execute(insert(StudyLog), logs)
+        await db.commit()
+
+        # 단원 통계 롤업은 채점 시 갱신되므로 직접 넣은 답안지는 백필로 반영
+        await backfill_chapter_stats(db)
+
+    return {"users": users, "quizzes": len(quizzes), "problems": len(problems)}
+
+
+def auth_headers(user_id: int) -> dict:
+    token = create_access_token({"user_id": user_id})
+    return {"Authorization": f"Bearer {token}"}
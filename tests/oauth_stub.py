@@ -0,0 +1,142 @@
+"""
+테스트용 로컬 OAuth 제공자 (Kakao/Google 흉내)
+
+실제 소켓 위에서 uvicorn을 백그라운드 스레드로 띄우고,
+요청이 들어온 클라이언트 (host, port)를 기록해 커넥션 재사용 여부를 측정한다.
+로컬에서 생성한 RSA 키로 서명한 id_token과 JWKS(/certs)도 제공한다.
+"""
+
+ISSUER = "https://accounts.google.com"
+
+import json
+import socket
+import threading
+import time
+from collections import Counter
+
+import jwt
+import uvicorn
+from cryptography.hazmat.primitives.asymmetric import rsa
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+
+class StubOAuthProvider:
+    def __init__(self, client_id: str = "stub-client-id"):
+        self.connections: set[tuple[str, int]] = set()
+        self.requests = 0
+        self.hits: Counter = Counter()
+
+        # id_token 서명용 키 (issue_id_token=True일 때만 토큰 응답에 포함)
+        self.client_id = client_id
+        self.issue_id_token = False
+        self.jwks_cache_control = "public, max-age=3600"
+        self.kid = "stub-key-1"
+        self.private_key = rsa.generate_private_key(
+            public_exponent=65537, key_size=2048
+        )
+        self.app = Starlette(
+            routes=[
+                Route("/oauth/token", self.token, methods=["POST"]),
+                Route("/v2/user/me", self.kakao_user, methods=["GET"]),
+                Route("/oauth2/v2/userinfo", self.google_user, methods=["GET"]),
+                Route("/certs", self.certs, methods=["GET"]),
+            ]
+        )
+        self._server: uvicorn.Server | None = None
+        self._thread: threading.Thread | None = None
+        self.port = 0
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            self.requests += 1
+            self.hits[scope["path"]] += 1
+            self.connections.add(tuple(scope["client"]))
+        await self.app(scope, receive, send)
+
+    async def token(self, request):
+        body = {
+            "access_token": "stub-access-token",
+            "refresh_token": "stub-refresh-token",
+            "expires_in": 3600,
+            "token_type": "bearer",
+        }
+        if self.issue_id_token:
+            body["id_token"] = self.sign_id_token()
+        return JSONResponse(body)
+
+    def sign_id_token(self, private_key=None, **claims) -> str:
+        now = int(time.time())
+        payload = {
+            "iss": ISSUER,
+            "aud": self.client_id,
+            "sub": "g-1234",
+            "email": "stub@gmail.com",
+            "name": "stub",
+            "iat": now,
+            "exp": now + 3600,
+            **claims,
+        }
+        return jwt.encode(
+            payload,
+            private_key or self.private_key,
+            algorithm="RS256",
+            headers={"kid": self.kid},
+        )
+
+    async def certs(self, request):
+        jwk = json.loads(
+            jwt.algorithms.RSAAlgorithm.to_jwk(self.private_key.public_key())
+        )
+        jwk.update({"kid": self.kid, "use": "sig", "alg": "RS256"})
+        return JSONResponse(
+            {"keys": [jwk]}, headers={"Cache-Control": self.jwks_cache_control}
+        )
+
+    async def kakao_user(self, request):
+        return JSONResponse(
+            {
+                "id": 1234,
+                "kakao_account": {
+                    "email": "stub@kakao.com",
+                    "profile": {"nickname": "stub", "profile_image_url": None},
+                },
+            }
+        )
+
+    async def google_user(self, request):
+        return JSONResponse({"id": "g-1234", "email": "stub@gmail.com", "name": "stub"})
+
+    def url(self, path: str) -> str:
+        return f"http://127.0.0.1:{self.port}{path}"
+
+    def reset(self) -> None:
+        self.connections.clear()
+        self.requests = 0
+        self.hits.clear()
+        self.issue_id_token = False
+
+    def start(self) -> "StubOAuthProvider":
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.bind(("127.0.0.1", 0))
+        self.port = sock.getsockname()[1]
+
+        config = uvicorn.Config(self, log_level="warning", lifespan="off")
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(
+            target=self._server.run, kwargs={"sockets": [sock]}, daemon=True
+        )
+        self._thread.start()
+
+        deadline = time.monotonic() + 5
+        while not self._server.started:
+            if time.monotonic() > deadline:
+                raise RuntimeError("stub OAuth provider did not start")
+            time.sleep(0.01)
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.should_exit = True
+            self._thread.join(timeout=5)
@@ -0,0 +1,98 @@
+import asyncio
+import json
+
+from fastapi import FastAPI
+
+from app.core import public_routes
+from app.core.exceptions import ValidationError
+from app.middleware.auth_middleware import AuthMiddleware
+from app.services.jwt_service import create_access_token
+
+
+def make_scope(path: str, token: str | None = None) -> dict:
+    headers = []
+    if token:
+        headers.append((b"authorization", f"Bearer {token}".encode()))
+    return {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": headers,
+        "scheme": "http",
+        "server": ("testserver", 80),
+    }
+
+
+def call(app, scope) -> list[dict]:
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    return messages
+
+
+async def streaming_app(scope, receive, send):
+    assert scope["state"]["user"].id == 7
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"a", "more_body": True})
+    await send({"type": "http.response.body", "body": b"b", "more_body": False})
+
+
+def test_streaming_response_passes_through_untouched():
+    token = create_access_token({"user_id": 7})
+    messages = call(AuthMiddleware(streaming_app), make_scope("/api/v1/x", token))
+
+    assert [m["type"] for m in messages] == [
+        "http.response.start",
+        "http.response.body",
+        "http.response.body",
+    ]
+    assert messages[1] == {
+        "type": "http.response.body",
+        "body": b"a",
+        "more_body": True,
+    }
+
+
+def test_missing_authorization_header_returns_401():
+    messages = call(AuthMiddleware(streaming_app), make_scope("/api/v1/x"))
+
+    assert messages[0]["status"] == 401
+    assert messages[1]["body"] == b'{"detail":"No authorization header"}'
+
+
+def test_public_path_skips_authentication(monkeypatch):
+    policy = public_routes.RoutePolicy()
+    policy.compile(FastAPI())
+    monkeypatch.setattr(public_routes, "route_policy", policy)
+
+    async def public_app(scope, receive, send):
+        assert "user" not in scope.get("state", {})
+        await send({"type": "http.response.start", "status": 204, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    messages = call(AuthMiddleware(public_app), make_scope("/docs"))
+    assert messages[0]["status"] == 204
+
+
+def test_auth_error_body_is_camel_cased(monkeypatch):
+    def reject(request):
+        raise ValidationError(
+            "TOKEN_SCOPE", "scope mismatch", details={"required_scope": "quiz"}
+        )
+
+    monkeypatch.setattr(AuthMiddleware, "authenticate", staticmethod(reject))
+    messages = call(AuthMiddleware(streaming_app), make_scope("/api/v1/x"))
+
+    assert messages[0]["status"] == 400
+    assert json.loads(messages[1]["body"])["detail"]["details"] == {
+        "requiredScope": "quiz"
+    }
@@ -0,0 +1,49 @@
+from app.core.cache import TTLCache
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ttl_cache_expires_entries():
+    timer = FakeTimer()
+    cache = TTLCache(maxsize=10, ttl=30, timer=timer)
+
+    cache.set(1, "user-1")
+    assert cache.get(1) == "user-1"
+
+    timer.now = 31
+    assert cache.get(1) is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=30, timer=FakeTimer())
+
+    cache.set(1, "a")
+    cache.set(2, "b")
+    cache.get(1)  # 1을 최근 사용으로 갱신
+    cache.set(3, "c")
+
+    assert cache.get(2) is None
+    assert cache.get(1) == "a"
+    assert cache.get(3) == "c"
+
+
+def test_ttl_cache_invalidate_and_stats():
+    cache = TTLCache(maxsize=10, ttl=30, timer=FakeTimer())
+
+    cache.set(1, "a")
+    cache.get(1)
+    cache.invalidate(1)
+    cache.get(1)
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+    assert stats["size"] == 0
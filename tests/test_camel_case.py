@@ -0,0 +1,98 @@
+import json
+
+import inflection
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from app.core.exceptions import ValidationError, http_exception_handler
+from app.core.responses import (
+    CamelCaseJSONResponse,
+    camelize_key,
+    to_camel_case,
+    warm_camel_case_keys,
+)
+
+PAYLOADS = [
+    {
+        "total_questions": 30,
+        "correct_count": 12,
+        "passed_time": "7:05",
+        "chapter_name": "일차방정식",
+        "problems": [
+            {"problem_id": 1, "user_answer": None, "is_starred": False},
+            {"problem_id": 2, "user_answer": 3, "is_correct": True},
+        ],
+        "score": 41.333333333333336,
+    },
+    {"study_records": [{"date": "2025-02-01", "has_study": True, "quizzes": []}]},
+    [{"answer_sheet_id": 1}, {"nested_list": [[{"deep_key": 1}]]}],
+    {"1": "non-string-key", "already_camel": {"quizId": 3}},
+]
+
+
+def legacy_to_camel_case(data):
+    if isinstance(data, dict):
+        return {
+            inflection.camelize(str(k), uppercase_first_letter=False): (
+                legacy_to_camel_case(v)
+            )
+            for k, v in data.items()
+        }
+    elif isinstance(data, list):
+        return [legacy_to_camel_case(i) for i in data]
+    else:
+        return data
+
+
+def legacy_camel_case_body(content) -> bytes:
+    """이전 camel case 미들웨어의 변환 결과 (직렬화 -> 파싱 -> 변환 -> 재직렬화)"""
+    parsed = json.loads(JSONResponse(content).body)
+    return JSONResponse(legacy_to_camel_case(parsed)).body
+
+
+def test_camel_case_response_matches_legacy_middleware_bytes():
+    for payload in PAYLOADS:
+        assert CamelCaseJSONResponse(payload).body == legacy_camel_case_body(payload)
+
+
+def test_to_camel_case_handles_deeply_nested_lists():
+    data = [{"deep_key": 1}]
+    for _ in range(5000):
+        data = [data]
+
+    converted = to_camel_case(data)
+    for _ in range(5000):
+        converted = converted[0]
+    assert converted == [{"deepKey": 1}]
+
+
+def test_warm_camel_case_keys_covers_schema_fields():
+    assert warm_camel_case_keys() > 0
+    assert camelize_key("answer_sheet_id") == "answerSheetId"
+    assert camelize_key("user_answers") == "userAnswers"
+
+
+def test_http_exception_detail_is_camel_cased():
+    app = FastAPI(default_response_class=CamelCaseJSONResponse)
+    app.add_exception_handler(ValidationError, http_exception_handler)
+
+    @app.get("/invalid")
+    async def invalid():
+        raise ValidationError(
+            code="INVALID_PROBLEM",
+            message="Problem 3 is not part of quiz 1",
+            details={"problem_id": 3},
+        )
+
+    @app.get("/ok")
+    async def ok():
+        return {"answer_sheet_id": 1}
+
+    client = TestClient(app)
+
+    assert client.get("/ok").json() == {"answerSheetId": 1}
+
+    response = client.get("/invalid")
+    assert response.status_code == 400
+    assert response.json()["detail"]["details"] == {"problemId": 3}
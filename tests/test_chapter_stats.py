@@ -0,0 +1,158 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import insert, select, update
+
+from app.core.database import async_session
+from app.main import app
+from app.models.answer_sheet import AnswerSheet
+from app.models.problem import Problem
+from app.models.problem_in_quiz import ProblemInQuiz
+from app.models.user_chapter_stat import UserChapterStat
+from app.schemas.grade import AnswerGrade
+from app.schemas.quiz import QuizCreateRequest
+from app.services.answer_star_service import update_star_status
+from app.services.chapter_stat_service import (
+    backfill_chapter_stats,
+    chapter_totals,
+    check_chapter_stats,
+)
+from app.services.grade_service import grade_answer_sheet
+from app.services.quiz_service import create_quiz
+from tests.harness import auth_headers, init_database, seed
+
+
+@pytest.fixture
+def database(tmp_path):
+    async def prepare():
+        engine = await init_database(str(tmp_path / "ticha.db"))
+        await seed(users=2, quizzes_per_user=6)
+        return engine
+
+    engine = asyncio.run(prepare())
+    yield
+    asyncio.run(engine.dispose())
+
+
+def run(scenario):
+    async def with_session():
+        async with async_session() as db:
+            return await scenario(db)
+
+    return asyncio.run(with_session())
+
+
+def test_endpoint_reads_rollup_matching_live_aggregate(database, assert_max_queries):
+    async def live(db):
+        rows = await db.execute(chapter_totals(AnswerSheet.user_id == 1))
+        return {row.chapter_id: (row.solved_count, row.correct_count) for row in rows}
+
+    expected = run(live)
+    assert expected
+
+    with TestClient(app, headers=auth_headers(1)) as client:
+        with assert_max_queries(1):
+            response = client.get("/api/v1/chapters/statistics")
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert {
+        s["chapterId"]: (s["solvedProblems"], s["correctAnswers"])
+        for s in body["statistics"]
+    } == expected
+    assert body["totalSolvedProblems"] == sum(s for s, _ in expected.values())
+
+
+def test_grading_updates_rollup_incrementally(database):
+    async def scenario(db):
+        quiz = await create_quiz(
+            db,
+            QuizCreateRequest(chapter_id=2, question_count=5, difficulty="random"),
+            user_id=1,
+        )
+        sheet_id = await db.scalar(
+            insert(AnswerSheet)
+            .values(quiz_id=quiz.id, user_id=1, status="in_progress")
+            .returning(AnswerSheet.id)
+        )
+        await db.commit()
+        correct = (
+            await db.execute(
+                select(Problem.id, Problem.correct_answer)
+                .join(ProblemInQuiz, ProblemInQuiz.problem_id == Problem.id)
+                .where(ProblemInQuiz.quiz_id == quiz.id)
+            )
+        ).all()
+
+        answers = [
+            AnswerGrade(problem_id=pid, selected_option=int(a)) for pid, a in correct
+        ]
+        await grade_answer_sheet(sheet_id, db, answers, user_id=1)
+        after_grading = await check_chapter_stats(db)
+
+        # 정답 하나를 미응답으로 바꿔 재채점해도 변화량만 반영
+        answers[0] = AnswerGrade(problem_id=answers[0].problem_id, selected_option=None)
+        await grade_answer_sheet(sheet_id, db, answers, user_id=1)
+        after_regrading = await check_chapter_stats(db)
+        return after_grading, after_regrading
+
+    assert run(scenario) == ([], [])
+
+
+def test_starring_unanswered_problem_after_grading_keeps_rollup(database):
+    async def scenario(db):
+        quiz = await create_quiz(
+            db,
+            QuizCreateRequest(chapter_id=3, question_count=5, difficulty="random"),
+            user_id=1,
+        )
+        sheet_id = await db.scalar(
+            insert(AnswerSheet)
+            .values(quiz_id=quiz.id, user_id=1, status="in_progress")
+            .returning(AnswerSheet.id)
+        )
+        await db.commit()
+        problem_ids = (
+            await db.scalars(
+                select(ProblemInQuiz.problem_id).where(ProblemInQuiz.quiz_id == quiz.id)
+            )
+        ).all()
+
+        # 마지막 문제는 답하지 않은 채 채점
+        answers = [
+            AnswerGrade(problem_id=pid, selected_option=1) for pid in problem_ids
+        ]
+        await grade_answer_sheet(sheet_id, db, answers[:-1], user_id=1)
+        rollup = select(UserChapterStat.solved_count).where(
+            UserChapterStat.user_id == 1, UserChapterStat.chapter_id == 3
+        )
+        before = await db.scalar(rollup)
+
+        # 채점 후 답하지 않은 문제에 별표 → UserAnswer 행만 새로 생김
+        await update_star_status(db, sheet_id, problem_ids[-1], True)
+        return before, await db.scalar(rollup), await check_chapter_stats(db)
+
+    before, after, drift = run(scenario)
+
+    assert after == before
+    assert drift == []
+
+
+def test_check_reports_drift_and_backfill_repairs_it(database):
+    async def scenario(db):
+        await db.execute(
+            update(UserChapterStat)
+            .where(UserChapterStat.user_id == 1)
+            .values(solved_count=UserChapterStat.solved_count + 1)
+        )
+        await db.commit()
+        drift = await check_chapter_stats(db)
+        await backfill_chapter_stats(db, user_ids=[1])
+        return drift, await check_chapter_stats(db)
+
+    drift, after = run(scenario)
+
+    assert drift and {m["user_id"] for m in drift} == {1}
+    assert all(m["actual"][0] == m["expected"][0] + 1 for m in drift)
+    assert after == []
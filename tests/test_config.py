@@ -0,0 +1,53 @@
+import pytest
+from pydantic import ValidationError
+
+from app.core.config import Settings
+
+REQUIRED = {
+    "KAKAO_CLIENT_ID": "k",
+    "KAKAO_CLIENT_SECRET": "k",
+    "KAKAO_REDIRECT_URI": "http://localhost/k",
+    "GOOGLE_CLIENT_ID": "g",
+    "GOOGLE_CLIENT_SECRET": "g",
+    "GOOGLE_REDIRECT_URI": "http://localhost/g",
+    "SECRET_KEY": "secret",
+    "ALGORITHM": "HS256",
+}
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    for name in ("DATABASE_URL", "DB_BACKEND", "SQLITE_PATH"):
+        monkeypatch.delenv(name, raising=False)
+    for name in ("USER", "PASSWORD", "HOST", "DATABASE", "ROOT_PASSWORD"):
+        monkeypatch.delenv(f"MYSQL_{name}", raising=False)
+
+
+def make_settings(**overrides) -> Settings:
+    return Settings(_env_file=None, **REQUIRED, **overrides)
+
+
+def test_mysql_url_built_from_mysql_settings():
+    settings = make_settings(
+        MYSQL_USER="u",
+        MYSQL_PASSWORD="p",
+        MYSQL_HOST="db",
+        MYSQL_PORT=3306,
+        MYSQL_DATABASE="ticha",
+    )
+    assert settings.DATABASE_URL == "mysql+asyncmy://u:p@db:3306/ticha"
+
+
+def test_sqlite_profile_needs_no_mysql_settings():
+    settings = make_settings(DB_BACKEND="sqlite", SQLITE_PATH="/tmp/ticha.db")
+    assert settings.DATABASE_URL == "sqlite+aiosqlite:////tmp/ticha.db"
+
+
+def test_explicit_database_url_wins():
+    settings = make_settings(DATABASE_URL="sqlite+aiosqlite:///:memory:")
+    assert settings.DATABASE_URL == "sqlite+aiosqlite:///:memory:"
+
+
+def test_missing_mysql_settings_are_reported():
+    with pytest.raises(ValidationError, match="MYSQL_USER, MYSQL_PASSWORD"):
+        make_settings()
@@ -0,0 +1,168 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import func, insert, select, update
+
+from app.core.database import async_session
+from app.models.answer_sheet import AnswerSheet
+from app.models.problem import Problem
+from app.models.problem_in_quiz import ProblemInQuiz
+from app.models.user import User
+from app.schemas.grade import AnswerGrade
+from app.schemas.quiz import QuizCreateRequest
+from app.services.chapter_stat_service import check_chapter_stats
+from app.services.counter_service import reconcile_counters
+from app.services.grade_service import grade_answer_sheet
+from app.services.quiz_service import create_quiz
+from tests.harness import init_database, seed
+
+
+@pytest.fixture
+def database(tmp_path):
+    async def prepare():
+        engine = await init_database(str(tmp_path / "ticha.db"))
+        await seed(users=2, quizzes_per_user=3)
+        async with async_session() as db:
+            await reconcile_counters(db)
+        return engine
+
+    engine = asyncio.run(prepare())
+    yield
+    asyncio.run(engine.dispose())
+
+
+async def user_counters(db, user_id: int) -> tuple[int, int, int]:
+    user = await db.get(User, user_id, populate_existing=True)
+    return (
+        user.ongoing_quizzes_count,
+        user.graded_quizzes_count,
+        user.review_completed_quizzes_count,
+    )
+
+
+async def drift(db) -> dict[str, int]:
+    report = await reconcile_counters(db, fix=False)
+    return {name: count for name, count in report.items() if count}
+
+
+def test_counters_follow_quiz_creation_and_grading(database):
+    async def scenario():
+        async with async_session() as db:
+            before = await user_counters(db, 1)
+            quiz = await create_quiz(
+                db,
+                QuizCreateRequest(chapter_id=1, question_count=5, difficulty="random"),
+                user_id=1,
+            )
+            created = await user_counters(db, 1)
+
+            sheet_id = await db.scalar(
+                insert(AnswerSheet)
+                .values(quiz_id=quiz.id, user_id=1, status="in_progress")
+                .returning(AnswerSheet.id)
+            )
+            await db.commit()
+            correct = dict(
+                (
+                    await db.execute(
+                        select(Problem.id, Problem.correct_answer)
+                        .join(ProblemInQuiz, ProblemInQuiz.problem_id == Problem.id)
+                        .where(ProblemInQuiz.quiz_id == quiz.id)
+                        .order_by(ProblemInQuiz.problem_number)
+                    )
+                ).all()
+            )
+
+            # 모두 정답으로 채점한 뒤, 하나만 오답으로 재채점
+            answers = [
+                AnswerGrade(problem_id=pid, selected_option=int(answer))
+                for pid, answer in correct.items()
+            ]
+            await grade_answer_sheet(sheet_id, db, answers, user_id=1)
+            graded = await user_counters(db, 1)
+            first_drift = await drift(db)
+
+            answers[0] = AnswerGrade(
+                problem_id=answers[0].problem_id, selected_option=None
+            )
+            await grade_answer_sheet(sheet_id, db, answers, user_id=1)
+            regraded = await user_counters(db, 1)
+            regrade_drift = await drift(db)
+            return before, created, graded, regraded, first_drift, regrade_drift
+
+    before, created, graded, regraded, first, again = asyncio.run(scenario())
+
+    ongoing, finished, reviewed = before
+    assert created == (ongoing + 1, finished, reviewed)
+    assert graded == (ongoing, finished + 1, reviewed)
+    # 재채점은 답안지 수를 바꾸지 않음
+    assert regraded == graded
+    assert first == {}
+    assert again == {}
+
+
+def test_concurrent_regrades_count_each_result_once(database):
+    """같은 답안지를 동시에 재채점해도 카운터/단원 통계가 결과와 일치"""
+
+    async def scenario():
+        async with async_session() as db:
+            sheet = await db.scalar(
+                select(AnswerSheet).where(AnswerSheet.status == "graded")
+            )
+            problem_ids = (
+                await db.scalars(
+                    select(ProblemInQuiz.problem_id).where(
+                        ProblemInQuiz.quiz_id == sheet.quiz_id
+                    )
+                )
+            ).all()
+
+        async def regrade(option: int):
+            async with async_session() as db:
+                answers = [
+                    AnswerGrade(problem_id=pid, selected_option=option)
+                    for pid in problem_ids
+                ]
+                return await grade_answer_sheet(
+                    sheet.id, db, answers, user_id=sheet.user_id
+                )
+
+        results = await asyncio.gather(
+            regrade(1), regrade(2), regrade(3), return_exceptions=True
+        )
+        async with async_session() as db:
+            return results, await drift(db), await check_chapter_stats(db)
+
+    results, counter_drift, chapter_drift = asyncio.run(scenario())
+
+    # 먼저 선점한 채점만 반영되고, 낡은 결과로 계산한 나머지는 409로 거절
+    assert any(isinstance(result, dict) for result in results)
+    assert all(
+        isinstance(result, dict)
+        or (isinstance(result, HTTPException) and result.status_code == 409)
+        for result in results
+    )
+    assert counter_drift == {}
+    assert chapter_drift == []
+
+
+def test_reconcile_reports_and_fixes_drift(database):
+    async def scenario():
+        async with async_session() as db:
+            await db.execute(update(User).values(graded_quizzes_count=99))
+            await db.execute(
+                update(Problem).where(Problem.id == 1).values(attempt_count=7)
+            )
+            await db.commit()
+
+            found = await drift(db)
+            fixed = await reconcile_counters(db)
+            return found, fixed, await drift(db)
+
+    found, fixed, after = asyncio.run(scenario())
+
+    assert found["users.graded_quizzes_count"] == 2
+    assert found["problems.attempt_count"] == 1
+    assert fixed["users.graded_quizzes_count"] == 2
+    assert after == {}
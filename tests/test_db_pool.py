@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import exc as sa_exc
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
+from app.core.db_pool import InstrumentedAsyncPool, PoolMetrics, pool_stats
+from app.main import app
+
+
+def make_engine(**kwargs):
+    return create_async_engine(
+        "sqlite+aiosqlite:///:memory:", poolclass=InstrumentedAsyncPool, **kwargs
+    )
+
+
+def test_wait_histogram_buckets():
+    metrics = PoolMetrics()
+    for wait_ms in (0.5, 3, 3, 700, 9000):
+        metrics.record_wait(wait_ms)
+
+    histogram = metrics.snapshot()["wait_histogram"]
+    assert histogram["le_1ms"] == 1
+    assert histogram["le_5ms"] == 2
+    assert histogram["le_1000ms"] == 1
+    assert histogram["inf"] == 1
+
+
+def test_checkout_timeout_is_counted():
+    engine = make_engine(pool_size=1, max_overflow=0, pool_timeout=0.05)
+
+    async def scenario():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            stats = pool_stats(engine)
+            assert stats["checked_out"] == 1
+            with pytest.raises(sa_exc.TimeoutError):
+                await engine.connect()
+        await engine.dispose()
+
+    asyncio.run(scenario())
+
+    stats = pool_stats(engine)
+    assert stats["checkouts"] == 1
+    assert stats["checkout_timeouts"] == 1
+
+
+def test_internal_endpoint_requires_token(monkeypatch):
+    client = TestClient(app)
+
+    monkeypatch.setattr(settings, "INTERNAL_API_TOKEN", None)
+    assert client.get("/internal/db-pool").status_code == 404
+
+    monkeypatch.setattr(settings, "INTERNAL_API_TOKEN", "ops-token")
+    assert client.get("/internal/db-pool").status_code == 403
+
+    response = client.get(
+        "/internal/db-pool", headers={"X-Internal-Token": "ops-token"}
+    )
+    assert response.status_code == 200
+    assert "checkoutTimeouts" in response.json()
@@ -0,0 +1,110 @@
+import asyncio
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from app.auth import google_auth
+from app.auth.jwks import JWKSCache, cache_max_age
+from app.core import http_client
+from app.core.config import settings
+from tests.oauth_stub import StubOAuthProvider
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(scope="module")
+def provider():
+    stub = StubOAuthProvider(client_id=settings.GOOGLE_CLIENT_ID).start()
+    yield stub
+    stub.stop()
+
+
+@pytest.fixture
+def oidc(provider, monkeypatch):
+    provider.reset()
+    provider.issue_id_token = True
+    timer = FakeTimer()
+    monkeypatch.setattr(google_auth, "GOOGLE_TOKEN_URL", provider.url("/oauth/token"))
+    monkeypatch.setattr(
+        google_auth, "google_jwks", JWKSCache(provider.url("/certs"), timer=timer)
+    )
+    return provider, timer
+
+
+def run(scenario):
+    async def wrapped():
+        await http_client.start_http_client()
+        try:
+            return await scenario()
+        finally:
+            await http_client.close_http_client()
+
+    return asyncio.run(wrapped())
+
+
+def test_id_token_verified_locally_without_userinfo(oidc):
+    provider, _ = oidc
+
+    async def scenario():
+        return [await google_auth.fetch_google_user("code") for _ in range(3)]
+
+    users = run(scenario)
+
+    assert users[0] == {"id": "g-1234", "email": "stub@gmail.com", "name": "stub"}
+    assert provider.hits["/oauth2/v2/userinfo"] == 0
+    assert provider.hits["/certs"] == 1  # JWKS는 캐시에서 재사용
+
+
+def test_jwks_refreshes_in_background_after_refresh_window(oidc):
+    provider, timer = oidc
+    provider.jwks_cache_control = "public, max-age=100"
+
+    async def scenario():
+        token = provider.sign_id_token()
+        await google_auth.verify_google_id_token(token)
+        timer.now += 90  # max-age의 80% 경과, 아직 만료 전
+        await google_auth.verify_google_id_token(token)
+        await google_auth.google_jwks._refresh_task
+
+    try:
+        run(scenario)
+    finally:
+        provider.jwks_cache_control = "public, max-age=3600"
+
+    assert provider.hits["/certs"] == 2
+
+
+def test_token_signed_with_unknown_key_is_rejected(oidc):
+    provider, _ = oidc
+    other_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    async def scenario():
+        await google_auth.verify_google_id_token(
+            provider.sign_id_token(private_key=other_key)
+        )
+
+    with pytest.raises(jwt.InvalidSignatureError):
+        run(scenario)
+
+
+def test_token_for_other_audience_is_rejected(oidc):
+    provider, _ = oidc
+
+    async def scenario():
+        await google_auth.verify_google_id_token(provider.sign_id_token(aud="other"))
+
+    with pytest.raises(jwt.InvalidAudienceError):
+        run(scenario)
+
+
+def test_cache_max_age_parsing():
+    assert cache_max_age("public, max-age=19845, must-revalidate") == 19845
+    assert cache_max_age("no-store") == 0
+    assert cache_max_age(None) == 3600
@@ -0,0 +1,83 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.hashing import HashingPoolSaturated, PasswordHasher
+from app.main import app
+
+
+def test_hash_and_verify_round_trip():
+    hasher = PasswordHasher(max_workers=1, max_pending=4, use_processes=False)
+
+    async def scenario():
+        hashed = await hasher.hash("secret")
+        return await hasher.verify("secret", hashed), await hasher.verify(
+            "wrong", hashed
+        )
+
+    try:
+        assert asyncio.run(scenario()) == (True, False)
+        assert hasher.stats()["backend"] == "thread"
+    finally:
+        hasher.shutdown()
+
+
+def test_saturated_queue_rejects_immediately():
+    hasher = PasswordHasher(max_workers=1, max_pending=2, use_processes=False)
+    release = threading.Event()
+
+    async def scenario():
+        running = asyncio.ensure_future(hasher._run(release.wait))
+        queued = asyncio.ensure_future(hasher._run(release.wait))
+        await asyncio.sleep(0.05)
+
+        stats = hasher.stats()
+        assert stats["running"] == 1
+        assert stats["queue_depth"] == 1
+
+        with pytest.raises(HashingPoolSaturated):
+            await hasher.hash("secret")
+        assert hasher.stats()["rejected"] == 1
+
+        release.set()
+        await asyncio.gather(running, queued)
+        assert hasher.stats()["queue_depth"] == 0
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        release.set()
+        hasher.shutdown()
+
+
+def test_process_pool_starts_eagerly_without_fork():
+    hasher = PasswordHasher(max_workers=1, max_pending=4, use_processes=True)
+
+    async def scenario():
+        await hasher.start()
+        backend = hasher.stats()["backend"]
+        return backend, await hasher.verify("secret", await hasher.hash("secret"))
+
+    try:
+        backend, verified = asyncio.run(scenario())
+        assert verified
+        if backend == "process":
+            assert hasher._executor._mp_context.get_start_method() != "fork"
+    finally:
+        hasher.shutdown()
+
+
+def test_internal_endpoint_exposes_queue_depth(monkeypatch):
+    monkeypatch.setattr(settings, "INTERNAL_API_TOKEN", "ops-token")
+    client = TestClient(app)
+
+    response = client.get(
+        "/internal/password-hashing", headers={"X-Internal-Token": "ops-token"}
+    )
+
+    assert response.status_code == 200
+    assert {"queueDepth", "running", "rejected"} <= response.json().keys()
+    assert client.get("/internal/password-hashing").status_code == 403
@@ -0,0 +1,75 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.auth import google_auth
+from app.core import http_client
+from app.services import kakao_service
+from tests.oauth_stub import StubOAuthProvider
+
+
+@pytest.fixture(scope="module")
+def provider():
+    stub = StubOAuthProvider().start()
+    yield stub
+    stub.stop()
+
+
+@pytest.fixture
+def stub_urls(provider, monkeypatch):
+    monkeypatch.setattr(kakao_service, "KAKAO_TOKEN_URL", provider.url("/oauth/token"))
+    monkeypatch.setattr(
+        kakao_service, "KAKAO_USER_INFO_URL", provider.url("/v2/user/me")
+    )
+    monkeypatch.setattr(google_auth, "GOOGLE_TOKEN_URL", provider.url("/oauth/token"))
+    monkeypatch.setattr(
+        google_auth, "GOOGLE_USER_INFO_URL", provider.url("/oauth2/v2/userinfo")
+    )
+    provider.reset()
+    return provider
+
+
+async def kakao_login() -> dict:
+    token = await kakao_service.get_kakao_access_token(
+        code="code", redirect_uri="http://localhost", client_id="id", client_secret=""
+    )
+    return await kakao_service.get_kakao_user_info(token["access_token"])
+
+
+def test_shared_client_reuses_one_connection(stub_urls):
+    async def scenario():
+        await http_client.start_http_client()
+        try:
+            for _ in range(3):
+                assert (await kakao_login())["email"] == "stub@kakao.com"
+                assert (await google_auth.fetch_google_user("code"))["id"] == "g-1234"
+        finally:
+            await http_client.close_http_client()
+
+    asyncio.run(scenario())
+
+    assert stub_urls.requests == 12
+    assert len(stub_urls.connections) == 1
+
+
+def test_client_per_call_opens_new_connections(stub_urls):
+    async def scenario():
+        for _ in range(3):
+            async with httpx.AsyncClient() as client:
+                await client.post(kakao_service.KAKAO_TOKEN_URL)
+
+    asyncio.run(scenario())
+
+    assert len(stub_urls.connections) == 3
+
+
+def test_client_has_explicit_timeouts():
+    client = http_client.create_http_client()
+    try:
+        assert (
+            client.timeout.connect == http_client.settings.HTTP_CONNECT_TIMEOUT_SECONDS
+        )
+        assert client.timeout.read == http_client.settings.HTTP_READ_TIMEOUT_SECONDS
+    finally:
+        asyncio.run(client.aclose())
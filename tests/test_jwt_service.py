@@ -0,0 +1,47 @@
+from datetime import timedelta
+
+import pytest
+
+from app.core.config import settings
+from app.services import jwt_service
+from app.services.jwt_service import (
+    create_access_token,
+    decode_token,
+    token_cache_stats,
+)
+
+
+def test_decode_token_reuses_verified_payload():
+    token = create_access_token({"user_id": 1})
+    before = token_cache_stats()
+
+    assert decode_token(token)["user_id"] == 1
+    assert decode_token(token)["user_id"] == 1
+
+    after = token_cache_stats()
+    assert after["misses"] == before["misses"] + 1
+    assert after["hits"] == before["hits"] + 1
+
+
+def test_cached_payload_expires_with_token(monkeypatch):
+    token = create_access_token({"user_id": 2}, expires_delta=timedelta(seconds=60))
+    decode_token(token)
+
+    cache = jwt_service._verified_tokens
+    now = cache._timer()
+    monkeypatch.setattr(cache, "_timer", lambda: now + 61)
+
+    # 캐시 항목은 토큰 exp 시점에 만료되어 다시 검증 경로를 탄다
+    misses = token_cache_stats()["misses"]
+    decode_token(token)
+    assert token_cache_stats()["misses"] == misses + 1
+
+
+def test_secret_key_rotation_invalidates_cache(monkeypatch):
+    token = create_access_token({"user_id": 3})
+    decode_token(token)
+
+    monkeypatch.setattr(settings, "SECRET_KEY", settings.SECRET_KEY + "-rotated")
+
+    with pytest.raises(ValueError, match="Invalid token"):
+        decode_token(token)
@@ -0,0 +1,64 @@
+import io
+import logging
+
+import pytest
+
+from app.core import logging_config
+from app.core.logging_config import (
+    RequestContextFilter,
+    RouteSampler,
+    request_path,
+    request_sampled,
+    setup_logging,
+    shutdown_logging,
+)
+
+
+@pytest.fixture
+def restore_levels():
+    root = logging.getLogger()
+    sql = logging.getLogger("sqlalchemy.engine")
+    levels = root.level, sql.level
+    yield
+    shutdown_logging()
+    root.setLevel(levels[0])
+    sql.setLevel(levels[1])
+
+
+def make_record(level: int) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 1, "msg %s", ("x",), None)
+
+
+def test_route_sampler_uses_longest_prefix():
+    sampler = RouteSampler(1.0, {"/api/v1/answers": 0.0, "/api/v1/answers/1": 1.0})
+
+    assert sampler.rate_for("/api/v1/answers/1/grade") == 1.0
+    assert sampler.rate_for("/api/v1/answers/2") == 0.0
+    assert sampler.rate_for("/api/v1/quizzes") == 1.0
+    assert not sampler.should_sample("/api/v1/answers/2")
+
+
+def test_unsampled_request_drops_only_low_level_records():
+    log_filter = RequestContextFilter()
+    path_token = request_path.set("/api/v1/answers/1")
+    sampled_token = request_sampled.set(False)
+    try:
+        info, warning = make_record(logging.INFO), make_record(logging.WARNING)
+        assert not log_filter.filter(info)
+        assert log_filter.filter(warning)
+        assert warning.path == "/api/v1/answers/1"
+    finally:
+        request_sampled.reset(sampled_token)
+        request_path.reset(path_token)
+
+
+def test_setup_logging_writes_through_queue(restore_levels, monkeypatch):
+    monkeypatch.setattr(logging_config.settings, "SQL_LOG_LEVEL", "WARNING")
+    stream = io.StringIO()
+    setup_logging(stream)
+
+    logging.getLogger("app.test").info("hello %s", "queue")
+    shutdown_logging()  # 리스너 종료 시 큐에 남은 레코드를 모두 기록
+
+    assert "hello queue" in stream.getvalue()
+    assert logging.getLogger("sqlalchemy.engine").level == logging.WARNING
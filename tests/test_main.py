@@ -1,6 +1,11 @@
+import asyncio
+from datetime import date
+
+import pytest
 from fastapi.testclient import TestClient
 
 from app.main import app
+from tests.harness import auth_headers, init_database, seed
 
 client = TestClient(app)
 
@@ -9,3 +14,145 @@ def test_read_root():
     response = client.get("/")
     assert response.status_code == 200
     assert response.json() == {"message": "Welcome to Ticha AI Backend!"}
+
+
+@pytest.fixture
+def seeded_client(tmp_path):
+    async def prepare():
+        engine = await init_database(str(tmp_path / "ticha.db"))
+        await seed(users=2, quizzes_per_user=3)
+        # 연결은 TestClient 이벤트 루프에서 새로 열도록 정리
+        await engine.dispose()
+
+    asyncio.run(prepare())
+    with TestClient(app, headers=auth_headers(1)) as c:
+        yield c
+
+
+def test_quiz_answer_grade_dashboard_flow(seeded_client):
+    """퀴즈 생성 → 문제 조회 → 답안 저장 → 채점 → 결과/대시보드 조회"""
+    created = seeded_client.post(
+        "/api/v1/quizzes",
+        json={"chapter_id": 1, "question_count": 5, "difficulty": "random"},
+    )
+    assert created.status_code == 201, created.text
+    quiz_id = created.json()["data"]["quizId"]
+
+    questions = seeded_client.get(f"/api/v1/quizzes/{quiz_id}/questions?limit=5")
+    assert questions.status_code == 200, questions.text
+    problem_ids = [q["questionId"] for q in questions.json()["data"]["questions"]]
+    assert len(problem_ids) == 5
+
+    saved = seeded_client.post(
+        f"/api/v1/quizzes/{quiz_id}/answers",
+        json={
+            "user_id": 1,
+            "passed_time": 95,
+            "answers": [
+                {"problem_id": pid, "selected_option": "1"} for pid in problem_ids
+            ],
+        },
+    )
+    assert saved.status_code == 201, saved.text
+    answer_sheet_id = saved.json()["data"]["answerSheetId"]
+
+    in_progress = seeded_client.get("/api/v1/answer-sheets/in-progress").json()
+    assert answer_sheet_id in [s["answerSheetId"] for s in in_progress["answerSheets"]]
+
+    graded = seeded_client.post(
+        f"/api/v1/answers/{answer_sheet_id}/grade",
+        json={
+            "answers": [
+                {"problem_id": pid, "selected_option": 1} for pid in problem_ids
+            ]
+        },
+    )
+    assert graded.status_code == 201, graded.text
+    assert graded.json()["totalQuestions"] == 5
+
+    results = seeded_client.get(
+        f"/api/v1/answers/{answer_sheet_id}/grade?page=1&page_size=5"
+    )
+    assert results.status_code == 200, results.text
+    assert results.json()["correctCount"] == graded.json()["correctCount"]
+    assert "X-DB-Queries" in results.headers
+
+    today = date.today()
+    calendar = seeded_client.get(
+        f"/api/v1/calendars/study-records?year={today.year}&month={today.month}"
+    )
+    assert calendar.status_code == 200, calendar.text
+    today_record = next(
+        d for d in calendar.json()["studyRecords"] if d["date"] == today.isoformat()
+    )
+    assert today_record["hasStudy"]
+
+
+def test_calendar_range_spans_multiple_months(seeded_client):
+    today = date.today()
+    response = seeded_client.get(
+        f"/api/v1/calendars/study-records?from={today.year}-01-01&to={today.year}-12-31"
+    )
+    assert response.status_code == 200, response.text
+
+    records = response.json()["studyRecords"]
+    assert records[0]["date"] == f"{today.year}-01-01"
+    assert records[-1]["date"] == f"{today.year}-12-31"
+    # 시딩된 이번 달 학습 기록이 연간 보기에도 포함
+    assert any(r["hasStudy"] for r in records if r["date"][5:7] == f"{today.month:02d}")
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "from=2025-01-01",
+        "from=2025-03-01&to=2025-02-01",
+        "from=2024-01-01&to=2025-12-31",
+    ],
+)
+def test_calendar_range_validation(seeded_client, query):
+    response = seeded_client.get(f"/api/v1/calendars/study-records?{query}")
+    assert response.status_code == 422
+
+
+def test_quiz_questions_follow_cursor_links(seeded_client):
+    """page 번호로 시작해 next/prev 링크로 이동해도 같은 순서/문제"""
+    by_page = [
+        seeded_client.get(f"/api/v1/quizzes/1/questions?page={page}&limit=4").json()
+        for page in (1, 2, 3)
+    ]
+    expected = [q["questionId"] for body in by_page for q in body["data"]["questions"]]
+    assert len(expected) == 10
+    assert by_page[0]["data"]["pagination"]["prev"] is None
+
+    pages = [by_page[0]["data"]]
+    while pages[-1]["pagination"]["next"]:
+        response = seeded_client.get(pages[-1]["pagination"]["next"])
+        assert response.status_code == 200, response.text
+        pages.append(response.json()["data"])
+
+    assert [q["questionId"] for p in pages for q in p["questions"]] == expected
+    assert [p["pagination"]["currentPage"] for p in pages] == [1, 2, 3]
+    assert pages[-1]["pagination"]["totalQuestions"] == 10
+
+    back = seeded_client.get(pages[-1]["pagination"]["prev"]).json()["data"]
+    assert back["questions"] == pages[1]["questions"]
+    assert back["pagination"]["currentPage"] == 2
+    assert back["pagination"]["nextCursor"]
+
+
+def test_grading_results_cursor_pagination(seeded_client):
+    first = seeded_client.get("/api/v1/answers/1/grade?page_size=4").json()
+    second = seeded_client.get(
+        f"/api/v1/answers/1/grade?page_size=4&cursor={first['nextCursor']}"
+    ).json()
+    by_page = seeded_client.get("/api/v1/answers/1/grade?page=2&page_size=4").json()
+
+    assert second["problems"] == by_page["problems"]
+    assert second["currentPage"] == 2
+    assert second["prev"] and second["next"]
+
+
+def test_invalid_cursor_is_rejected(seeded_client):
+    response = seeded_client.get("/api/v1/quizzes/1/questions?cursor=not-a-cursor")
+    assert response.status_code == 400
@@ -0,0 +1,109 @@
+import asyncio
+import time
+from urllib.parse import parse_qs, urlparse
+
+from fastapi.testclient import TestClient
+
+from app.auth.oauth_state import (
+    OAUTH_STATE_COOKIE,
+    DatabaseOAuthStateStore,
+    InMemoryOAuthStateStore,
+    OAuthStateSigner,
+)
+from app.main import app
+from tests.harness import init_database
+
+
+def test_state_is_bound_to_signed_cookie():
+    signer = OAuthStateSigner("secret", ttl=60)
+    state, cookie = signer.issue()
+    other_state, other_cookie = signer.issue()
+
+    assert signer.verify(state, cookie)
+    assert not signer.verify(other_state, cookie)
+    assert not signer.verify(state, other_cookie)
+    assert not signer.verify(state, None)
+
+
+def test_state_signed_by_another_key_is_rejected():
+    state, cookie = OAuthStateSigner("other", ttl=60).issue()
+
+    assert not OAuthStateSigner("secret", ttl=60).verify(state, cookie)
+    # 만료 시각을 늘려 다시 붙여도 서명이 맞지 않음
+    signed_state, expires_at, signature = cookie.rsplit(".", 2)
+    forged = f"{signed_state}.{int(expires_at) + 3600}.{signature}"
+    assert not OAuthStateSigner("other", ttl=60).verify(state, forged)
+
+
+def test_expired_state_is_rejected():
+    signer = OAuthStateSigner("secret", ttl=60)
+    state, cookie = signer.issue(now=1000)
+
+    assert signer.verify(state, cookie, now=1059)
+    assert not signer.verify(state, cookie, now=1060)
+
+
+def test_callback_on_another_worker_accepts_state():
+    """발급한 워커와 다른 워커(다른 인스턴스)에서도 같은 SECRET_KEY면 검증됨"""
+    state, cookie = OAuthStateSigner("secret", ttl=60).issue()
+
+    assert OAuthStateSigner("secret", ttl=60).verify(state, cookie)
+
+
+def test_google_login_sets_state_cookie_only_on_oauth_path():
+    client = TestClient(app)
+    response = client.get("/oauth/google/login", follow_redirects=False)
+
+    assert response.status_code == 307
+    state = parse_qs(urlparse(response.headers["location"]).query)["state"][0]
+    assert state
+    cookie = response.headers["set-cookie"]
+    assert cookie.startswith(f"{OAUTH_STATE_COOKIE}={state}.")
+    assert "Path=/oauth/google" in cookie
+
+
+def test_google_callback_rejects_state_without_cookie():
+    client = TestClient(app)
+    login = client.get("/oauth/google/login", follow_redirects=False)
+    state = parse_qs(urlparse(login.headers["location"]).query)["state"][0]
+    client.cookies.clear()
+
+    response = client.get(f"/oauth/google/callback?code=x&state={state}")
+
+    assert response.status_code == 400
+
+
+def test_api_requests_do_not_touch_sessions():
+    client = TestClient(app)
+    response = client.post("/api/v1/auth/refresh", json={"refresh_token": "x"})
+
+    assert "set-cookie" not in response.headers
+
+
+def test_state_can_be_consumed_only_once():
+    signer = OAuthStateSigner("secret", ttl=60, store=InMemoryOAuthStateStore())
+    state, cookie = signer.issue()
+
+    async def scenario():
+        return [await signer.consume(state, cookie) for _ in range(2)]
+
+    assert asyncio.run(scenario()) == [True, False]
+
+
+def test_database_store_rejects_replay_on_another_worker(tmp_path):
+    async def scenario():
+        engine = await init_database(str(tmp_path / "ticha.db"))
+        workers = [
+            OAuthStateSigner("secret", ttl=60, store=DatabaseOAuthStateStore())
+            for _ in range(2)
+        ]
+        try:
+            state, cookie = workers[0].issue()
+            first = await workers[0].consume(state, cookie)
+            replay = await workers[1].consume(state, cookie)
+            pruned = await workers[1].store.prune(now=time.time() + 61)
+        finally:
+            await engine.dispose()
+        return first, replay, pruned
+
+    assert asyncio.run(scenario()) == (True, False, 1)
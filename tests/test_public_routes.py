@@ -0,0 +1,108 @@
+import pytest
+from fastapi import APIRouter, FastAPI
+
+from app.core.public_routes import RoutePolicy, public_route
+
+
+def build_policy() -> RoutePolicy:
+    router = APIRouter()
+
+    @router.post("/auth/login")
+    @public_route
+    async def login():
+        return {}
+
+    @router.get("/shares/{share_id}")
+    @public_route
+    async def shared_quiz(share_id: int):
+        return {}
+
+    @router.get("/shares/mine")
+    async def my_shares():
+        return {}
+
+    @router.get("/quizzes/{quiz_id}")
+    async def quiz(quiz_id: int):
+        return {}
+
+    @router.get("/notices")
+    @public_route
+    async def notices():
+        return {}
+
+    @router.post("/notices")
+    async def create_notice():
+        return {}
+
+    @router.get("/files/{file_path:path}")
+    @public_route
+    async def file(file_path: str):
+        return {}
+
+    app = FastAPI()
+    app.include_router(router, prefix="/api/v1")
+
+    policy = RoutePolicy()
+    policy.compile(app, public_prefixes=["/static"])
+    return policy
+
+
+def test_declared_endpoints_are_public():
+    policy = build_policy()
+
+    assert policy.is_public("/api/v1/auth/login", "POST")
+    assert policy.is_public("/api/v1/shares/42", "GET")
+    assert policy.is_public("/docs", "GET")
+    assert policy.is_public("/openapi.json", "GET")
+
+
+def test_undeclared_endpoints_require_auth():
+    policy = build_policy()
+
+    assert not policy.is_public("/api/v1/quizzes/1", "GET")
+    assert not policy.is_public("/api/v1/auth/login/extra", "POST")
+    assert not policy.is_public("/api/v1/shares/42/answers", "GET")
+
+
+def test_literal_private_route_is_not_shadowed_by_public_param_route():
+    policy = build_policy()
+
+    assert policy.is_public("/api/v1/shares/42", "GET")
+    assert not policy.is_public("/api/v1/shares/mine", "GET")
+
+
+def test_public_get_does_not_expose_private_post_on_same_path():
+    policy = build_policy()
+
+    assert policy.is_public("/api/v1/notices", "GET")
+    assert not policy.is_public("/api/v1/notices", "POST")
+    # 같은 경로라도 선언되지 않은 메서드는 인증 필요
+    assert not policy.is_public("/api/v1/shares/42", "DELETE")
+    assert not policy.is_public("/api/v1/auth/login", "GET")
+
+
+def test_path_converter_matches_nested_segments():
+    policy = build_policy()
+
+    assert policy.is_public("/api/v1/files/a", "GET")
+    assert policy.is_public("/api/v1/files/a/b/c.txt", "GET")
+    assert not policy.is_public("/api/v1/files/a/b", "POST")
+
+
+def test_path_converter_must_be_last_segment():
+    app = FastAPI()
+
+    @app.get("/files/{file_path:path}/meta")
+    async def meta(file_path: str):
+        return {}
+
+    with pytest.raises(ValueError):
+        RoutePolicy().compile(app)
+
+
+def test_prefix_matches_whole_subtree_only():
+    policy = build_policy()
+
+    assert policy.is_public("/static", "GET")
+    assert policy.is_public("/static/css/style.css", "GET")
+    assert not policy.is_public("/staticfiles/secret", "GET")
@@ -0,0 +1,103 @@
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import create_engine, select, update
+from sqlalchemy.dialects import sqlite
+
+import app.models  # noqa: F401
+from app.models.answer_sheet import AnswerSheet, AnswerSheetStatus
+from app.models.base import Base
+from app.models.grading_result import GradingResult
+from app.models.problem import Problem
+from app.models.problem_in_quiz import ProblemInQuiz
+from app.models.quiz import Quiz
+from app.models.study_log import StudyLog
+from app.models.user_answer import UserAnswer
+from app.models.user_chapter_stat import UserChapterStat
+from app.services.study_dashboard_service import (
+    month_range,
+    quizzes_between,
+    study_logs_between,
+)
+
+
+@pytest.fixture(scope="module")
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def query_plan(engine, statement) -> str:
+    compiled = statement.compile(
+        dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}").all()
+    return "\n".join(row[-1] for row in rows)
+
+
+HOT_PATHS = {
+    # 답안 저장/채점/별표: (answer_sheet_id, problem_id) 단건 조회/갱신
+    "uq_user_answers_answer_sheet_problem": update(UserAnswer)
+    .where(UserAnswer.answer_sheet_id == 1, UserAnswer.problem_id == 2)
+    .values(is_correct=True),
+    "uq_grading_results_answer_sheet_problem": select(GradingResult).where(
+        GradingResult.answer_sheet_id == 1, GradingResult.problem_id == 2
+    ),
+    # 퀴즈 생성: 단원 + 난이도별 문제 후보
+    "ix_problems_chapter_difficulty": select(Problem.id).where(
+        Problem.chapter_id == 1, Problem.difficulty == "easy"
+    ),
+    # 문제지 페이지 조회
+    "ix_problems_in_quizzes_quiz_number": select(ProblemInQuiz)
+    .where(ProblemInQuiz.quiz_id == 1, ProblemInQuiz.problem_number > 5)
+    .order_by(ProblemInQuiz.problem_number)
+    .limit(5),
+    # 캘린더 학습 기록
+    "uq_study_logs_user_date": select(StudyLog).where(
+        StudyLog.user_id == 1,
+        StudyLog.quiz_date >= date(2025, 3, 1),
+        StudyLog.quiz_date < date(2025, 4, 1),
+    ),
+    # 단원 통계 롤업
+    "uq_user_chapter_stats_user_chapter": select(UserChapterStat).where(
+        UserChapterStat.user_id == 1
+    ),
+    # 진행 중인 답안지
+    "ix_answer_sheets_user_status": select(AnswerSheet).where(
+        AnswerSheet.user_id == 1, AnswerSheet.status == AnswerSheetStatus.IN_PROGRESS
+    ),
+    # 월별 퀴즈 목록
+    "ix_quizzes_user_created_at": select(Quiz).where(
+        Quiz.user_id == 1,
+        Quiz.created_at >= datetime(2025, 3, 1),
+        Quiz.created_at < datetime(2025, 4, 1),
+    ),
+}
+
+
+@pytest.mark.parametrize("index_name", sorted(HOT_PATHS))
+def test_hot_path_uses_composite_index(engine, index_name):
+    plan = query_plan(engine, HOT_PATHS[index_name])
+
+    assert f"INDEX {index_name}" in plan, plan
+    assert "SCAN" not in plan, plan
+
+
+def test_calendar_queries_use_index_range_scans(engine):
+    start, end = month_range(2025, 12)
+    assert (start, end) == (date(2025, 12, 1), date(2026, 1, 1))
+
+    study_logs_plan = query_plan(engine, study_logs_between(1, start, end))
+    quizzes_plan = query_plan(engine, quizzes_between(1, start, end))
+
+    assert (
+        "SEARCH study_logs USING INDEX uq_study_logs_user_date "
+        "(user_id=? AND quiz_date>? AND quiz_date<?)"
+    ) in study_logs_plan, study_logs_plan
+    assert (
+        "USING INDEX ix_quizzes_user_created_at "
+        "(user_id=? AND created_at>? AND created_at<?)"
+    ) in quizzes_plan, quizzes_plan
@@ -0,0 +1,184 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401
+from app.core.database import get_read_db
+from app.core.query_stats import install_query_stats, track_queries
+from app.middleware.auth_middleware import AuthMiddleware
+from app.middleware.query_stats_middleware import QueryStatsMiddleware
+from app.models.answer_sheet import AnswerSheet
+from app.models.base import Base
+from app.models.chapter import Chapter
+from app.models.grading_result import GradingResult
+from app.models.problem import Problem
+from app.models.problem_in_quiz import ProblemInQuiz
+from app.models.quiz import Quiz
+from app.models.user import User
+from app.models.user_answer import UserAnswer
+from app.routers import grade, study_dashboard
+from tests.harness import auth_headers
+
+SHEETS = 5
+PROBLEMS = 6
+
+
+def make_session(url: str) -> sessionmaker:
+    engine = create_async_engine(url)
+    install_query_stats(engine)
+    return sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+
+async def seed(url: str) -> None:
+    """진행 중인 답안지 여러 개와 채점된 답안지 하나를 가진 DB"""
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(insert(User).values(id=1, name="user", email="u@ticha.ai"))
+        await conn.execute(insert(Chapter).values(id=1, name="ch", chapter_order=1))
+        await conn.execute(
+            insert(Problem),
+            [
+                {
+                    "id": pid,
+                    "chapter_id": 1,
+                    "difficulty": "easy",
+                    "correct_answer": "1",
+                    "problem_text": "problem",
+                    "choices_count": 5,
+                }
+                for pid in range(1, PROBLEMS + 1)
+            ],
+        )
+        for sid in range(1, SHEETS + 1):
+            await conn.execute(
+                insert(Quiz).values(
+                    id=sid,
+                    title=f"quiz {sid}",
+                    user_id=1,
+                    difficulty="easy",
+                    total_problems_count=PROBLEMS,
+                    status="in_progress",
+                    chapter_id=1,
+                )
+            )
+            await conn.execute(
+                insert(ProblemInQuiz),
+                [
+                    {"quiz_id": sid, "problem_id": pid, "problem_number": pid}
+                    for pid in range(1, PROBLEMS + 1)
+                ],
+            )
+            await conn.execute(
+                insert(AnswerSheet).values(
+                    id=sid,
+                    quiz_id=sid,
+                    user_id=1,
+                    status="graded" if sid == 1 else "in_progress",
+                    passed_time=75,
+                )
+            )
+            await conn.execute(
+                insert(UserAnswer),
+                [
+                    {
+                        "answer_sheet_id": sid,
+                        "problem_id": pid,
+                        "user_answer": str(pid % 2),
+                        "has_answer": True,
+                        "is_starred": pid == 2,
+                    }
+                    for pid in range(1, sid + 1)
+                ],
+            )
+        await conn.execute(
+            insert(GradingResult),
+            [
+                {
+                    "answer_sheet_id": 1,
+                    "problem_id": pid,
+                    "result": "correct" if pid % 2 else "incorrect",
+                }
+                for pid in range(1, PROBLEMS + 1)
+            ],
+        )
+    await engine.dispose()
+
+
+def build_app(session: sessionmaker) -> FastAPI:
+    api = FastAPI()
+    api.add_middleware(AuthMiddleware)
+    api.add_middleware(QueryStatsMiddleware)
+    api.include_router(grade.router, prefix="/api/v1")
+    api.include_router(study_dashboard.router, prefix="/api/v1")
+
+    async def override_read_db():
+        async with session() as db:
+            yield db
+
+    api.dependency_overrides[get_read_db] = override_read_db
+    return api
+
+
+@pytest.fixture
+def client(tmp_path):
+    url = f"sqlite+aiosqlite:///{tmp_path}/query_stats.db"
+    asyncio.run(seed(url))
+    with TestClient(build_app(make_session(url)), headers=auth_headers(1)) as c:
+        yield c
+
+
+def test_track_queries_counts_statements_in_context():
+    async def scenario():
+        session = make_session("sqlite+aiosqlite:///:memory:")
+        async with session() as db:
+            await db.run_sync(lambda s: Base.metadata.create_all(s.connection()))
+            with track_queries() as stats:
+                await db.execute(Chapter.__table__.select())
+                await db.execute(Problem.__table__.select())
+        return stats
+
+    stats = asyncio.run(scenario())
+    assert stats.count == 2
+    assert stats.duration_ms > 0
+
+
+def test_response_headers_report_query_count(client):
+    response = client.get("/api/v1/answer-sheets/in-progress")
+
+    assert response.status_code == 200
+    assert response.headers["X-DB-Queries"] == "1"
+    assert response.headers["Server-Timing"].startswith("db;dur=")
+    assert 'desc="1 queries"' in response.headers["Server-Timing"]
+
+
+def test_in_progress_answer_sheets_within_query_budget(client, assert_max_queries):
+    with assert_max_queries(1):
+        response = client.get("/api/v1/answer-sheets/in-progress")
+
+    sheets = response.json()["answer_sheets"]
+    assert len(sheets) == SHEETS - 1
+    rates = {s["answer_sheet_id"]: round(s["progress_rate"]) for s in sheets}
+    assert rates == {sid: round(sid / PROBLEMS * 100) for sid in range(2, SHEETS + 1)}
+
+
+def test_grading_results_within_query_budget(client, assert_max_queries):
+    with assert_max_queries(3):
+        response = client.get("/api/v1/answers/1/grade?page=1&page_size=4")
+
+    body = response.json()
+    assert [p["problem_id"] for p in body["problems"]] == [1, 2, 3, 4]
+    assert [p["is_correct"] for p in body["problems"]] == [True, False, True, False]
+    # 다른 답안지의 같은 문제 답안과 섞이지 않음
+    assert [p["user_answer"] for p in body["problems"]] == [1, None, None, None]
+
+
+def test_assert_max_queries_fails_over_budget(client, assert_max_queries):
+    with pytest.raises(pytest.fail.Exception, match="3 queries executed"):
+        with assert_max_queries(2):
+            client.get("/api/v1/answers/1/grade")
@@ -0,0 +1,179 @@
+import asyncio
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401
+from app.core import database
+from app.core.read_replica import PRIMARY_PIN_COOKIE, ReplicaRouter
+from app.middleware.db_session_middleware import DBSessionMiddleware
+from app.models.base import Base
+from app.models.user import User
+
+
+async def make_database(url: str, name: str | None) -> sessionmaker:
+    engine = create_async_engine(url)
+    if name is not None:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(
+                insert(User).values(id=1, name=name, email="user@ticha.ai")
+            )
+    return sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+
+async def stand_ins(tmp_path, replica_url: str | None = None):
+    """primary / replica 역할의 서로 독립된 SQLite 파일 DB"""
+    primary = await make_database(
+        f"sqlite+aiosqlite:///{tmp_path}/primary.db", "primary"
+    )
+    replica = await make_database(
+        replica_url or f"sqlite+aiosqlite:///{tmp_path}/replica.db",
+        None if replica_url else "replica",
+    )
+    return primary, replica
+
+
+async def read_name(factory: sessionmaker) -> str:
+    async with factory() as session:
+        return (await session.execute(select(User.name))).scalar_one()
+
+
+def test_reads_go_to_replica_within_staleness_budget(tmp_path):
+    async def scenario():
+        primary, replica = await stand_ins(tmp_path)
+        router = ReplicaRouter(primary, replica, 5, 5)
+        await router.refresh()
+        return await read_name(router.session_factory())
+
+    assert asyncio.run(scenario()) == "replica"
+
+
+def test_lagging_replica_falls_back_to_primary(tmp_path):
+    async def lagging(session):
+        return 30.0
+
+    async def scenario():
+        primary, replica = await stand_ins(tmp_path)
+        router = ReplicaRouter(primary, replica, 5, 5, lag_probe=lagging)
+        await router.refresh()
+        return await read_name(router.session_factory())
+
+    assert asyncio.run(scenario()) == "primary"
+
+
+def test_unreachable_replica_falls_back_to_primary(tmp_path):
+    async def scenario():
+        primary, replica = await stand_ins(
+            tmp_path, replica_url=f"sqlite+aiosqlite:///{tmp_path}/missing/replica.db"
+        )
+        router = ReplicaRouter(primary, replica, 5, 5)
+        await router.refresh()
+        return await read_name(router.session_factory())
+
+    assert asyncio.run(scenario()) == "primary"
+
+
+def test_pinned_client_reads_from_primary(tmp_path):
+    async def scenario():
+        primary, replica = await stand_ins(tmp_path)
+        router = ReplicaRouter(primary, replica, 4.5, 5)
+        await router.refresh()
+        return (
+            await read_name(router.session_factory(pinned=True)),
+            await read_name(router.session_factory()),
+            router.pin_cookie(),
+        )
+
+    pinned, unpinned, cookie = asyncio.run(scenario())
+
+    assert (pinned, unpinned) == ("primary", "replica")
+    assert cookie.startswith(f"{PRIMARY_PIN_COOKIE}=1;")
+    assert "Max-Age=5" in cookie
+
+
+def test_write_pins_following_reads_to_primary_across_requests(tmp_path, monkeypatch):
+    """쓰기 응답의 쿠키만으로 고정되므로 다른 워커가 읽기를 받아도 유지됨"""
+    api = FastAPI()
+    api.add_middleware(DBSessionMiddleware)
+
+    @api.post("/name")
+    async def rename(db: AsyncSession = Depends(database.get_db)):
+        await db.execute(update(User).values(name="written"))
+        await db.commit()
+
+    @api.get("/name")
+    async def name(db: AsyncSession = Depends(database.get_read_db)):
+        return (await db.execute(select(User.name))).scalar_one()
+
+    async def scenario():
+        primary, replica = await stand_ins(tmp_path)
+        database.async_session.configure(bind=primary.kw["bind"])
+        router = ReplicaRouter(database.async_session, replica, 5, 5)
+        await router.refresh()
+        monkeypatch.setattr(database, "replica_router", router)
+        transport = httpx.ASGITransport(app=api)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            written = await c.post("/name")
+            pinned = (await c.get("/name")).json()
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            other_client = (await c.get("/name")).json()
+        return written.headers.get("set-cookie"), pinned, other_client
+
+    cookie, pinned, other_client = asyncio.run(scenario())
+
+    assert cookie.startswith(f"{PRIMARY_PIN_COOKIE}=")
+    assert pinned == "written"
+    assert other_client == "replica"
+
+
+def test_get_read_db_dependency_uses_router(tmp_path, monkeypatch):
+    api = FastAPI()
+
+    @api.get("/name")
+    async def name(db: AsyncSession = Depends(database.get_read_db)):
+        return (await db.execute(select(User.name))).scalar_one()
+
+    async def scenario():
+        primary, replica = await stand_ins(tmp_path)
+        router = ReplicaRouter(primary, replica, 5, 5)
+        await router.refresh()
+        monkeypatch.setattr(database, "replica_router", router)
+        transport = httpx.ASGITransport(app=api)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            return (await c.get("/name")).json()
+
+    assert asyncio.run(scenario()) == "replica"
+
+
+def test_request_path_reads_cached_probe_result(tmp_path):
+    """지연 조회는 백그라운드에서만 하고 요청 경로는 캐시된 결과만 사용"""
+    probes = []
+    now = [0.0]
+
+    async def counting(session):
+        probes.append(session)
+        return 0.0
+
+    async def scenario():
+        primary, replica = await stand_ins(tmp_path)
+        router = ReplicaRouter(
+            primary, replica, 5, 60, lag_probe=counting, timer=lambda: now[0]
+        )
+        await router.start()
+        try:
+            fresh = [router.session_factory() for _ in range(5)]
+            now[0] = 121.0  # 확인 태스크가 멈춰 결과가 오래됨
+            stale = router.session_factory()
+        finally:
+            await router.stop()
+        return fresh, stale, primary, replica
+
+    fresh, stale, primary, replica = asyncio.run(scenario())
+
+    assert fresh == [replica] * 5
+    assert stale is primary
+    assert len(probes) == 1
@@ -0,0 +1,146 @@
+import asyncio
+
+import pytest
+from fastapi import Depends, FastAPI, Request
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.token_store import DatabaseRefreshTokenBackend, refresh_token_store
+from app.core.database import RequestSession, get_db, get_read_db
+from app.main import app
+from app.middleware.auth_middleware import AuthMiddleware
+from app.middleware.db_session_middleware import DBSessionMiddleware
+from app.middleware.query_stats_middleware import QueryStatsMiddleware
+from app.models.chapter import Chapter
+from tests.harness import auth_headers, init_database, seed
+
+
+@pytest.fixture
+def engine(tmp_path):
+    async def prepare():
+        engine = await init_database(str(tmp_path / "ticha.db"))
+        await seed(users=1, quizzes_per_user=2)
+        await engine.dispose()
+        return engine
+
+    return asyncio.run(prepare())
+
+
+def checkouts(response) -> int:
+    return int(response.headers["X-DB-Checkouts"])
+
+
+def test_request_without_db_does_not_check_out(engine):
+    with TestClient(app) as client:
+        response = client.get("/")
+
+    assert response.status_code == 200
+    assert checkouts(response) == 0
+
+
+def test_multiple_commits_share_one_checkout(engine):
+    with TestClient(app, headers=auth_headers(1)) as client:
+        created = client.post(
+            "/api/v1/quizzes",
+            json={"chapter_id": 1, "question_count": 5, "difficulty": "random"},
+        )
+        in_progress = client.get("/api/v1/answer-sheets/in-progress")
+
+    assert created.status_code == 201, created.text
+    assert checkouts(created) == 1
+    assert in_progress.status_code == 200, in_progress.text
+    assert checkouts(in_progress) == 1
+    assert engine.sync_engine.pool.checkedout() == 0
+
+
+def test_principal_and_dependencies_share_session(engine):
+    """principal 지연 로딩, get_db, get_read_db가 같은 커넥션을 사용"""
+    test_app = FastAPI()
+
+    @test_app.get("/shared")
+    async def shared(
+        request: Request,
+        db: AsyncSession = Depends(get_db),
+        read_db: AsyncSession = Depends(get_read_db),
+    ):
+        user = await request.state.user.load()
+        await read_db.execute(select(Chapter.id))
+        return {
+            "user": user.id,
+            "same": db is read_db,
+            "open": request.state.db_session.is_open,
+        }
+
+    test_app.add_middleware(AuthMiddleware)
+    test_app.add_middleware(DBSessionMiddleware)
+    test_app.add_middleware(QueryStatsMiddleware)
+
+    with TestClient(test_app, headers=auth_headers(1)) as client:
+        response = client.get("/shared")
+
+    assert response.status_code == 200, response.text
+    assert response.json() == {"user": 1, "same": True, "open": True}
+    assert checkouts(response) == 1
+    assert engine.sync_engine.pool.checkedout() == 0
+
+
+def test_session_is_closed_when_route_fails(engine):
+    test_app = FastAPI()
+
+    @test_app.get("/boom")
+    async def boom(db: AsyncSession = Depends(get_db)):
+        await db.execute(select(Chapter.id))
+        raise RuntimeError("boom")
+
+    test_app.add_middleware(DBSessionMiddleware)
+
+    with TestClient(test_app, raise_server_exceptions=False) as client:
+        response = client.get("/boom")
+
+    assert response.status_code == 500
+    assert engine.sync_engine.pool.checkedout() == 0
+
+
+def test_concurrent_get_opens_one_connection(engine):
+    async def scenario():
+        holder = RequestSession()
+        try:
+            first, second = await asyncio.gather(holder.get(), holder.get())
+            assert first is second
+            assert engine.pool.checkedout() == 1
+        finally:
+            await holder.close()
+        assert engine.pool.checkedout() == 0
+
+    asyncio.run(scenario())
+
+
+def test_refresh_rotation_uses_request_session(engine, monkeypatch):
+    """DB 토큰 저장소가 요청 세션을 재사용해 체크아웃이 한 번으로 유지됨"""
+    monkeypatch.setattr(refresh_token_store, "backend", DatabaseRefreshTokenBackend())
+    token = asyncio.run(refresh_token_store.issue(1))
+
+    with TestClient(app) as client:
+        response = client.post("/api/v1/auth/refresh", json={"refresh_token": token})
+
+    assert response.status_code == 200, response.text
+    assert checkouts(response) == 1
+    assert engine.sync_engine.pool.checkedout() == 0
+
+
+def test_principal_without_session_middleware_releases_connection(engine):
+    test_app = FastAPI()
+
+    @test_app.get("/me")
+    async def me(request: Request):
+        user = await request.state.user.load()
+        return {"user": user.id, "attached": hasattr(request.state, "db_session")}
+
+    test_app.add_middleware(AuthMiddleware)
+
+    with TestClient(test_app, headers=auth_headers(1)) as client:
+        response = client.get("/me")
+
+    assert response.json() == {"user": 1, "attached": False}
+    assert engine.sync_engine.pool.checkedout() == 0
@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.auth.token_store import (
+    DatabaseRefreshTokenBackend,
+    InMemoryRefreshTokenBackend,
+    RefreshTokenReuseError,
+    RefreshTokenStore,
+    RevocationIndex,
+    refresh_token_store,
+)
+from app.main import app
+from app.services.jwt_service import create_refresh_token, decode_token
+from tests.harness import init_database, seed
+
+
+def test_rotate_issues_new_pair_in_same_family():
+    store = RefreshTokenStore(InMemoryRefreshTokenBackend())
+    token = asyncio.run(store.issue(7))
+
+    result = asyncio.run(store.rotate(token))
+
+    old, new = decode_token(token), decode_token(result["refresh_token"])
+    assert new["fid"] == old["fid"]
+    assert new["jti"] != old["jti"]
+    assert decode_token(result["access_token"])["user_id"] == 7
+
+
+def test_reused_token_revokes_whole_family():
+    store = RefreshTokenStore(InMemoryRefreshTokenBackend())
+    first = asyncio.run(store.issue(7))
+    second = asyncio.run(store.rotate(first))["refresh_token"]
+
+    with pytest.raises(RefreshTokenReuseError):
+        asyncio.run(store.rotate(first))
+    # 재사용 탐지 이후에는 최신 토큰도 사용 불가
+    with pytest.raises(ValueError):
+        asyncio.run(store.rotate(second))
+
+
+def test_database_backend_shares_families_between_stores(tmp_path):
+    """워커 두 개(스토어 두 개)가 같은 테이블을 쓰면 교체/재사용 탐지가 공유됨"""
+
+    async def scenario():
+        engine = await init_database(str(tmp_path / "ticha.db"))
+        await seed(users=1, quizzes_per_user=1)
+        worker_a = RefreshTokenStore(DatabaseRefreshTokenBackend())
+        worker_b = RefreshTokenStore(DatabaseRefreshTokenBackend())
+        try:
+            first = await worker_a.issue(1)
+            second = (await worker_b.rotate(first))["refresh_token"]
+            with pytest.raises(RefreshTokenReuseError):
+                await worker_a.rotate(first)
+            with pytest.raises(ValueError):
+                await worker_b.rotate(second)
+        finally:
+            await engine.dispose()
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_rotation_of_same_token_succeeds_once(tmp_path):
+    async def scenario():
+        engine = await init_database(str(tmp_path / "ticha.db"))
+        await seed(users=1, quizzes_per_user=1)
+        stores = [RefreshTokenStore(DatabaseRefreshTokenBackend()) for _ in range(2)]
+        try:
+            token = await stores[0].issue(1)
+            results = await asyncio.gather(
+                *(store.rotate(token) for store in stores), return_exceptions=True
+            )
+        finally:
+            await engine.dispose()
+        return results
+
+    results = asyncio.run(scenario())
+    assert sum(isinstance(r, dict) for r in results) == 1
+    assert sum(isinstance(r, RefreshTokenReuseError) for r in results) == 1
+
+
+def test_token_without_family_is_rejected():
+    store = RefreshTokenStore(InMemoryRefreshTokenBackend())
+    with pytest.raises(ValueError):
+        asyncio.run(store.rotate(create_refresh_token({"user_id": 7})))
+
+
+def test_revocation_index_prunes_expired_entries():
+    index = RevocationIndex(size_bits=1024)
+    index.add("expired", expires_at=100)
+    index.add("alive", expires_at=300)
+
+    index.prune(now=200)
+
+    assert "expired" not in index
+    assert "alive" in index
+
+
+def test_refresh_endpoint_rotates_token():
+    client = TestClient(app)
+    token = asyncio.run(refresh_token_store.issue(11))
+
+    response = client.post("/api/v1/auth/refresh", json={"refresh_token": token})
+    assert response.status_code == 200
+    assert "refreshToken" in response.json()
+
+    replay = client.post("/api/v1/auth/refresh", json={"refresh_token": token})
+    assert replay.status_code == 401
@@ -0,0 +1,180 @@
+import asyncio
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401
+from app.core.upsert import bulk_upsert
+from app.models.answer_sheet import AnswerSheet
+from app.models.base import Base
+from app.models.chapter import Chapter
+from app.models.grading_result import GradingResult
+from app.models.problem import Problem
+from app.models.problem_in_quiz import ProblemInQuiz
+from app.models.quiz import Quiz
+from app.models.study_log import StudyLog
+from app.models.user import User
+from app.models.user_answer import UserAnswer
+from app.schemas.grade import AnswerGrade
+from app.services.grade_service import grade_answer_sheet
+
+CORRECT_ANSWERS = {1: "1", 2: "2", 3: "3"}
+
+
+async def make_session() -> sessionmaker:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(insert(User).values(id=1, name="user", email="u@ticha.ai"))
+        await conn.execute(insert(Chapter).values(id=1, name="ch", chapter_order=1))
+        await conn.execute(
+            insert(Problem),
+            [
+                {
+                    "id": pid,
+                    "chapter_id": 1,
+                    "difficulty": "easy",
+                    "correct_answer": answer,
+                    "problem_text": "problem",
+                    "choices_count": 5,
+                }
+                for pid, answer in CORRECT_ANSWERS.items()
+            ],
+        )
+        await conn.execute(
+            insert(Quiz).values(
+                id=1,
+                title="quiz",
+                user_id=1,
+                difficulty="easy",
+                total_problems_count=3,
+                status="in_progress",
+                chapter_id=1,
+            )
+        )
+        await conn.execute(
+            insert(ProblemInQuiz),
+            [
+                {"quiz_id": 1, "problem_id": pid, "problem_number": pid}
+                for pid in CORRECT_ANSWERS
+            ],
+        )
+        await conn.execute(
+            insert(AnswerSheet).values(
+                id=1, quiz_id=1, user_id=1, status="in_progress", passed_time=0
+            )
+        )
+    return sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+
+def answer_row(problem_id: int, user_answer: str | None, is_starred=False) -> dict:
+    return {
+        "answer_sheet_id": 1,
+        "problem_id": problem_id,
+        "user_answer": user_answer,
+        "is_starred": is_starred,
+        "has_answer": user_answer is not None,
+    }
+
+
+def test_bulk_upsert_inserts_then_updates_in_place():
+    async def scenario():
+        session = await make_session()
+        async with session() as db:
+            columns = dict(
+                conflict_columns=("answer_sheet_id", "problem_id"),
+                update_columns=("user_answer", "has_answer"),
+            )
+            await bulk_upsert(
+                db,
+                UserAnswer,
+                [answer_row(1, "1", True), answer_row(2, None)],
+                **columns
+            )
+            await bulk_upsert(
+                db, UserAnswer, [answer_row(2, "4"), answer_row(3, "3")], **columns
+            )
+            await db.commit()
+
+            rows = (
+                await db.execute(select(UserAnswer).order_by(UserAnswer.problem_id))
+            ).scalars()
+            return [(r.problem_id, r.user_answer, r.is_starred) for r in rows]
+
+    # 2번은 기존 행이 갱신되고, 갱신 대상이 아닌 is_starred는 유지
+    assert asyncio.run(scenario()) == [(1, "1", True), (2, "4", False), (3, "3", False)]
+
+
+def test_bulk_upsert_increments_counters():
+    async def scenario():
+        session = await make_session()
+        async with session() as db:
+            row = {"user_id": 1, "quiz_date": date(2025, 3, 1), "quiz_count": 1}
+            for _ in range(3):
+                await bulk_upsert(
+                    db,
+                    StudyLog,
+                    [row],
+                    conflict_columns=("user_id", "quiz_date"),
+                    increment_columns=("quiz_count",),
+                )
+            await db.commit()
+            return (await db.execute(select(StudyLog.quiz_count))).scalars().all()
+
+    assert asyncio.run(scenario()) == [3]
+
+
+def test_bulk_upsert_ignores_empty_rows():
+    async def scenario():
+        session = await make_session()
+        async with session() as db:
+            await bulk_upsert(db, UserAnswer, [], conflict_columns=("id",))
+            return await db.scalar(select(func.count()).select_from(UserAnswer))
+
+    assert asyncio.run(scenario()) == 0
+
+
+def test_grade_answer_sheet_grades_every_answer():
+    async def scenario():
+        session = await make_session()
+        async with session() as db:
+            answers = [
+                AnswerGrade(problem_id=1, selected_option=1),
+                AnswerGrade(problem_id=2, selected_option=5),
+                AnswerGrade(problem_id=3, selected_option=3),
+            ]
+            first = await grade_answer_sheet(1, db, answers, user_id=1)
+            # 재채점은 기존 행을 갱신 (중복 행 없음)
+            answers[1] = AnswerGrade(problem_id=2, selected_option=2)
+            second = await grade_answer_sheet(1, db, answers, user_id=1)
+
+            results = (
+                await db.execute(
+                    select(GradingResult.problem_id, GradingResult.result).order_by(
+                        GradingResult.problem_id
+                    )
+                )
+            ).all()
+            return first, second, results
+
+    first, second, results = asyncio.run(scenario())
+    assert first["correct_count"] == 2
+    assert second["correct_count"] == 3
+    assert results == [(1, "correct"), (2, "correct"), (3, "correct")]
+
+
+def test_grade_answer_sheet_rejects_problem_outside_quiz():
+    async def scenario():
+        session = await make_session()
+        async with session() as db:
+            await grade_answer_sheet(
+                1, db, [AnswerGrade(problem_id=99, selected_option=1)], user_id=1
+            )
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(scenario())
+    assert exc_info.value.status_code == 400